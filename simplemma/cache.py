@@ -0,0 +1,133 @@
+"""Prebuild the on-disk caches of the dictionary factories, e.g. while baking
+a container image, so that no production request pays for building them.
+
+Usage: python -m simplemma.cache warm --factory trie [--langs de en ...]
+
+Each language is built in a worker process through the factory's regular
+loading path: caches already on disk are validated (and rebuilt if corrupt),
+and every file is written through a temp file and a rename, so concurrently
+starting workers never see a half-written cache. Tries are handed to
+`TrieDictionaryFactory.build_disk_cache`, which skips the languages already
+cached. Workers ignore `SIMPLEMMA_PRELOAD`.
+"""
+
+import argparse
+import logging
+import os
+from collections.abc import Callable, Iterable, Sequence
+
+from simplemma.strategies.dictionaries import (
+    DefaultDictionaryFactory,
+    FstDictionaryFactory,
+    MmapDictionaryFactory,
+    PerfectHashDictionaryFactory,
+    StreamDictionaryFactory,
+    TrieDictionaryFactory,
+)
+from simplemma.strategies.dictionaries.dictionary_factory import (
+    SUPPORTED_LANGUAGES,
+    CachingDictionaryFactory,
+    _check_supported,
+    _worker_pool,
+)
+
+logger = logging.getLogger(__name__)
+
+# factory name -> constructor with the disk cache on, given its directory
+FACTORIES: dict[str, Callable[[str | None], CachingDictionaryFactory]] = {
+    "decoded": lambda cache_dir: DefaultDictionaryFactory(
+        use_disk_cache=True, disk_cache_dir=cache_dir
+    ),
+    "fst": lambda cache_dir: FstDictionaryFactory(
+        use_disk_cache=True, disk_cache_dir=cache_dir
+    ),
+    "mmap": lambda cache_dir: MmapDictionaryFactory(disk_cache_dir=cache_dir),
+    "perfect-hash": lambda cache_dir: PerfectHashDictionaryFactory(
+        use_disk_cache=True, disk_cache_dir=cache_dir
+    ),
+    "stream-index": lambda cache_dir: StreamDictionaryFactory(
+        use_disk_cache=True, disk_cache_dir=cache_dir
+    ),
+    "trie": lambda cache_dir: TrieDictionaryFactory(
+        use_disk_cache=True, disk_cache_dir=cache_dir
+    ),
+}
+
+
+def _warm_language(factory: str, lang: str, cache_dir: str | None) -> str:
+    """Process-pool worker: load `lang` once, which writes its cache."""
+    FACTORIES[factory](cache_dir).get_dictionary(lang)
+    return lang
+
+
+def warm(
+    factory: str,
+    langs: Iterable[str] | None = None,
+    processes: int | None = None,
+    cache_dir: str | None = None,
+) -> None:
+    """Build the disk cache of `factory` for `langs` in parallel processes.
+
+    Args:
+        factory (str): One of the `FACTORIES` names.
+        langs (Iterable[str] | None): The language codes to build.
+            Defaults to all supported languages.
+        processes (int | None): Number of worker processes. Defaults to
+            the number of CPUs.
+        cache_dir (str | None): The factory's `disk_cache_dir`. Defaults
+            to the factory's default location.
+
+    Raises:
+        ValueError: If the factory or a language is not supported.
+    """
+    if factory not in FACTORIES:
+        raise ValueError(f"Unknown dictionary factory: {factory}")
+    targets = sorted(SUPPORTED_LANGUAGES) if langs is None else list(langs)
+    targets = list(dict.fromkeys(targets))
+    for lang in targets:
+        _check_supported(lang)
+    if not targets:
+        return
+
+    builder = FACTORIES[factory](cache_dir)
+    if isinstance(builder, TrieDictionaryFactory):
+        # the trie factory has its own parallel builder
+        builder.build_disk_cache(targets, processes)
+        logger.info("trie cache ready for %s", ", ".join(targets))
+        return
+
+    processes = min(len(targets), processes or os.cpu_count() or 1)
+    with _worker_pool(processes) as executor:
+        futures = [
+            executor.submit(_warm_language, factory, lang, cache_dir)
+            for lang in targets
+        ]
+        for future in futures:
+            logger.info("%s cache ready for %s", factory, future.result())
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m simplemma.cache",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    warm_parser = commands.add_parser("warm", help="prebuild dictionary caches")
+    warm_parser.add_argument("--factory", required=True, choices=sorted(FACTORIES))
+    warm_parser.add_argument(
+        "--langs", nargs="+", help="language codes (default: all supported)"
+    )
+    warm_parser.add_argument("--processes", type=int, help="default: CPU count")
+    warm_parser.add_argument("--cache-dir", help="default: the user cache dir")
+    args = parser.parse_args(argv)
+
+    try:
+        warm(args.factory, args.langs, args.processes, args.cache_dir)
+    except ValueError as error:
+        parser.error(str(error))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
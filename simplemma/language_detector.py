@@ -10,12 +10,13 @@ Provides classes for text language detection using lemmatization and token sampl
 from operator import itemgetter
 
 from .strategies import DefaultStrategy, LemmatizationStrategy
+from .strategies.dictionaries.membership_index import MembershipIndex
 from .token_sampler import (
     MostCommonTokenSampler,
     RelaxedMostCommonTokenSampler,
     TokenSampler,
 )
-from .utils import normalize_token, validate_lang_input
+from .utils import CANON_LANGS, canonicalize_token, normalize_token, validate_lang_input
 
 
 def in_target_language(
@@ -112,6 +113,7 @@ class LanguageDetector:
     __slots__ = [
         "_lang",
         "_lemmatization_strategy",
+        "_membership_index",
         "_token_sampler",
     ]
 
@@ -120,6 +122,7 @@ class LanguageDetector:
         lang: str | tuple[str, ...],
         token_sampler: TokenSampler = MostCommonTokenSampler(),
         lemmatization_strategy: LemmatizationStrategy = DefaultStrategy(),
+        membership_index: MembershipIndex | None = None,
     ) -> None:
         """
         Initialize the LanguageDetector.
@@ -130,11 +133,47 @@ class LanguageDetector:
                 Defaults to `MostCommonTokenSampler()`.
             lemmatization_strategy (LemmatizationStrategy, optional): The lemmatization
                 strategy to use. `Defaults to DefaultStrategy()`.
+            membership_index (MembershipIndex | None, optional): Count a token
+                for a language when it or its reverse-cased form is a key of
+                the language's dictionary, as given by one probe of this index
+                for all languages, instead of lemmatizing it once per language.
+                Much faster over many languages, but tokens only the rules or
+                decompositions recognize are not counted. Defaults to `None`.
+
+        Raises:
+            ValueError: If `membership_index` does not cover every language.
         """
 
         self._lang = validate_lang_input(lang)
         self._token_sampler = token_sampler
         self._lemmatization_strategy = lemmatization_strategy
+        if membership_index is not None:
+            for lang_code in self._lang:
+                membership_index.bit(lang_code)
+        self._membership_index = membership_index
+
+    def _membership_masks(self, tokens: list[str]) -> list[int]:
+        """Per token, the index bits of the languages having it (or its
+        reverse-cased form) as a dictionary key."""
+        index = self._membership_index
+        assert index is not None
+        # keys of these languages are stored canonicalized: probe them apart
+        canon_bits = [
+            (lang_code, index.bit(lang_code))
+            for lang_code in self._lang
+            if lang_code in CANON_LANGS
+        ]
+        masks = []
+        for token in tokens:
+            cased = token.lower() if token[:1].isupper() else token.capitalize()
+            mask = index.mask(token) | index.mask(cased)
+            for lang_code, bit in canon_bits:
+                canon = canonicalize_token(token, lang_code)
+                if canon != token:
+                    cased = canon.lower() if canon[:1].isupper() else canon.capitalize()
+                    mask |= (index.mask(canon) | index.mask(cased)) & bit
+            masks.append(mask)
+        return masks
 
     def proportion_in_each_language(
         self,
@@ -170,6 +209,20 @@ class LanguageDetector:
             return {"unk": 1}
 
         results: dict[str, float] = {}
+        if self._membership_index is not None:
+            masks = self._membership_masks(tokens)
+            any_lang = 0
+            for lang_code in self._lang:
+                bit = self._membership_index.bit(lang_code)
+                any_lang |= bit
+                results[lang_code] = (
+                    sum(1 for mask in masks if mask & bit) / total_tokens
+                )
+            results["unk"] = (
+                sum(1 for mask in masks if not mask & any_lang) / total_tokens
+            )
+            return results
+
         found_any = [False] * total_tokens
         for lang_code in self._lang:
             count = 0
@@ -199,6 +252,13 @@ class LanguageDetector:
         if len(tokens) == 0:
             return 0
 
+        if self._membership_index is not None:
+            any_lang = 0
+            for lang_code in self._lang:
+                any_lang |= self._membership_index.bit(lang_code)
+            masks = self._membership_masks([normalize_token(token) for token in tokens])
+            return sum(1 for mask in masks if mask & any_lang) / len(tokens)
+
         # only "recognized by any language" matters, so break on first match
         in_target = 0
         for token in tokens:
@@ -169,27 +169,44 @@ def _legacy_lemmatizer_for(greedy: bool, low_memory: bool) -> Lemmatizer:
     )
 
 
-def is_known(token: str, lang: str | tuple[str, ...], low_memory: bool = False) -> bool:
+def is_known(
+    token: str,
+    lang: str | tuple[str, ...],
+    low_memory: bool = False,
+    lookup_strategy: LemmatizationStrategy | None = None,
+) -> bool:
     """Check if a token is known in the specified language(s).
 
     Args:
         token: The token to check.
         lang: The language or languages to check in.
         low_memory: Use the memory-frugal dictionary backend (default: False).
+        lookup_strategy: The strategy deciding whether the token is known, e.g.
+            a `MembershipLookupStrategy` checking resident per-language filters
+            (default: a `DictionaryLookupStrategy`). Not allowed together with
+            `low_memory=True`.
 
     Returns:
         bool: True if the token is known, False otherwise.
+
+    Raises:
+        ValueError: If both `lookup_strategy` and `low_memory=True` are given.
     """
 
     _control_input_type(token)
     token = normalize_token(token)
     lang = validate_lang_input(lang)
 
-    dictionary_lookup = DictionaryLookupStrategy(
-        LOW_MEMORY_DICTIONARY_FACTORY if low_memory else DEFAULT_DICTIONARY_FACTORY
-    )
+    if lookup_strategy is None:
+        lookup_strategy = DictionaryLookupStrategy(
+            LOW_MEMORY_DICTIONARY_FACTORY if low_memory else DEFAULT_DICTIONARY_FACTORY
+        )
+    elif low_memory:
+        raise ValueError(
+            "low_memory selects the dictionary lookup; pass one or the other, not both"
+        )
     return any(
-        dictionary_lookup.get_lemma(token, lang_code) is not None for lang_code in lang
+        lookup_strategy.get_lemma(token, lang_code) is not None for lang_code in lang
     )
 
 
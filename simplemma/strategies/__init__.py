@@ -9,8 +9,18 @@ from .dictionaries import (
     LOW_MEMORY_DICTIONARY_FACTORY,
     DefaultDictionaryFactory,
     DictionaryFactory,
+    DictionaryStats,
+    EditScriptDictionaryFactory,
+    FstDictionaryFactory,
+    MembershipFilterFactory,
+    MmapDictionaryFactory,
+    NativeStrDictionaryFactory,
+    PerfectHashDictionaryFactory,
+    PrefilteredDictionaryFactory,
+    SortedArrayDictionaryFactory,
     StreamDictionaryFactory,
     TrieDictionaryFactory,
+    get_many,
 )
 from .dictionary_lookup import DictionaryLookupStrategy
 from .fallback.lemmatization_fallback_strategy import LemmatizationFallbackStrategy
@@ -19,6 +29,7 @@ from .fallback.to_lowercase import ToLowercaseFallbackStrategy
 from .greedy_dictionary_lookup import GreedyDictionaryLookupStrategy
 from .hyphen_removal import HyphenRemovalStrategy
 from .lemmatization_strategy import LemmatizationStrategy
+from .membership_lookup import MembershipLookupStrategy
 from .morpheme_decomposition import MorphemeDecompositionStrategy
 from .prefix_decomposition import PrefixDecompositionStrategy
 from .rules import RulesStrategy
@@ -32,6 +43,15 @@ __all__ = [
     "LOW_MEMORY_DICTIONARY_FACTORY",
     "DefaultDictionaryFactory",
     "DictionaryFactory",
+    "DictionaryStats",
+    "EditScriptDictionaryFactory",
+    "FstDictionaryFactory",
+    "MembershipFilterFactory",
+    "MmapDictionaryFactory",
+    "NativeStrDictionaryFactory",
+    "PerfectHashDictionaryFactory",
+    "PrefilteredDictionaryFactory",
+    "SortedArrayDictionaryFactory",
     "StreamDictionaryFactory",
     "TrieDictionaryFactory",
     "DictionaryLookupStrategy",
@@ -41,7 +61,9 @@ __all__ = [
     "GreedyDictionaryLookupStrategy",
     "HyphenRemovalStrategy",
     "LemmatizationStrategy",
+    "MembershipLookupStrategy",
     "MorphemeDecompositionStrategy",
     "PrefixDecompositionStrategy",
     "RulesStrategy",
+    "get_many",
 ]
@@ -127,7 +127,12 @@ class AffixDecompositionStrategy(LemmatizationStrategy):
         """
         # Left-to-right languages only. A single pass at the largest affix
         # length is equivalent to looping over smaller ones (first match wins).
+        # With a prefix walk, only prefixes the dictionary may hold are
+        # looked up.
+        lengths = self._dictionary_lookup.prefix_lengths(token, lang)
         for count in range(1, len(token) - min_complem_len + 1):
+            if lengths is not None and len(token) - count not in lengths:
+                continue
             part1 = token[:-count]
             lempart1 = self._dictionary_lookup.get_lemma(part1, lang)
             if lempart1 is None:
@@ -165,7 +170,11 @@ class AffixDecompositionStrategy(LemmatizationStrategy):
         Returns:
             str | None: The decomposed token if decomposition is successful, None otherwise.
         """
+        # longest first; only tails the suffix index may resolve, if any
+        lengths = self._dictionary_lookup.suffix_lengths(token, lang)
         for count in range(len(token) - min_complem_len, min_complem_len - 1, -1):
+            if lengths is not None and count not in lengths:
+                continue
             suffix = self._dictionary_lookup.get_lemma(
                 token[-count:].capitalize(), lang
             )
@@ -43,6 +43,9 @@ class DefaultStrategy(LemmatizationStrategy):
         greedy: bool = False,
         dictionary_factory: DictionaryFactory | None = None,
         low_memory: bool = False,
+        folded_index: bool = False,
+        suffix_index: bool = False,
+        prefix_walk: bool = False,
     ):
         """
         Initialize the Default Strategy.
@@ -54,6 +57,16 @@ class DefaultStrategy(LemmatizationStrategy):
                 `LOW_MEMORY_DICTIONARY_FACTORY` if `low_memory` is set.
             low_memory (bool): Use the memory-frugal dictionary backend. Not allowed
                 together with `dictionary_factory`. Defaults to `False`.
+            folded_index (bool): Let dictionary lookups rule out all case and
+                apostrophe variants of an unknown token in one check (see
+                `DictionaryLookupStrategy`). Defaults to `False`.
+            suffix_index (bool): Let suffix decomposition find a token's
+                dictionary tails in one trie walk (see
+                `DictionaryLookupStrategy`). Requires `marisa-trie`.
+                Defaults to `False`.
+            prefix_walk (bool): Let affix decomposition list a token's
+                dictionary prefixes in one walk of a backend that supports
+                it (see `DictionaryLookupStrategy`). Defaults to `False`.
 
         Raises:
             ValueError: If both `dictionary_factory` and `low_memory=True` are given.
@@ -70,7 +83,9 @@ class DefaultStrategy(LemmatizationStrategy):
                 "low_memory selects a dictionary_factory automatically; "
                 "pass one or the other, not both"
             )
-        self._dictionary_lookup = DictionaryLookupStrategy(dictionary_factory)
+        self._dictionary_lookup = DictionaryLookupStrategy(
+            dictionary_factory, folded_index, suffix_index, prefix_walk
+        )
         self._hyphen_search = HyphenRemovalStrategy(self._dictionary_lookup)
         self._rules_search = RulesStrategy()
         self._prefix_search = PrefixDecompositionStrategy(
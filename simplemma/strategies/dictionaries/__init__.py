@@ -4,7 +4,18 @@ from .dictionary_factory import (
     DEFAULT_DICTIONARY_FACTORY,
     DefaultDictionaryFactory,
     DictionaryFactory,
+    DictionaryStats,
+    get_many,
 )
+from .edit_script_dictionary_factory import EditScriptDictionaryFactory
+from .fst_dictionary_factory import FstDictionaryFactory
+from .membership_filter import MembershipFilter, MembershipFilterFactory
+from .membership_index import MembershipIndex, load_membership_index
+from .mmap_dictionary_factory import MmapDictionaryFactory
+from .native_str_dictionary_factory import NativeStrDictionaryFactory
+from .perfect_hash_dictionary_factory import PerfectHashDictionaryFactory
+from .prefiltered_dictionary_factory import PrefilteredDictionaryFactory
+from .sorted_array_dictionary_factory import SortedArrayDictionaryFactory
 from .stream_dictionary_factory import StreamDictionaryFactory
 from .trie_dictionary_factory import TrieDictionaryFactory
 
@@ -15,7 +26,20 @@ __all__ = [
     "DEFAULT_DICTIONARY_FACTORY",
     "DefaultDictionaryFactory",
     "DictionaryFactory",
+    "DictionaryStats",
+    "EditScriptDictionaryFactory",
+    "FstDictionaryFactory",
     "LOW_MEMORY_DICTIONARY_FACTORY",
+    "MembershipFilter",
+    "MembershipFilterFactory",
+    "MembershipIndex",
+    "MmapDictionaryFactory",
+    "NativeStrDictionaryFactory",
+    "PerfectHashDictionaryFactory",
+    "PrefilteredDictionaryFactory",
+    "SortedArrayDictionaryFactory",
     "StreamDictionaryFactory",
     "TrieDictionaryFactory",
+    "get_many",
+    "load_membership_index",
 ]
@@ -8,11 +8,25 @@ It loads the dictionaries that are shipped with simplemma and caches them as con
 
 """
 
+import logging
+import marshal
+import os
+import sys
+import tempfile
+import threading
 from abc import abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from functools import lru_cache
 from pathlib import Path
-from typing import Protocol, TypeVar, overload
-from collections.abc import Iterator, Mapping
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple, Protocol, TypeVar, overload
+from collections.abc import Callable, Iterable, Iterator, Mapping
+
+if TYPE_CHECKING:
+    from functools import _lru_cache_wrapper
 
 try:
     import lzma
@@ -25,29 +39,183 @@ except ImportError as error:
         "liblzma development headers present, then rebuild."
     ) from error
 
+from simplemma.__metadata__ import __version__ as SIMPLEMMA_VERSION
+
 from . import frontcode
 
+logger = logging.getLogger(__name__)
+
 _T = TypeVar("_T")
+_B = TypeVar("_B")
 
 DATA_FOLDER = Path(__file__).parent / "data"
+# Shipped dictionaries are `{lang}.plzma`, an lzma-compressed SMFC1 stream, or
+# `{lang}.smfc`, an SMFC2 block container compressed per block with the codec
+# recorded in its header (see `frontcode`).
+STREAM_SUFFIX = ".plzma"
+CONTAINER_SUFFIX = ".smfc"
 # frozenset: O(1) membership checks.
-SUPPORTED_LANGUAGES = frozenset(f.stem for f in DATA_FOLDER.glob("*.plzma"))
+SUPPORTED_LANGUAGES = frozenset(
+    f.stem
+    for suffix in (STREAM_SUFFIX, CONTAINER_SUFFIX)
+    for f in DATA_FOLDER.glob(f"*{suffix}")
+)
 
 
-def _read_decompressed(langcode: str) -> bytes:
-    """Read and lzma-decompress the shipped `data/{langcode}.plzma`."""
-    # single validation point; also excludes path traversal
+def _check_supported(langcode: str) -> None:
+    """Raise ValueError unless `langcode` ships a dictionary."""
+    # single validation point; also excludes path traversal (the code ends up
+    # in data and cache file names)
     if langcode not in SUPPORTED_LANGUAGES:
         raise ValueError(f"Unsupported language: {langcode}")
-    with lzma.open(DATA_FOLDER / f"{langcode}.plzma", "rb") as filehandle:
-        return filehandle.read()
+
+
+def _shipped_path(langcode: str) -> Path:
+    """Path of the shipped dictionary of `langcode`: its block container if
+    one ships, else its stream."""
+    _check_supported(langcode)
+    container = DATA_FOLDER / f"{langcode}{CONTAINER_SUFFIX}"
+    if container.exists():
+        return container
+    return DATA_FOLDER / f"{langcode}{STREAM_SUFFIX}"
+
+
+def _read_shipped(langcode: str) -> bytes:
+    """Raw bytes of the shipped dictionary of `langcode`: an lzma-compressed
+    SMFC1 stream or an SMFC2 block container (see `frontcode`)."""
+    return _shipped_path(langcode).read_bytes()
+
+
+def _ships_block_container(langcode: str) -> bool:
+    """Whether the shipped dictionary of `langcode` is an SMFC2 block
+    container (reads the magic only)."""
+    with _shipped_path(langcode).open("rb") as filehandle:
+        return frontcode.is_block_container(filehandle.read(len(frontcode.MAGIC_V2)))
+
+
+def _read_count(langcode: str) -> int:
+    """Number of entries in the shipped dictionary of `langcode`, read from
+    its header without decompressing the whole stream."""
+    raw = _read_shipped(langcode)
+    if frontcode.is_block_container(raw):
+        return frontcode.read_block_directory(raw).record_count
+    # magic, flags and a count varint fit in the first 16 bytes
+    return frontcode.read_header(lzma.LZMADecompressor().decompress(raw, 16))[1]
+
+
+def _read_decompressed(langcode: str) -> bytes:
+    """The shipped dictionary of `langcode` as decompressed SMFC1 stream
+    bytes, whichever container it ships in."""
+    raw = _read_shipped(langcode)
+    if frontcode.is_block_container(raw):
+        return frontcode.container_to_stream(raw)
+    return lzma.decompress(raw)
 
 
 def _load_dictionary_from_disk(langcode: str) -> dict[bytes, bytes]:
-    """Load the shipped `data/{langcode}.plzma` as a bytes->bytes dict."""
+    """Load the shipped dictionary of `langcode` as a bytes->bytes dict."""
     return frontcode.decode_stream(_read_decompressed(langcode))
 
 
+_DECODED_MAGIC = b"SMDC2"
+
+
+def _dump_decoded(mapping: "MappingStrToByteString") -> bytes:
+    """Serialize a decoded dictionary and its size for
+    `DefaultDictionaryFactory`'s disk cache: `marshal` keeps shared values
+    shared and loads at C speed."""
+    return _DECODED_MAGIC + marshal.dumps((mapping.nbytes(), mapping._dict))
+
+
+def _load_decoded(blob: bytes) -> "MappingStrToByteString":
+    """Inverse of `_dump_decoded`; ValueError on anything else."""
+    if blob[: len(_DECODED_MAGIC)] != _DECODED_MAGIC:
+        raise ValueError("not a decoded dictionary cache")
+    try:
+        nbytes, dictionary = marshal.loads(blob[len(_DECODED_MAGIC) :])
+    except (EOFError, TypeError, ValueError):
+        raise ValueError("not a decoded dictionary cache") from None
+    if not isinstance(nbytes, int) or not isinstance(dictionary, dict):
+        raise ValueError("not a decoded dictionary cache")
+    return MappingStrToByteString(dictionary, nbytes)
+
+
+def _user_cache_dir() -> Path:
+    """Simplemma's per-user cache root: platformdirs' when installed, else the
+    XDG default, so stdlib-only backends don't need the marisa-trie extra."""
+    try:
+        from platformdirs import user_cache_dir
+    except ImportError:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(base) / "simplemma"
+    return Path(user_cache_dir("simplemma"))
+
+
+def _atomic_write(target: Path, write: Callable[[str], object]) -> None:
+    """Have `write` fill a same-directory temp file, given its name, then
+    rename it to `target`, so concurrent readers see either no file or the
+    complete one."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.")
+    os.close(fd)
+    try:
+        write(tmp_name)
+        os.replace(tmp_name, target)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _atomic_write_bytes(target: Path, *chunks: bytes | bytearray | memoryview) -> None:
+    """Write `chunks` in sequence to `target` through `_atomic_write`."""
+
+    def write(name: str) -> None:
+        with open(name, "wb") as filehandle:
+            for chunk in chunks:
+                filehandle.write(chunk)
+
+    _atomic_write(target, write)
+
+
+def _load_or_build_cache(
+    path: Path,
+    load: Callable[[Path], _T],
+    build: Callable[[], _B],
+    dump: Callable[[_B], Iterable[bytes | bytearray | memoryview]] | None,
+    wrap: Callable[[_B], _T],
+    what: str,
+    *,
+    reload: bool = False,
+    save: Callable[[_B], None] | None = None,
+) -> _T:
+    """The `what` cached at `path`, opened with `load`, rebuilt if missing or
+    corrupt (`load` raising ValueError).
+
+    A rebuild is served as `wrap(built)` and its `dump` chunks are written to
+    `path` atomically; a failed write is only logged. Formats with their own
+    writer pass `save` instead of `dump`, which must write `path` through
+    `_atomic_write`. With `reload` the written file is served through `load`
+    instead, e.g. to share its memory map rather than keep a private copy.
+    """
+    if path.exists():
+        try:
+            return load(path)
+        except ValueError:
+            logger.warning("Corrupt %s, regenerating.", what)
+            path.unlink(missing_ok=True)
+
+    built = build()
+    try:
+        if save is not None:
+            save(built)
+        elif dump is not None:
+            _atomic_write_bytes(path, *dump(built))
+    except OSError:
+        logger.warning("Failed to cache %s on disk.", what)
+        return wrap(built)
+    return load(path) if reload else wrap(built)
+
+
 class DictionaryFactory(Protocol):
     """
     This protocol defines the interface for a dictionary factory, which is responsible for loading and providing access to dictionaries for different languages.
@@ -99,6 +267,27 @@ class DecodedStrMapping(Mapping[str, str]):
             raise KeyError(key)
         return value
 
+    def nbytes(self) -> int:
+        """Estimated resident size in bytes. Subclasses count their backing
+        store; this fallback only counts the view object itself."""
+        return sys.getsizeof(self)
+
+    def prefixes_of(self, text: str) -> list[str]:
+        """The keys that are non-empty prefixes of `text`, shortest first.
+        Backends with ordered storage override this with a single walk; the
+        fallback looks each prefix up."""
+        return [
+            text[:end]
+            for end in range(1, len(text) + 1)
+            if self._lookup(text[:end]) is not None
+        ]
+
+    def get_many(self, keys: Iterable[str]) -> list[str | None]:
+        """The values of `keys`, in order, None for each absent one.
+        Backends override this where a batch beats one lookup per key."""
+        lookup = self._lookup
+        return [lookup(key) for key in keys]
+
     @overload
     def get(self, key: str) -> str | None: ...
     @overload
@@ -109,12 +298,20 @@ class DecodedStrMapping(Mapping[str, str]):
 
 
 class MappingStrToByteString(DecodedStrMapping):
-    """Wrapper around a bytes->bytes dict to make it behave like a str dict."""
+    """Wrapper around a bytes->bytes dict to make it behave like a str dict.
+
+    `nbytes` is the dict's estimated resident size when the builder knows it
+    (see `frontcode.decode_stream_sized`); otherwise it is measured once, on
+    the first `nbytes()` call.
+    """
 
-    __slots__ = ("_dict",)
+    __slots__ = ("_dict", "_nbytes")
 
-    def __init__(self, dictionary: dict[bytes, bytes]) -> None:
+    def __init__(
+        self, dictionary: dict[bytes, bytes], nbytes: int | None = None
+    ) -> None:
         self._dict = dictionary
+        self._nbytes = nbytes
 
     def _lookup(self, key: str) -> str | None:
         value = self._dict.get(key.encode())
@@ -124,19 +321,352 @@ class MappingStrToByteString(DecodedStrMapping):
         for key in self._dict:
             yield key.decode()
 
+    def get_many(self, keys: Iterable[str]) -> list[str | None]:
+        get = self._dict.get
+        values = [get(key.encode()) for key in keys]
+        return [None if value is None else value.decode() for value in values]
+
+    def prefixes_of(self, text: str) -> list[str]:
+        # membership only: skips decoding the values
+        dictionary = self._dict
+        return [
+            text[:end]
+            for end in range(1, len(text) + 1)
+            if text[:end].encode() in dictionary
+        ]
+
     def __len__(self) -> int:
         return len(self._dict)
 
+    def nbytes(self) -> int:
+        if self._nbytes is None:
+            # equal values are shared (see `frontcode.decode_stream`): count once
+            values = {id(value): value for value in self._dict.values()}
+            self._nbytes = (
+                sys.getsizeof(self._dict)
+                + sum(map(sys.getsizeof, self._dict))
+                + sum(map(sys.getsizeof, values.values()))
+            )
+        return self._nbytes
+
+
+def get_many(dictionary: Mapping[str, str], keys: Iterable[str]) -> list[str | None]:
+    """Look up a batch of keys in any dictionary a factory returns.
+
+    Args:
+        dictionary (Mapping[str, str]): The dictionary to look the keys up in.
+        keys (Iterable[str]): The keys to look up.
+
+    Returns:
+        list[str | None]: The values of `keys`, in order, None for each absent
+            one. Uses the backend's batched lookup if it has one, else one
+            `get` per key.
+    """
+    if isinstance(dictionary, DecodedStrMapping):
+        return dictionary.get_many(keys)
+    get = dictionary.get
+    return [get(key) for key in keys]
+
+
+def _dictionary_nbytes(dictionary: Mapping[str, str]) -> int:
+    """Estimated resident size of a built dictionary, in bytes."""
+    if isinstance(dictionary, DecodedStrMapping):
+        return dictionary.nbytes()
+    return sys.getsizeof(dictionary)
+
+
+class CacheInfo(NamedTuple):
+    """Counters of a `_BudgetCache`, shaped like `functools.lru_cache`'s."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _BudgetEntry:
+    __slots__ = ("dictionary", "nbytes", "cost", "frequency", "priority")
+
+    def __init__(self, dictionary: Mapping[str, str], nbytes: int, cost: float) -> None:
+        self.dictionary = dictionary
+        self.nbytes = max(nbytes, 1)
+        self.cost = cost
+        self.frequency = 1
+        self.priority = 0.0
+
+
+class _BudgetCache:
+    """Dictionary cache bounded by total estimated bytes instead of count.
+
+    Eviction is GreedyDual-Size-Frequency: an entry's priority is the cache's
+    running "inflation" plus its access frequency times its load cost
+    (measured seconds) per byte, so small, expensive, often used dictionaries
+    stay and large, cheap, cold ones go first. Each eviction raises the
+    inflation to the evicted priority, which ages entries that stop being
+    used. Pinned languages are never evicted (but count toward the budget).
+    """
+
+    __slots__ = (
+        "_load",
+        "_max_bytes",
+        "_pinned",
+        "_entries",
+        "_inflation",
+        "_total_bytes",
+        "_hits",
+        "_misses",
+        "_lock",
+        "on_evict",
+    )
+
+    def __init__(
+        self,
+        load: Callable[[str], Mapping[str, str]],
+        max_bytes: int,
+        pinned: frozenset[str],
+    ) -> None:
+        self._load = load
+        self._max_bytes = max_bytes
+        self._pinned = pinned
+        self._entries: dict[str, _BudgetEntry] = {}
+        self._inflation = 0.0
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        # called with the language of every evicted entry, under the lock
+        self.on_evict: Callable[[str], None] | None = None
+
+    def __call__(self, lang: str) -> Mapping[str, str]:
+        with self._lock:
+            entry = self._entries.get(lang)
+            if entry is not None:
+                self._hits += 1
+                entry.frequency += 1
+                entry.priority = self._priority(entry)
+                return entry.dictionary
+            self._misses += 1
+
+        # build outside the lock: other languages stay servable meanwhile
+        start = perf_counter()
+        dictionary = self._load(lang)
+        cost = perf_counter() - start
+        entry = _BudgetEntry(dictionary, _dictionary_nbytes(dictionary), cost)
+
+        with self._lock:
+            if lang in self._entries:  # a concurrent load won the race
+                return self._entries[lang].dictionary
+            entry.priority = self._priority(entry)
+            self._entries[lang] = entry
+            self._total_bytes += entry.nbytes
+            self._evict()
+        return dictionary
+
+    def _priority(self, entry: _BudgetEntry) -> float:
+        return self._inflation + entry.frequency * entry.cost / entry.nbytes
+
+    def _evict(self) -> None:
+        while self._total_bytes > self._max_bytes:
+            candidates = [lang for lang in self._entries if lang not in self._pinned]
+            if not candidates:
+                return
+            victim = min(candidates, key=lambda lang: self._entries[lang].priority)
+            entry = self._entries.pop(victim)
+            self._inflation = entry.priority
+            self._total_bytes -= entry.nbytes
+            if self.on_evict is not None:
+                self.on_evict(victim)
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._max_bytes, len(self._entries)
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._inflation = 0.0
+            self._total_bytes = 0
+            self._hits = self._misses = 0
+
+
+@dataclass
+class DictionaryStats:
+    """Counters for one language of a `CachingDictionaryFactory`.
+
+    Attributes:
+        loads (int): Times the dictionary was built (cache misses).
+        load_seconds (float): Cumulative time spent building it.
+        evictions (int): Times it was dropped from the cache.
+        hits (int): Lookups that found the token.
+        misses (int): Lookups that did not.
+        nbytes (int): Estimated resident size, 0 if not currently cached.
+    """
+
+    loads: int = 0
+    load_seconds: float = 0.0
+    evictions: int = 0
+    hits: int = 0
+    misses: int = 0
+    nbytes: int = 0
+
+
+class _CountingMapping(DecodedStrMapping):
+    """Pass-through view counting lookup hits and misses into `stats`."""
+
+    __slots__ = ("_dictionary", "_stats")
+
+    def __init__(self, dictionary: Mapping[str, str], stats: DictionaryStats) -> None:
+        self._dictionary = dictionary
+        self._stats = stats
+
+    def _lookup(self, key: str) -> str | None:
+        value = self._dictionary.get(key)
+        # unlocked: counters may drift slightly under concurrent lookups
+        if value is None:
+            self._stats.misses += 1
+        else:
+            self._stats.hits += 1
+        return value
+
+    def get_many(self, keys: Iterable[str]) -> list[str | None]:
+        values = get_many(self._dictionary, keys)
+        misses = values.count(None)
+        self._stats.misses += misses
+        self._stats.hits += len(values) - misses
+        return values
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._dictionary)
+
+    def __len__(self) -> int:
+        return len(self._dictionary)
+
+    def nbytes(self) -> int:
+        return _dictionary_nbytes(self._dictionary)
+
+
+class _StatsRecorder:
+    """Per-language `DictionaryStats` plus the counting view of each cached
+    dictionary. With `max_size`, evictions are inferred by replaying the lru
+    order of `functools.lru_cache`, which does not report them."""
+
+    __slots__ = ("_stats", "_views", "_evicted", "_recency", "_max_size", "_lock")
+
+    def __init__(self, max_size: int | None) -> None:
+        self._stats: dict[str, DictionaryStats] = {}
+        self._views: dict[str, _CountingMapping] = {}
+        # evicted by the cache since their last load (possibly on arrival)
+        self._evicted: set[str] = set()
+        self._recency: OrderedDict[str, None] = OrderedDict()
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    def _entry(self, lang: str) -> DictionaryStats:
+        entry = self._stats.get(lang)
+        if entry is None:
+            entry = self._stats[lang] = DictionaryStats()
+        return entry
+
+    def record_load(self, lang: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._entry(lang)
+            entry.loads += 1
+            entry.load_seconds += seconds
+            self._evicted.discard(lang)
+
+    def record_eviction(self, lang: str) -> None:
+        with self._lock:
+            self._count_eviction(lang)
+            self._evicted.add(lang)
+
+    def _count_eviction(self, lang: str) -> None:
+        self._entry(lang).evictions += 1
+        # drop the view's reference, or the evicted dictionary stays alive
+        self._views.pop(lang, None)
+
+    def view(self, lang: str, dictionary: Mapping[str, str]) -> Mapping[str, str]:
+        with self._lock:
+            if lang in self._evicted:
+                # not cached: count its lookups, but don't keep it alive
+                return _CountingMapping(dictionary, self._entry(lang))
+            view = self._views.get(lang)
+            if view is None or view._dictionary is not dictionary:
+                view = self._views[lang] = _CountingMapping(
+                    dictionary, self._entry(lang)
+                )
+            if self._max_size is not None:
+                self._recency[lang] = None
+                self._recency.move_to_end(lang)
+                while len(self._recency) > self._max_size:
+                    self._count_eviction(self._recency.popitem(last=False)[0])
+            return view
+
+    def snapshot(self) -> dict[str, DictionaryStats]:
+        with self._lock:
+            views = dict(self._views)
+            result = {
+                lang: replace(entry, nbytes=0) for lang, entry in self._stats.items()
+            }
+        # sizes are computed outside the lock: an estimate can take a while
+        for lang, view in views.items():
+            result[lang].nbytes = view.nbytes()
+        return result
+
 
 class CachingDictionaryFactory(DictionaryFactory):
-    """Base wiring an lru cache (size `cache_max_size`) around the subclass's
-    `_get_dictionary_uncached`; caches the built value, not the raw data."""
+    """Base wiring a cache around the subclass's `_get_dictionary_uncached`;
+    caches the built value, not the raw data.
+
+    By default an lru cache of `cache_max_size` languages. Passing
+    `cache_max_bytes` bounds the estimated memory of the cached dictionaries
+    instead (see `_BudgetCache`), and `pinned` languages are never evicted
+    from that budget.
+    """
+
+    __slots__ = ("_get_dictionary", "_stats", "_loading", "_loading_lock")
+
+    def __init__(
+        self,
+        cache_max_size: int = 8,
+        cache_max_bytes: int | None = None,
+        pinned: Iterable[str] = (),
+    ) -> None:
+        """
+        Initialize the cache; subclasses pass these arguments through.
 
-    __slots__ = ("_get_dictionary",)
+        Args:
+            cache_max_size (int): The maximum number of dictionaries to cache.
+                Defaults to `8`.
+            cache_max_bytes (int | None): Bound the cached dictionaries
+                by estimated total bytes instead of by count. Defaults to
+                `None` (count bound).
+            pinned (Iterable[str]): Languages never evicted from the
+                `cache_max_bytes` budget. Defaults to none.
 
-    def __init__(self, cache_max_size: int = 8) -> None:
-        self._get_dictionary = lru_cache(maxsize=cache_max_size)(
-            self._get_dictionary_uncached
+        Raises:
+            ValueError: If `pinned` is given without `cache_max_bytes`, or if
+                `cache_max_bytes` is negative.
+        """
+        pinned = frozenset(pinned)
+        self._stats: _StatsRecorder | None = None
+        # single flight: the one in-progress build per language, kept until
+        # the cache holds its result
+        self._loading: dict[str, Future[Mapping[str, str]]] = {}
+        self._loading_lock = threading.Lock()
+        self._get_dictionary: "_lru_cache_wrapper[Mapping[str, str]] | _BudgetCache"
+        if cache_max_bytes is None and not pinned:
+            self._get_dictionary = lru_cache(maxsize=cache_max_size)(
+                self._load_dictionary
+            )
+            return
+        if cache_max_bytes is None:
+            raise ValueError("pinned languages require cache_max_bytes")
+        if cache_max_bytes < 0:
+            raise ValueError("cache_max_bytes must not be negative")
+        self._get_dictionary = _BudgetCache(
+            self._load_dictionary, cache_max_bytes, pinned
         )
 
     @abstractmethod
@@ -150,7 +680,119 @@ class CachingDictionaryFactory(DictionaryFactory):
         lang: str,
     ) -> Mapping[str, str]:
         """The cached dictionary for `lang` (see the `DictionaryFactory` protocol)."""
-        return self._get_dictionary(lang)
+        dictionary = self._get_dictionary(lang)
+        if lang in self._loading:
+            self._release_build(lang)
+        if self._stats is None:
+            return dictionary
+        return self._stats.view(lang, dictionary)
+
+    def _load_dictionary(self, lang: str) -> Mapping[str, str]:
+        """Build `lang` on a cache miss. Concurrent misses on the same
+        language share one build: the first thread runs it, the others wait
+        for its result (or its exception) instead of building again.
+
+        A successful build stays registered until the cache has stored it
+        (see `_release_build`), so that a miss in between reuses it too."""
+        with self._loading_lock:
+            pending = self._loading.get(lang)
+            if pending is None:
+                building: Future[Mapping[str, str]] = Future()
+                self._loading[lang] = building
+        if pending is not None:
+            return pending.result()
+
+        try:
+            start = perf_counter()
+            dictionary = self._get_dictionary_uncached(lang)
+            if self._stats is not None:
+                self._stats.record_load(lang, perf_counter() - start)
+        except BaseException as error:
+            # failures are not cached: the next miss builds again
+            with self._loading_lock:
+                del self._loading[lang]
+            building.set_exception(error)
+            raise
+        building.set_result(dictionary)
+        return dictionary
+
+    def _release_build(self, lang: str) -> None:
+        """Forget the finished build of `lang`, once a `get_dictionary` call
+        has been through the cache: the cache now holds its result."""
+        with self._loading_lock:
+            pending = self._loading.get(lang)
+            if pending is not None and pending.done():
+                del self._loading[lang]
+
+    def enable_stats(self) -> None:
+        """Start collecting the per-language counters reported by `stats`.
+
+        Off by default: once on, dictionaries are handed out through a thin
+        view that counts lookups. Call it before the first lookups, or the
+        languages already cached miss their load and eviction counts.
+        """
+        if self._stats is not None:
+            return
+        if isinstance(self._get_dictionary, _BudgetCache):
+            self._stats = _StatsRecorder(None)
+            self._get_dictionary.on_evict = self._stats.record_eviction
+        else:
+            self._stats = _StatsRecorder(self._get_dictionary.cache_info().maxsize)
+
+    def stats(self) -> dict[str, DictionaryStats]:
+        """Snapshot of the counters per language seen since `enable_stats`
+        (empty if it was never called), with the current size estimates."""
+        if self._stats is None:
+            return {}
+        return self._stats.snapshot()
+
+    def preload(self, langs: Iterable[str], workers: int | None = None) -> None:
+        """Load the dictionaries for `langs` into the cache ahead of use.
+
+        Languages are built concurrently on a thread pool: lzma decompression
+        releases the GIL, so the decoding of one language overlaps the
+        decompression of the next. Keep `cache_max_size` at least as large
+        as the number of languages, or the first ones are evicted again.
+
+        Args:
+            langs (Iterable[str]): The language codes to load.
+            workers (int | None): Number of threads. Defaults to one per
+                language, capped at the number of CPUs.
+
+        Raises:
+            ValueError: If one of the languages is not supported, once all
+                the others have been loaded.
+        """
+        # duplicates would race to build the same dictionary twice
+        unique = list(dict.fromkeys(langs))
+        if workers is None:
+            workers = min(len(unique), os.cpu_count() or 1)
+        if workers <= 1 or len(unique) <= 1:
+            for lang in unique:
+                self.get_dictionary(lang)
+            return
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="simplemma-preload"
+        ) as executor:
+            futures = [executor.submit(self.get_dictionary, lang) for lang in unique]
+        for future in futures:
+            future.result()
+
+    def preload_in_background(
+        self, langs: Iterable[str], workers: int | None = None
+    ) -> "Future[None]":
+        """Run `preload` in a background thread and return at once.
+
+        The returned future completes (or raises) when `preload` does; asyncio
+        code can `await asyncio.wrap_future(...)` on it. Lookups issued in the
+        meantime simply load their language themselves.
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="simplemma-preload"
+        )
+        future = executor.submit(self.preload, list(langs), workers)
+        executor.shutdown(wait=False)
+        return future
 
 
 class DefaultDictionaryFactory(CachingDictionaryFactory):
@@ -159,14 +801,101 @@ class DefaultDictionaryFactory(CachingDictionaryFactory):
 
     This class is a concrete implementation of the `DictionaryFactory` protocol.
     It provides functionality for loading and caching dictionaries from disk that are included in Simplemma.
+    With `use_disk_cache`, each decoded dictionary is also kept on disk in
+    `marshal` format, which later processes load several times faster than
+    they would decompress and decode the shipped file.
     """
 
-    __slots__ = ()
+    __slots__ = ("_cache_dir", "_use_disk_cache")
+
+    def __init__(
+        self,
+        cache_max_size: int = 8,
+        use_disk_cache: bool = False,
+        disk_cache_dir: str | None = None,
+        cache_max_bytes: int | None = None,
+        pinned: Iterable[str] = (),
+    ) -> None:
+        """Initialize the DefaultDictionaryFactory.
+
+        Args:
+            cache_max_size (int): The maximum number of dictionaries to
+                keep in memory. Defaults to `8`.
+            use_disk_cache (bool): Whether to cache the decoded
+                dictionaries on disk to speed up loading time. Defaults
+                to `False`.
+            disk_cache_dir (str | None): Path where the decoded
+                dictionaries should be stored in. Defaults to a Simplemma-
+                specific subdirectory of the user's cache directory.
+            cache_max_bytes (int | None), pinned (Iterable[str]): See
+                `CachingDictionaryFactory`.
+        """
+        if disk_cache_dir:
+            self._cache_dir = Path(disk_cache_dir)
+        else:
+            self._cache_dir = _user_cache_dir() / "decoded" / SIMPLEMMA_VERSION
+        self._use_disk_cache = use_disk_cache
+        super().__init__(cache_max_size, cache_max_bytes, pinned)
+
+    def _build_dictionary(self, lang: str) -> MappingStrToByteString:
+        """Decode the shipped dictionary for `lang`, sized as it is decoded."""
+        return MappingStrToByteString(
+            *frontcode.decode_stream_sized(_read_decompressed(lang))
+        )
 
     def _get_dictionary_uncached(self, lang: str) -> Mapping[str, str]:
-        return MappingStrToByteString(_load_dictionary_from_disk(lang))
+        if not self._use_disk_cache:
+            return self._build_dictionary(lang)
+        _check_supported(lang)
+
+        # marshal's format may change between Python versions
+        return _load_or_build_cache(
+            self._cache_dir / f"{lang}.{sys.implementation.cache_tag}",
+            lambda path: _load_decoded(path.read_bytes()),
+            lambda: self._build_dictionary(lang),
+            lambda mapping: (_dump_decoded(mapping),),
+            lambda mapping: mapping,
+            f"decoded dictionary for {lang}",
+        )
 
 
 # Process-wide default: the strategy defaults and the legacy helpers all share
 # this one instance, so the shipped dictionaries are cached once, not per site.
 DEFAULT_DICTIONARY_FACTORY = DefaultDictionaryFactory()
+
+
+def _preload_from_environment(factory: CachingDictionaryFactory) -> None:
+    """Warm `factory` in the background with the comma-separated languages in
+    the `SIMPLEMMA_PRELOAD` environment variable, if set."""
+    langs = [
+        lang.strip()
+        for lang in os.environ.get("SIMPLEMMA_PRELOAD", "").split(",")
+        if lang.strip()
+    ]
+    unsupported = [lang for lang in langs if lang not in SUPPORTED_LANGUAGES]
+    if unsupported:
+        logger.warning("SIMPLEMMA_PRELOAD: ignoring unsupported %s", unsupported)
+    langs = [lang for lang in langs if lang in SUPPORTED_LANGUAGES]
+    if langs:
+        factory.preload_in_background(langs)
+
+
+@contextmanager
+def _worker_pool(processes: int) -> Iterator[ProcessPoolExecutor]:
+    """Process pool for cache builds whose workers skip `SIMPLEMMA_PRELOAD`.
+
+    Workers re-import simplemma, which would otherwise warm a default
+    factory in each of them on top of the build they run. The variable is
+    unset while the pool is up, so that the workers inherit an environment
+    without it, then restored.
+    """
+    preload = os.environ.pop("SIMPLEMMA_PRELOAD", None)
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            yield executor
+    finally:
+        if preload is not None:
+            os.environ["SIMPLEMMA_PRELOAD"] = preload
+
+
+_preload_from_environment(DEFAULT_DICTIONARY_FACTORY)
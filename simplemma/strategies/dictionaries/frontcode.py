@@ -7,14 +7,36 @@ the runtime path; `encode` runs at build time (training/dictionary_builder.py).
 
 `read_header`/`iter_records` expose the format at record granularity for
 partial/resumable reads.
+
+A second container version, SMFC2 (`encode_blocks`), groups the records into
+fixed-size blocks, each compressed independently (lzma or zlib) behind an
+uncompressed block directory, so a reader can decompress only the blocks it
+touches, or all of them in parallel. Each block is a run of SMFC1 records
+restarting from an empty seed, hence `container_to_stream` can splice the
+blocks back into a plain SMFC1 stream.
 """
 
 import lzma
+import sys
+import zlib
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
 
 MAGIC = b"SMFC1"
+MAGIC_V2 = b"SMFC2"
 _REVERSE_FLAG = 0x01
 
+CODEC_LZMA = 0
+CODEC_ZLIB = 1
+_CODECS = {"lzma": CODEC_LZMA, "zlib": CODEC_ZLIB}
+# Raw LZMA2 (no per-block xz framing); a 1 MiB window exceeds any block while
+# bounding the decoder's allocation, unlike preset 9's 64 MiB.
+_LZMA_BLOCK_FILTERS = [
+    {"id": lzma.FILTER_LZMA2, "preset": 9 | lzma.PRESET_EXTREME, "dict_size": 1 << 20}
+]
+DEFAULT_BLOCK_RECORDS = 1024
+
 # Trim-byte sentinels (a real trim is small, so 254/255 are free).
 _SAME_AS_PREV = 254
 _LITERAL_VALUE = 255
@@ -54,31 +76,32 @@ def _common_prefix_len(a: bytes, b: bytes) -> int:
     return i
 
 
+def edit_script(key: bytes, value: bytes) -> tuple[int, bytes]:
+    """(trim, suffix) turning `key` into `value`: drop the last `trim` bytes,
+    then append `suffix`. The edit each record's value is stored as."""
+    prefix_len = _common_prefix_len(key, value)
+    return len(key) - prefix_len, value[prefix_len:]
+
+
 def is_frontcoded(data: bytes) -> bool:
     """True if the (decompressed) `data` starts with the format magic."""
     return data[: len(MAGIC)] == MAGIC
 
 
-def encode(mapping: dict[bytes, bytes], reverse_key: bool = False) -> bytes:
-    """Encode a bytes->bytes dict into a front-coded, lzma-compressed blob.
-
-    reverse_key front-codes reversed bytes, for prefixing morphology (e.g.
-    Swahili, where forms share a suffix not a prefix).
-    """
-    items = sorted(
-        mapping.items(), key=lambda kv: kv[0][::-1] if reverse_key else kv[0]
-    )
+def _stored_items(
+    mapping: dict[bytes, bytes], reverse_key: bool
+) -> list[tuple[bytes, bytes]]:
+    """(stored_key, stored_value) pairs in on-disk order."""
+    if reverse_key:
+        return sorted((key[::-1], value[::-1]) for key, value in mapping.items())
+    return sorted(mapping.items())
 
-    stream = bytearray(MAGIC)
-    stream.append(_REVERSE_FLAG if reverse_key else 0)
-    _write_varint(stream, len(items))
 
+def _encode_records(stream: bytearray, items: list[tuple[bytes, bytes]]) -> None:
+    """Append the records for sorted stored `items`, starting from an empty seed."""
     prev_key = b""
     prev_value: bytes | None = None
-    for key, value in items:
-        stored_key = key[::-1] if reverse_key else key
-        stored_value = value[::-1] if reverse_key else value
-
+    for stored_key, stored_value in items:
         shared = _common_prefix_len(prev_key, stored_key)
         suffix = stored_key[shared:]
         _write_varint(stream, shared)
@@ -104,9 +127,71 @@ def encode(mapping: dict[bytes, bytes], reverse_key: bool = False) -> bytes:
         prev_key = stored_key
         prev_value = stored_value
 
+
+def encode(mapping: dict[bytes, bytes], reverse_key: bool = False) -> bytes:
+    """Encode a bytes->bytes dict into a front-coded, lzma-compressed blob.
+
+    reverse_key front-codes reversed bytes, for prefixing morphology (e.g.
+    Swahili, where forms share a suffix not a prefix).
+    """
+    items = _stored_items(mapping, reverse_key)
+
+    stream = bytearray(MAGIC)
+    stream.append(_REVERSE_FLAG if reverse_key else 0)
+    _write_varint(stream, len(items))
+    _encode_records(stream, items)
+
     return lzma.compress(bytes(stream), preset=9 | lzma.PRESET_EXTREME)
 
 
+def encode_blocks(
+    mapping: dict[bytes, bytes],
+    reverse_key: bool = False,
+    codec: str = "lzma",
+    block_records: int = DEFAULT_BLOCK_RECORDS,
+) -> bytes:
+    """Encode a bytes->bytes dict into an SMFC2 block container.
+
+    Layout: magic, reverse flag, codec byte, varint record count, varint block
+    count, then one directory entry per block (first stored key, record count,
+    compressed length) and finally the compressed blocks back to back. The
+    container itself is not compressed; `codec` ("lzma" or "zlib") applies per
+    block. Smaller blocks mean cheaper random access but a worse ratio.
+    """
+    if codec not in _CODECS:
+        raise ValueError(f"Unknown block codec: {codec}")
+    if block_records < 1:
+        raise ValueError("block_records must be positive")
+    items = _stored_items(mapping, reverse_key)
+
+    directory = bytearray(MAGIC_V2)
+    directory.append(_REVERSE_FLAG if reverse_key else 0)
+    directory.append(_CODECS[codec])
+    _write_varint(directory, len(items))
+    nblocks = -(-len(items) // block_records)
+    _write_varint(directory, nblocks)
+
+    payload = bytearray()
+    for start in range(0, len(items), block_records):
+        chunk = items[start : start + block_records]
+        block = bytearray()
+        _encode_records(block, chunk)
+        compressed = _compress_block(bytes(block), _CODECS[codec])
+        _write_varint(directory, len(chunk[0][0]))
+        directory += chunk[0][0]
+        _write_varint(directory, len(chunk))
+        _write_varint(directory, len(compressed))
+        payload += compressed
+
+    return bytes(directory + payload)
+
+
+def _compress_block(block: bytes, codec: int) -> bytes:
+    if codec == CODEC_ZLIB:
+        return zlib.compress(block, 9)
+    return lzma.compress(block, format=lzma.FORMAT_RAW, filters=_LZMA_BLOCK_FILTERS)
+
+
 def read_header(data: bytes) -> tuple[bool, int, int]:
     """Parse the magic/flag/count header. Returns (reverse_key, count, pos)
     where pos is the byte offset of the first record."""
@@ -181,23 +266,130 @@ def decode_stream(data: bytes) -> dict[bytes, bytes]:
     """Decode already-decompressed front-coded bytes.
 
     Assumes a well-formed `encode` stream; truncation or trailing garbage
-    raises ValueError."""
+    raises ValueError. Equal values share one `bytes` object: many forms map
+    to the same lemma, so this saves most of the value objects."""
+    return decode_stream_sized(data)[0]
+
+
+def decode_stream_sized(data: bytes) -> tuple[dict[bytes, bytes], int]:
+    """`decode_stream`, plus the estimated resident size in bytes of the
+    result, each shared value counted once."""
     reverse_key, count, pos = read_header(data)
 
     result: dict[bytes, bytes] = {}
+    values: dict[bytes, bytes] = {}
     n = 0
     for _, stored_key, stored_value in iter_records(data, pos):
         key = stored_key[::-1] if reverse_key else stored_key
         value = stored_value[::-1] if reverse_key else stored_value
-        result[key] = value
+        result[key] = values.setdefault(value, value)
         n += 1
 
     # a truncated stream ending on a boundary yields too few records
     if n != count:
         raise ValueError(_CORRUPT_STREAM_MSG)
-    return result
+    nbytes = (
+        sys.getsizeof(result)
+        + sum(map(sys.getsizeof, result))
+        + sum(map(sys.getsizeof, values))
+    )
+    return result, nbytes
+
+
+def is_block_container(data: bytes) -> bool:
+    """True if `data` is an (uncompressed) SMFC2 block container."""
+    return data[: len(MAGIC_V2)] == MAGIC_V2
+
+
+class BlockDirectory(NamedTuple):
+    """Parsed SMFC2 directory: `firsts[i]` is block i's first stored key,
+    `counts[i]` its record count, `data[spans[i][0]:spans[i][1]]` its
+    compressed bytes."""
+
+    reverse_key: bool
+    codec: int
+    record_count: int
+    firsts: list[bytes]
+    counts: list[int]
+    spans: list[tuple[int, int]]
+
+
+def read_block_directory(data: bytes) -> BlockDirectory:
+    """Parse the SMFC2 header and block directory (no block is decompressed)."""
+    if not is_block_container(data):
+        raise ValueError("not a front-coded block container")
+    try:
+        pos = len(MAGIC_V2)
+        reverse_key = bool(data[pos] & _REVERSE_FLAG)
+        codec = data[pos + 1]
+        pos += 2
+        count, pos = _read_varint(data, pos)
+        nblocks, pos = _read_varint(data, pos)
+        firsts: list[bytes] = []
+        counts: list[int] = []
+        lengths: list[int] = []
+        for _ in range(nblocks):
+            key_len, pos = _read_varint(data, pos)
+            firsts.append(data[pos : pos + key_len])
+            pos += key_len
+            block_count, pos = _read_varint(data, pos)
+            counts.append(block_count)
+            length, pos = _read_varint(data, pos)
+            lengths.append(length)
+    except IndexError:
+        raise ValueError(_CORRUPT_STREAM_MSG) from None
+    if codec not in _CODECS.values():
+        raise ValueError(f"Unknown block codec: {codec}")
+
+    spans: list[tuple[int, int]] = []
+    for length in lengths:
+        spans.append((pos, pos + length))
+        pos += length
+    # a record count or payload size that disagrees with the directory
+    if pos != len(data) or sum(counts) != count:
+        raise ValueError(_CORRUPT_STREAM_MSG)
+    return BlockDirectory(reverse_key, codec, count, firsts, counts, spans)
+
+
+def decompress_block(data: bytes, directory: BlockDirectory, block: int) -> bytes:
+    """The raw SMFC1 records of one block (decode them with `iter_records`
+    from position 0 and an empty seed)."""
+    start, end = directory.spans[block]
+    try:
+        if directory.codec == CODEC_ZLIB:
+            return zlib.decompress(data[start:end])
+        return lzma.decompress(
+            data[start:end], format=lzma.FORMAT_RAW, filters=_LZMA_BLOCK_FILTERS
+        )
+    except (lzma.LZMAError, zlib.error):
+        raise ValueError(_CORRUPT_STREAM_MSG) from None
+
+
+def container_to_stream(data: bytes, workers: int | None = None) -> bytes:
+    """Splice an SMFC2 container back into decompressed SMFC1 stream bytes.
+
+    Blocks decompress independently, on `workers` threads if given (both
+    codecs release the GIL)."""
+    directory = read_block_directory(data)
+    stream = bytearray(MAGIC)
+    stream.append(_REVERSE_FLAG if directory.reverse_key else 0)
+    _write_varint(stream, directory.record_count)
+    blocks = range(len(directory.spans))
+    if workers is not None and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            parts = list(
+                executor.map(lambda i: decompress_block(data, directory, i), blocks)
+            )
+    else:
+        parts = [decompress_block(data, directory, i) for i in blocks]
+    for part in parts:
+        stream += part
+    return bytes(stream)
 
 
 def decode(blob: bytes) -> dict[bytes, bytes]:
-    """Decompress and decode a full blob (inverse of `encode`)."""
+    """Decompress and decode a full blob (inverse of `encode` and
+    `encode_blocks`)."""
+    if is_block_container(blob):
+        return decode_stream(container_to_stream(blob))
     return decode_stream(lzma.decompress(blob))
@@ -0,0 +1,387 @@
+"""`DictionaryFactory` backed by a minimal finite-state transducer (FST).
+
+The front-coded stream only shares key prefixes; inflectional paradigms also
+share their endings, which a minimal acyclic automaton merges too, much as
+Lucene's and the `fst` crate's FSTs do. Each value is stored as an edit
+script against its key (drop the last `trim` bytes, append `suffix`, as the
+front-coder already does), and a language only uses a few thousand distinct
+scripts: the transducer maps each key to the id of its script, spread as
+additive outputs along the arcs. Outputs are pushed toward the root while
+building, so that words ending alike with the same script also share their
+final states and arcs.
+
+The whole transducer lives in one flat buffer, all little-endian: a header
+(magic, root offset, key count, script count), the script table, then the
+nodes, each after all of its targets. A node starts with a flags byte
+(final bit, byte widths of its outputs and of its targets) and its arc
+count, followed by its final output if final, its arc labels (one UTF-8
+byte each, ascending), the arc outputs, and the arc targets stored as
+distances back from the node. Per-node widths keep most outputs at zero or
+one byte and most targets at one or two. Building is pure Python and takes
+a few seconds for English but minutes for the largest languages (about 3.5
+for Swahili), so the result is cached on disk like the perfect hashes.
+"""
+
+import struct
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+
+from simplemma.__metadata__ import __version__ as SIMPLEMMA_VERSION
+
+from . import frontcode
+from .dictionary_factory import (
+    CachingDictionaryFactory,
+    DecodedStrMapping,
+    _check_supported,
+    _load_or_build_cache,
+    _read_decompressed,
+    _user_cache_dir,
+)
+
+
+MAGIC = b"SMFST001"
+_HEADER = struct.Struct("<8sIII")  # magic, root offset, key count, script count
+_FINAL = 0x01
+# flags bits 1-3: output width; bits 4-6: target width
+_OUTPUT_WIDTH_SHIFT = 1
+_TARGET_WIDTH_SHIFT = 4
+_WIDTH_MASK = 0x07
+
+# a frozen node: (final, final output, ((label, output, target id), ...))
+_Frozen = tuple[bool, int, tuple[tuple[int, int, int], ...]]
+
+
+class _Arc:
+    """An arc of an unfinished node; its target is the id of a frozen node,
+    or None while it leads to the next unfinished one."""
+
+    __slots__ = ("label", "output", "target")
+
+    def __init__(self, label: int, output: int, target: int | None = None) -> None:
+        self.label = label
+        self.output = output
+        self.target = target
+
+
+class _UnfinishedNode:
+    """A node on the path of the last added key, still open to new arcs.
+    Its last arc's target is the next unfinished node (None until frozen)."""
+
+    __slots__ = ("arcs", "final", "final_output")
+
+    def __init__(self) -> None:
+        self.arcs: list[_Arc] = []
+        self.final = False
+        self.final_output = 0
+
+    def prepend_output(self, output: int) -> None:
+        for arc in self.arcs:
+            arc.output += output
+        if self.final:
+            self.final_output += output
+
+
+class _Builder:
+    """Incremental construction of a minimal transducer from sorted keys:
+    whenever the path of the previous key diverges from the new one, its
+    tail is frozen, and each frozen node replaced by an equal one already
+    registered, if any."""
+
+    __slots__ = ("_registry", "nodes", "_stack", "_prev_key")
+
+    def __init__(self) -> None:
+        self._registry: dict[_Frozen, int] = {}
+        self.nodes: list[_Frozen] = []
+        self._stack = [_UnfinishedNode()]
+        self._prev_key: bytes | None = None
+
+    def _register(self, node: _UnfinishedNode) -> int:
+        arcs = []
+        for arc in node.arcs:
+            assert arc.target is not None  # children are frozen first
+            arcs.append((arc.label, arc.output, arc.target))
+        frozen: _Frozen = (node.final, node.final_output, tuple(arcs))
+        node_id = self._registry.get(frozen)
+        if node_id is None:
+            node_id = self._registry[frozen] = len(self.nodes)
+            self.nodes.append(frozen)
+        return node_id
+
+    def _freeze_from(self, depth: int) -> None:
+        stack = self._stack
+        while len(stack) > depth + 1:
+            node_id = self._register(stack.pop())
+            stack[-1].arcs[-1].target = node_id
+
+    def add(self, key: bytes, output: int) -> None:
+        prev_key = self._prev_key
+        if prev_key is not None and key <= prev_key:
+            raise ValueError("keys must be added in strictly ascending order")
+        shared = 0 if prev_key is None else frontcode._common_prefix_len(prev_key, key)
+        self._freeze_from(shared)
+
+        stack = self._stack
+        # keep on the shared arcs only what the new key has in common with
+        # their current output, pushing the rest down one node
+        for depth in range(shared):
+            arc = stack[depth].arcs[-1]
+            common = min(arc.output, output)
+            extra = arc.output - common
+            arc.output = common
+            output -= common
+            if extra:
+                stack[depth + 1].prepend_output(extra)
+
+        for label in key[shared:]:
+            stack[-1].arcs.append(_Arc(label, output))
+            output = 0
+            stack.append(_UnfinishedNode())
+        stack[-1].final = True
+        stack[-1].final_output = output
+        self._prev_key = key
+
+    def finish(self) -> int:
+        """Freeze the remaining path and return the root's node id."""
+        self._freeze_from(0)
+        return self._register(self._stack[0])
+
+
+def _width(*values: int) -> int:
+    """Bytes needed to store the largest of `values`."""
+    return (max(values).bit_length() + 7) // 8
+
+
+def build_fst(data: bytes) -> bytes:
+    """Compile decompressed front-coded `data` into the serialized transducer
+    (see the module docstring)."""
+    reverse_key, count, pos = frontcode.read_header(data)
+    items = [
+        (stored_key[::-1], stored_value[::-1])
+        if reverse_key
+        else (stored_key, stored_value)
+        for _, stored_key, stored_value in frontcode.iter_records(data, pos)
+    ]
+    if len(items) != count:
+        raise ValueError(frontcode._CORRUPT_STREAM_MSG)
+    if reverse_key:
+        items.sort()
+
+    scripts: dict[tuple[int, bytes], int] = {}
+    builder = _Builder()
+    for key, value in items:
+        script = frontcode.edit_script(key, value)
+        script_id = scripts.setdefault(script, len(scripts))
+        builder.add(key, script_id)
+    root = builder.finish()
+    del items
+
+    table = bytearray()
+    for trim, suffix in scripts:
+        frontcode._write_varint(table, trim)
+        frontcode._write_varint(table, len(suffix))
+        table += suffix
+
+    buf = bytearray(_HEADER.pack(MAGIC, 0, count, len(scripts)))
+    buf += table
+    # nodes are laid out in id order: every target precedes its source
+    offsets = []
+    for final, final_output, arcs in builder.nodes:
+        offset = len(buf)
+        offsets.append(offset)
+        outputs = [output for _, output, _ in arcs]
+        distances = [offset - offsets[target] for _, _, target in arcs]
+        output_width = _width(max(outputs, default=0), final_output)
+        target_width = _width(max(distances, default=0))
+        buf.append(
+            (_FINAL if final else 0)
+            | output_width << _OUTPUT_WIDTH_SHIFT
+            | target_width << _TARGET_WIDTH_SHIFT
+        )
+        buf.append(len(arcs))
+        if final:
+            buf += final_output.to_bytes(output_width, "little")
+        buf += bytes(label for label, _, _ in arcs)
+        for output in outputs:
+            buf += output.to_bytes(output_width, "little")
+        for distance in distances:
+            buf += distance.to_bytes(target_width, "little")
+    _HEADER.pack_into(buf, 0, MAGIC, offsets[root], count, len(scripts))
+    return bytes(buf)
+
+
+def _node_end(buf: bytes, node: int) -> int:
+    """Offset just past the node at `node`."""
+    flags, narcs = buf[node], buf[node + 1]
+    output_width = flags >> _OUTPUT_WIDTH_SHIFT & _WIDTH_MASK
+    target_width = flags >> _TARGET_WIDTH_SHIFT & _WIDTH_MASK
+    final_width = output_width if flags & _FINAL else 0
+    return node + 2 + final_width + narcs * (1 + output_width + target_width)
+
+
+class FstMap(DecodedStrMapping):
+    """Read-only str->str view over a serialized transducer (see the module
+    docstring)."""
+
+    __slots__ = ("_buf", "_root", "_count", "_scripts")
+
+    def __init__(self, buf: bytes) -> None:
+        if len(buf) < _HEADER.size:
+            raise ValueError("not a dictionary transducer")
+        magic, root, count, nscripts = _HEADER.unpack_from(buf)
+        if magic != MAGIC or not _HEADER.size <= root < len(buf) - 1:
+            raise ValueError("not a dictionary transducer")
+        scripts: list[tuple[int, bytes]] = []
+        pos = _HEADER.size
+        try:
+            for _ in range(nscripts):
+                trim, pos = frontcode._read_varint(buf, pos)
+                length, pos = frontcode._read_varint(buf, pos)
+                scripts.append((trim, buf[pos : pos + length]))
+                pos += length
+        except IndexError:
+            raise ValueError("not a dictionary transducer") from None
+        # the root is the last node written
+        if pos > root or _node_end(buf, root) != len(buf):
+            raise ValueError("not a dictionary transducer")
+        self._buf = buf
+        self._root: int = root
+        self._count: int = count
+        self._scripts = scripts
+
+    def _walk(self, labels: bytes, node: int, output: int) -> tuple[int, int] | None:
+        """(node, accumulated output) reached from `node` along `labels`, or
+        None if the transducer has no such path."""
+        buf = self._buf
+        for label in labels:
+            flags, narcs = buf[node], buf[node + 1]
+            output_width = flags >> _OUTPUT_WIDTH_SHIFT & _WIDTH_MASK
+            start = node + 2 + (output_width if flags & _FINAL else 0)
+            index = buf.find(label, start, start + narcs) - start
+            if index < 0:
+                return None
+            if output_width:
+                pos = start + narcs + index * output_width
+                output += int.from_bytes(buf[pos : pos + output_width], "little")
+            target_width = flags >> _TARGET_WIDTH_SHIFT & _WIDTH_MASK
+            pos = start + narcs * (1 + output_width) + index * target_width
+            node -= int.from_bytes(buf[pos : pos + target_width], "little")
+        return node, output
+
+    def _final_output(self, node: int) -> int | None:
+        """The final output of `node`, or None if it is not final."""
+        buf = self._buf
+        flags = buf[node]
+        if not flags & _FINAL:
+            return None
+        output_width = flags >> _OUTPUT_WIDTH_SHIFT & _WIDTH_MASK
+        return int.from_bytes(buf[node + 2 : node + 2 + output_width], "little")
+
+    def _lookup(self, key: str) -> str | None:
+        target = key.encode()
+        reached = self._walk(target, self._root, 0)
+        if reached is None:
+            return None
+        node, output = reached
+        final_output = self._final_output(node)
+        if final_output is None:
+            return None
+        trim, suffix = self._scripts[output + final_output]
+        return (target[: len(target) - trim] + suffix).decode()
+
+    def _iter_keys(self, node: int, prefix: bytes) -> Iterator[bytes]:
+        buf = self._buf
+        flags, narcs = buf[node], buf[node + 1]
+        if flags & _FINAL:
+            yield prefix
+        output_width = flags >> _OUTPUT_WIDTH_SHIFT & _WIDTH_MASK
+        target_width = flags >> _TARGET_WIDTH_SHIFT & _WIDTH_MASK
+        start = node + 2 + (output_width if flags & _FINAL else 0)
+        targets = start + narcs * (1 + output_width)
+        for index in range(narcs):
+            pos = targets + index * target_width
+            target = node - int.from_bytes(buf[pos : pos + target_width], "little")
+            yield from self._iter_keys(
+                target, prefix + buf[start + index : start + index + 1]
+            )
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._iter_keys(self._root, b""):
+            yield key.decode()
+
+    def prefixes_of(self, text: str) -> list[str]:
+        # one walk down the transducer, checking finality at each character
+        found = []
+        node, output = self._root, 0
+        for end, char in enumerate(text, 1):
+            reached = self._walk(char.encode(), node, output)
+            if reached is None:
+                break
+            node, output = reached
+            if self._buf[node] & _FINAL:
+                found.append(text[:end])
+        return found
+
+    def __len__(self) -> int:
+        return self._count
+
+    def nbytes(self) -> int:
+        return len(self._buf)
+
+
+class FstDictionaryFactory(CachingDictionaryFactory):
+    """`DictionaryFactory` backed by minimal finite-state transducers.
+
+    The most compact in-memory backend, as it shares both the beginnings
+    and the endings of words, with no extra dependency; lookups walk one arc
+    per UTF-8 byte. The first use of a language builds its transducer (a few
+    seconds for English, minutes for the largest languages), then caches it
+    on disk.
+    """
+
+    __slots__ = ("_cache_dir", "_use_disk_cache")
+
+    def __init__(
+        self,
+        cache_max_size: int = 8,
+        use_disk_cache: bool = True,
+        disk_cache_dir: str | None = None,
+        cache_max_bytes: int | None = None,
+        pinned: Iterable[str] = (),
+    ) -> None:
+        """Initialize the FstDictionaryFactory.
+
+        Args:
+            cache_max_size (int): The maximum number of dictionaries to
+                keep in memory. Defaults to `8`.
+            use_disk_cache (bool): Whether to cache the built transducers
+                on disk to speed up loading time. Defaults to `True`.
+            disk_cache_dir (str | None): Path where the built transducers
+                should be stored in. Defaults to a Simplemma-specific
+                subdirectory of the user's cache directory.
+            cache_max_bytes (int | None), pinned (Iterable[str]): See
+                `CachingDictionaryFactory`.
+        """
+        if disk_cache_dir:
+            self._cache_dir = Path(disk_cache_dir)
+        else:
+            self._cache_dir = _user_cache_dir() / "fst" / SIMPLEMMA_VERSION
+        self._use_disk_cache = use_disk_cache
+        super().__init__(cache_max_size, cache_max_bytes, pinned)
+
+    def _build_fst(self, lang: str) -> bytes:
+        """Build the serialized transducer for the shipped `lang`."""
+        return build_fst(_read_decompressed(lang))
+
+    def _get_dictionary_uncached(self, lang: str) -> Mapping[str, str]:
+        _check_supported(lang)
+        if not self._use_disk_cache:
+            return FstMap(self._build_fst(lang))
+
+        return _load_or_build_cache(
+            self._cache_dir / f"{lang}.fst",
+            lambda path: FstMap(path.read_bytes()),
+            lambda: self._build_fst(lang),
+            lambda blob: (blob,),
+            FstMap,
+            f"transducer for {lang}",
+        )
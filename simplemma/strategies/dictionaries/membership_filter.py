@@ -0,0 +1,234 @@
+"""Per-language membership filters: Bloom filters answering "is this form in
+language X" in about a byte per dictionary entry, with no lemma values.
+
+Filters hold the `lookup_fold` form of every key, so a single check covers
+all the case and apostrophe variants dictionary lookups try. They are built
+by streaming the shipped `.plzma` files (no decoded dictionary in memory)
+and persisted under the user cache dir, keyed by Simplemma version and
+false-positive rate.
+
+File layout, little-endian: magic, hash count, bit count, then the bits.
+Hashes are BLAKE2b-based so that persisted filters stay valid across
+processes (`hash()` is salted per process). Filters that are only ever
+checked in the process that built them, such as the lookup prefilters of
+`DictionaryLookupStrategy` and `PrefilteredDictionaryFactory`, hash with
+`hash()` instead, which is several times cheaper, and cannot be serialized.
+"""
+
+import math
+import struct
+from collections.abc import Callable, Iterable
+from hashlib import blake2b
+from pathlib import Path
+
+from simplemma.__metadata__ import __version__ as SIMPLEMMA_VERSION
+
+from ...utils import lookup_fold
+from . import frontcode
+from .dictionary_factory import (
+    _check_supported,
+    _load_or_build_cache,
+    _read_decompressed,
+    _user_cache_dir,
+)
+
+
+MAGIC = b"SMBF0001"
+_HEADER = struct.Struct("<8sBQ")  # magic, hash count, bit count
+
+
+def stable_hash(key: str) -> int:
+    """64-bit hash, the same in every process: filters using it can be
+    persisted. Its low and high halves seed the double hashing."""
+    return int.from_bytes(blake2b(key.encode(), digest_size=8).digest(), "little")
+
+
+class MembershipFilter:
+    """Bloom filter over folded dictionary keys.
+
+    Never misses a member; a non-member is reported present with about the
+    false-positive rate the filter was sized for.
+    """
+
+    __slots__ = ("_bits", "_hashes", "_key_hash", "_nbits")
+
+    def __init__(
+        self,
+        bits: bytes | bytearray,
+        hashes: int,
+        key_hash: Callable[[str], int] = stable_hash,
+    ) -> None:
+        if not bits or not hashes:
+            raise ValueError("empty membership filter")
+        self._bits = bits
+        self._hashes = hashes
+        self._key_hash = key_hash
+        self._nbits = 8 * len(bits)
+
+    @classmethod
+    def from_keys(
+        cls,
+        keys: Iterable[str],
+        count: int,
+        false_positive_rate: float = 0.01,
+        key_hash: Callable[[str], int] = stable_hash,
+    ) -> "MembershipFilter":
+        """Build a filter sized for `count` keys at `false_positive_rate`.
+
+        Args:
+            keys (Iterable[str]): The dictionary keys, folded on insertion.
+            count (int): Upper bound on the number of keys.
+            false_positive_rate (float): Target probability that a
+                non-member is reported present. Defaults to `0.01`.
+            key_hash (Callable[[str], int]): 64-bit hash of the folded
+                keys. Defaults to `stable_hash`; pass the builtin `hash` for
+                a faster filter that is only valid within this process.
+
+        Raises:
+            ValueError: If `false_positive_rate` is not between 0 and 1.
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        bits_per_key = -math.log(false_positive_rate) / math.log(2) ** 2
+        nbytes = max(8, math.ceil(bits_per_key * count / 8))
+        hashes = max(1, round(bits_per_key * math.log(2)))
+        bits = bytearray(nbytes)
+        nbits = 8 * nbytes
+        for key in keys:
+            h = key_hash(lookup_fold(key))
+            h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+            for i in range(hashes):
+                bit = (h1 + i * h2) % nbits
+                bits[bit >> 3] |= 1 << (bit & 7)
+        return cls(bytes(bits), hashes, key_hash)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "MembershipFilter":
+        """Read a filter written by `to_bytes`.
+
+        Raises:
+            ValueError: If `data` is not a serialized filter.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("not a membership filter")
+        magic, hashes, nbits = _HEADER.unpack_from(data)
+        if magic != MAGIC or 8 * (len(data) - _HEADER.size) != nbits:
+            raise ValueError("not a membership filter")
+        return cls(data[_HEADER.size :], hashes)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter.
+
+        Raises:
+            ValueError: If the filter does not hash with `stable_hash`.
+        """
+        if self._key_hash is not stable_hash:
+            raise ValueError("only stable-hashed filters can be serialized")
+        return _HEADER.pack(MAGIC, self._hashes, self._nbits) + bytes(self._bits)
+
+    def __contains__(self, token: object) -> bool:
+        """Whether `token`, or a case or apostrophe variant of it, may be a key."""
+        if not isinstance(token, str):
+            return False
+        h = self._key_hash(lookup_fold(token))
+        bits, nbits = self._bits, self._nbits
+        # the bits of `from_keys`, stepping instead of multiplying
+        bit = (h & 0xFFFFFFFF) % nbits
+        step = ((h >> 32) | 1) % nbits
+        for _ in range(self._hashes):
+            if not bits[bit >> 3] >> (bit & 7) & 1:
+                return False
+            bit += step
+            if bit >= nbits:
+                bit -= nbits
+        return True
+
+    def nbytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._bits)
+
+
+def build_membership_filter(
+    lang: str, false_positive_rate: float = 0.01
+) -> MembershipFilter:
+    """Build the filter of `lang` straight from its shipped dictionary stream."""
+    _check_supported(lang)
+    data = _read_decompressed(lang)
+    reverse_key, count, pos = frontcode.read_header(data)
+    keys = (
+        (stored_key[::-1] if reverse_key else stored_key).decode()
+        for _, stored_key, _ in frontcode.iter_records(data, pos)
+    )
+    return MembershipFilter.from_keys(keys, count, false_positive_rate)
+
+
+class MembershipFilterFactory:
+    """Keeps the membership filter of every requested language resident.
+
+    Filters are small enough to never be evicted: unlike dictionary
+    factories there is no cache bound. Each filter is built on first use,
+    or read from `disk_cache_dir` when an earlier process built it.
+    """
+
+    __slots__ = ("_cache_dir", "_false_positive_rate", "_filters", "_use_disk_cache")
+
+    def __init__(
+        self,
+        false_positive_rate: float = 0.01,
+        use_disk_cache: bool = True,
+        disk_cache_dir: str | None = None,
+    ) -> None:
+        """Initialize the MembershipFilterFactory.
+
+        Args:
+            false_positive_rate (float): Probability that a form missing
+                from a dictionary is reported present. Each halving costs
+                about 1.44 more bits per entry. Defaults to `0.01`
+                (about 1.2 bytes per entry).
+            use_disk_cache (bool): Persist built filters and reuse them
+                across processes. Defaults to `True`.
+            disk_cache_dir (str | None): Path where the filters should be
+                stored in. Defaults to a Simplemma-specific subdirectory of
+                the user's cache directory.
+
+        Raises:
+            ValueError: If `false_positive_rate` is not between 0 and 1.
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self._false_positive_rate = false_positive_rate
+        self._use_disk_cache = use_disk_cache
+        if disk_cache_dir:
+            self._cache_dir = Path(disk_cache_dir)
+        else:
+            self._cache_dir = _user_cache_dir() / "filters" / SIMPLEMMA_VERSION
+        self._filters: dict[str, MembershipFilter] = {}
+
+    def get_filter(self, lang: str) -> MembershipFilter:
+        """Get the membership filter of `lang`.
+
+        Raises:
+            ValueError: If the language is not supported.
+        """
+        membership_filter = self._filters.get(lang)
+        if membership_filter is None:
+            membership_filter = self._filters[lang] = self._load_filter(lang)
+        return membership_filter
+
+    def nbytes(self) -> int:
+        """Total size of the resident filters in bytes."""
+        return sum(f.nbytes() for f in list(self._filters.values()))
+
+    def _load_filter(self, lang: str) -> MembershipFilter:
+        _check_supported(lang)
+        if not self._use_disk_cache:
+            return build_membership_filter(lang, self._false_positive_rate)
+
+        return _load_or_build_cache(
+            self._cache_dir / f"{lang}.{self._false_positive_rate:g}.smbf",
+            lambda path: MembershipFilter.from_bytes(path.read_bytes()),
+            lambda: build_membership_filter(lang, self._false_positive_rate),
+            lambda membership_filter: (membership_filter.to_bytes(),),
+            lambda membership_filter: membership_filter,
+            f"membership filter for {lang}",
+        )
@@ -0,0 +1,216 @@
+"""Cross-language membership index: one memory-mapped hash table mapping every
+dictionary form of a set of languages to the bitmask of the languages whose
+dictionaries contain it.
+
+Language detection over many candidate languages otherwise loads every
+dictionary and probes each one per token; with the index, membership in all
+of them is one probe. The table is built once per language set from the
+shipped `.plzma` files, written under the user cache dir and mapped read-only
+afterwards, in the same layout family as `mmap_dictionary_factory`:
+
+- header: magic, entry count, slot count, total file size, length of the
+  language list, then the comma-separated language codes (bit `i` of a mask
+  stands for the `i`-th code);
+- slots: `(crc32(key), record offset)` pairs, offset 0 marking an empty slot,
+  linear probing, load factor <= 0.5;
+- records: key length, the key bytes, then the 64-bit language mask.
+
+Forms shared by several languages are stored once, so the file stays
+smaller than the sum of the per-language tables.
+"""
+
+import logging
+import mmap
+import struct
+from collections.abc import Iterable
+from pathlib import Path
+from zlib import crc32
+
+from simplemma.__metadata__ import __version__ as SIMPLEMMA_VERSION
+
+from . import frontcode
+from .dictionary_factory import (
+    _check_supported,
+    _load_or_build_cache,
+    _read_count,
+    _read_decompressed,
+    _user_cache_dir,
+)
+from .mmap_dictionary_factory import _SlotTable
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SMLMI001"
+_HEADER = struct.Struct("<8sIIQH")  # magic, count, nslots, file size, langs len
+_SLOT = struct.Struct("<II")  # key hash, record offset (0 = empty)
+_KEY_LEN = struct.Struct("<H")
+_MASK = struct.Struct("<Q")
+_MAX_KEY_LEN = 0xFFFF
+_MAX_LANGS = 64
+
+
+def _sorted_langs(langs: Iterable[str]) -> tuple[str, ...]:
+    codes = tuple(sorted(set(langs)))
+    if not codes:
+        raise ValueError("A membership index needs at least one language")
+    if len(codes) > _MAX_LANGS:
+        raise ValueError(f"A membership index holds at most {_MAX_LANGS} languages")
+    for lang in codes:
+        _check_supported(lang)
+    return codes
+
+
+def _build_chunks(codes: tuple[str, ...]) -> tuple[bytes, memoryview, bytearray]:
+    """The membership table of `codes` as (header and language list, slots,
+    records), to be written in sequence. Languages are decoded one at a time,
+    the slot count being sized from their headers beforehand."""
+    logger.debug("Compiling membership index. This might take a while.")
+    lang_list = ",".join(codes).encode()
+    nslots = 2 * sum(map(_read_count, codes)) + 1
+    table_end = _HEADER.size + len(lang_list) + nslots * _SLOT.size
+    table = _SlotTable(nslots, table_end, _KEY_LEN)
+    records = table.records
+    unique = 0
+    for bit, lang in enumerate(codes):
+        flag = 1 << bit
+        data = _read_decompressed(lang)
+        reverse_key, count, pos = frontcode.read_header(data)
+        n = 0
+        for _, stored_key, _ in frontcode.iter_records(data, pos):
+            key = stored_key[::-1] if reverse_key else stored_key
+            if len(key) > _MAX_KEY_LEN:
+                raise ValueError("dictionary entry too long for the membership index")
+            key_hash = crc32(key)
+            slot, found = table.find(key, key_hash)
+            if found >= 0:
+                mask_pos = found + _KEY_LEN.size + len(key)
+                (mask,) = _MASK.unpack_from(records, mask_pos)
+                _MASK.pack_into(records, mask_pos, mask | flag)
+            else:
+                table.add(
+                    slot, key_hash, _KEY_LEN.pack(len(key)), key, _MASK.pack(flag)
+                )
+                unique += 1
+            n += 1
+        if n != count:
+            raise ValueError(frontcode._CORRUPT_STREAM_MSG)
+        del data
+
+    size = table_end + len(records)
+    header = _HEADER.pack(MAGIC, unique, nslots, size, len(lang_list))
+    return header + lang_list, table.slot_bytes(), records
+
+
+def build_membership_index(langs: Iterable[str]) -> bytes:
+    """Compile the shipped dictionaries of `langs` into one membership table."""
+    return b"".join(_build_chunks(_sorted_langs(langs)))
+
+
+class MembershipIndex:
+    """Read-only view over a compiled membership table (see the module
+    docstring), held in an `mmap` or any bytes-like buffer."""
+
+    __slots__ = ("_buf", "_count", "_nslots", "_slots_start", "langs")
+
+    def __init__(self, buf: "bytes | mmap.mmap") -> None:
+        if len(buf) < _HEADER.size:
+            raise ValueError("not a membership index")
+        magic, count, nslots, size, langs_len = _HEADER.unpack_from(buf)
+        if magic != MAGIC or size != len(buf) or not nslots:
+            raise ValueError("not a membership index")
+        self._buf = buf
+        self._count: int = count
+        self._nslots: int = nslots
+        self._slots_start = _HEADER.size + langs_len
+        self.langs: tuple[str, ...] = tuple(
+            bytes(buf[_HEADER.size : self._slots_start]).decode().split(",")
+        )
+
+    def bit(self, lang: str) -> int:
+        """The mask bit standing for `lang`.
+
+        Raises:
+            ValueError: If `lang` is not covered by the index.
+        """
+        try:
+            return 1 << self.langs.index(lang)
+        except ValueError:
+            raise ValueError(f"Language not in membership index: {lang}") from None
+
+    def mask(self, token: str) -> int:
+        """Bitmask of the languages having `token` as a dictionary key."""
+        target = token.encode()
+        key_hash = crc32(target)
+        buf, nslots, slots_start = self._buf, self._nslots, self._slots_start
+        slot = key_hash % nslots
+        while True:
+            stored_hash, offset = _SLOT.unpack_from(
+                buf, slots_start + slot * _SLOT.size
+            )
+            if not offset:
+                return 0
+            if stored_hash == key_hash:
+                (key_len,) = _KEY_LEN.unpack_from(buf, offset)
+                start = offset + _KEY_LEN.size
+                if buf[start : start + key_len] == target:
+                    return _MASK.unpack_from(buf, start + key_len)[0]  # type: ignore[no-any-return]
+            slot = (slot + 1) % nslots
+
+    def __len__(self) -> int:
+        return self._count
+
+    def nbytes(self) -> int:
+        """Size of the underlying table in bytes."""
+        return len(self._buf)
+
+
+def _map_file(path: Path) -> MembershipIndex:
+    with path.open("rb") as filehandle:
+        # the mapping outlives the file handle
+        mapped = mmap.mmap(filehandle.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return MembershipIndex(mapped)
+    except ValueError:
+        mapped.close()
+        raise
+
+
+def load_membership_index(
+    langs: Iterable[str],
+    disk_cache_dir: str | None = None,
+    use_disk_cache: bool = True,
+) -> MembershipIndex:
+    """Open the membership index of `langs`, compiling it on first use.
+
+    Args:
+        langs (Iterable[str]): The language codes to cover (at most 64).
+        disk_cache_dir (str | None): Path where compiled indexes should be
+            stored in. Defaults to a Simplemma-specific subdirectory of the
+            user's cache directory.
+        use_disk_cache (bool): Store the compiled index on disk and map it,
+            so that later processes skip the build. Defaults to `True`.
+
+    Returns:
+        MembershipIndex: The index, memory-mapped when cached on disk.
+
+    Raises:
+        ValueError: If no language, more than 64 or an unsupported one is given.
+    """
+    codes = _sorted_langs(langs)
+    if not use_disk_cache:
+        return MembershipIndex(build_membership_index(codes))
+
+    if disk_cache_dir:
+        cache_dir = Path(disk_cache_dir)
+    else:
+        cache_dir = _user_cache_dir() / "membership" / SIMPLEMMA_VERSION
+    # the pieces are written in sequence, without a joined copy of the table
+    return _load_or_build_cache(
+        cache_dir / f"{'-'.join(codes)}.smi",
+        _map_file,
+        lambda: _build_chunks(codes),
+        lambda chunks: chunks,
+        lambda chunks: MembershipIndex(b"".join(chunks)),
+        f"membership index for {codes}",
+        reload=True,
+    )
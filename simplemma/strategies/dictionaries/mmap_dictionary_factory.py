@@ -0,0 +1,237 @@
+"""`DictionaryFactory` serving lookups straight from a memory-mapped,
+uncompressed on-disk hash table, with no per-entry Python objects.
+
+The first use of a language compiles its shipped `.plzma` once into a flat
+open-addressing table under the user cache dir; afterwards every process maps
+that file read-only, so workers share one physical copy through the page
+cache and a cold start costs an `mmap` call instead of an lzma + front-code
+decode pass. Trades disk space (the table is stored uncompressed) for both.
+
+Table layout, all little-endian:
+
+- header: magic, entry count, slot count, total file size;
+- slots: `(crc32(key), record offset)` pairs, offset 0 marking an empty slot,
+  linear probing, load factor <= 0.5;
+- records: `(key length, value length)` then the key and value bytes, in
+  stream order (so iteration matches `StreamMap`).
+"""
+
+import logging
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from zlib import crc32
+
+from simplemma.__metadata__ import __version__ as SIMPLEMMA_VERSION
+
+from . import frontcode
+from .dictionary_factory import (
+    CachingDictionaryFactory,
+    DecodedStrMapping,
+    _check_supported,
+    _load_or_build_cache,
+    _read_decompressed,
+    _user_cache_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SMMHT001"
+_HEADER = struct.Struct("<8sIIQ")  # magic, count, nslots, file size
+_SLOT = struct.Struct("<II")  # key hash, record offset (0 = empty)
+_RECORD = struct.Struct("<HH")  # key length, value length
+_MAX_FIELD_LEN = 0xFFFF
+
+
+class _SlotTable:
+    """The slots and records of an on-disk hash table (this module's layout,
+    shared by `membership_index`), built in memory.
+
+    Records start with the key length, as the first field of
+    `record_header`, followed by the key; offsets count from the start of
+    the file, whose records begin at `records_start`.
+    """
+
+    __slots__ = ("slots", "records", "_nslots", "_records_start", "_record_header")
+
+    def __init__(
+        self, nslots: int, records_start: int, record_header: struct.Struct
+    ) -> None:
+        # flat (hash, offset) pairs, the exact on-disk slot layout
+        self.slots = array("I", bytes(nslots * _SLOT.size))
+        self.records = bytearray()
+        self._nslots = nslots
+        self._records_start = records_start
+        self._record_header = record_header
+
+    def find(self, key: bytes, key_hash: int) -> tuple[int, int]:
+        """(slot, position in `records`) of the record of `key`, or (the
+        empty slot to add it in, -1)."""
+        slots, records, nslots = self.slots, self.records, self._nslots
+        slot = key_hash % nslots
+        while offset := slots[2 * slot + 1]:
+            if slots[2 * slot] == key_hash:
+                pos = offset - self._records_start
+                key_len = self._record_header.unpack_from(records, pos)[0]
+                start = pos + self._record_header.size
+                if records[start : start + key_len] == key:
+                    return slot, pos
+            slot = (slot + 1) % nslots
+        return slot, -1
+
+    def add(self, slot: int, key_hash: int, *fields: bytes) -> None:
+        """Point the empty `slot` at a new record made of `fields`."""
+        self.slots[2 * slot] = key_hash
+        self.slots[2 * slot + 1] = self._records_start + len(self.records)
+        for field in fields:
+            self.records += field
+
+    def slot_bytes(self) -> memoryview:
+        """The slots in on-disk (little-endian) byte order, without a copy."""
+        if sys.byteorder == "big":
+            self.slots.byteswap()
+        return memoryview(self.slots).cast("B")
+
+
+def build_table(data: bytes) -> bytes:
+    """Compile decompressed front-coded `data` into the on-disk table format."""
+    reverse_key, count, pos = frontcode.read_header(data)
+    nslots = 2 * count + 1
+    table_end = _HEADER.size + nslots * _SLOT.size
+    table = _SlotTable(nslots, table_end, _RECORD)
+    n = 0
+    for _, stored_key, stored_value in frontcode.iter_records(data, pos):
+        key = stored_key[::-1] if reverse_key else stored_key
+        value = stored_value[::-1] if reverse_key else stored_value
+        if len(key) > _MAX_FIELD_LEN or len(value) > _MAX_FIELD_LEN:
+            raise ValueError("dictionary entry too long for the mmap table")
+        key_hash = crc32(key)
+        slot, found = table.find(key, key_hash)
+        if found >= 0:  # stream keys are unique
+            raise ValueError(frontcode._CORRUPT_STREAM_MSG)
+        table.add(slot, key_hash, _RECORD.pack(len(key), len(value)), key, value)
+        n += 1
+    if n != count:
+        raise ValueError(frontcode._CORRUPT_STREAM_MSG)
+
+    header = _HEADER.pack(MAGIC, count, nslots, table_end + len(table.records))
+    return b"".join((header, table.slot_bytes(), table.records))
+
+
+class MmapMap(DecodedStrMapping):
+    """Read-only str->str view over a compiled hash table (see the module
+    docstring), held in an `mmap` or any bytes-like buffer."""
+
+    __slots__ = ("_buf", "_count", "_nslots", "_table_end")
+
+    def __init__(self, buf: "bytes | mmap.mmap") -> None:
+        if len(buf) < _HEADER.size:
+            raise ValueError("not an mmap dictionary table")
+        magic, count, nslots, size = _HEADER.unpack_from(buf)
+        if magic != MAGIC or size != len(buf) or not nslots:
+            raise ValueError("not an mmap dictionary table")
+        self._buf = buf
+        self._count: int = count
+        self._nslots: int = nslots
+        self._table_end = _HEADER.size + nslots * _SLOT.size
+
+    def _lookup(self, key: str) -> str | None:
+        target = key.encode()
+        key_hash = crc32(target)
+        buf, nslots = self._buf, self._nslots
+        slot = key_hash % nslots
+        while True:
+            stored_hash, offset = _SLOT.unpack_from(
+                buf, _HEADER.size + slot * _SLOT.size
+            )
+            if not offset:
+                return None
+            if stored_hash == key_hash:
+                key_len, value_len = _RECORD.unpack_from(buf, offset)
+                start = offset + _RECORD.size
+                if buf[start : start + key_len] == target:
+                    start += key_len
+                    return buf[start : start + value_len].decode()
+            slot = (slot + 1) % nslots
+
+    def __iter__(self) -> Iterator[str]:
+        buf, offset, end = self._buf, self._table_end, len(self._buf)
+        while offset < end:
+            key_len, value_len = _RECORD.unpack_from(buf, offset)
+            start = offset + _RECORD.size
+            yield buf[start : start + key_len].decode()
+            offset = start + key_len + value_len
+
+    def __len__(self) -> int:
+        return self._count
+
+    def nbytes(self) -> int:
+        # mapped pages are shared with other processes but resident all the same
+        return len(self._buf)
+
+
+def _map_file(path: Path) -> MmapMap:
+    with path.open("rb") as filehandle:
+        # the mapping outlives the file handle
+        mapped = mmap.mmap(filehandle.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return MmapMap(mapped)
+    except ValueError:
+        mapped.close()
+        raise
+
+
+class MmapDictionaryFactory(CachingDictionaryFactory):
+    """`DictionaryFactory` backed by memory-mapped, compiled hash tables.
+
+    Dictionaries are compiled once per language and Simplemma version into
+    `disk_cache_dir`, then mapped read-only: processes share the pages, and
+    nothing is decoded until looked up. If the cache directory is not
+    writable, the compiled table is served from process memory instead.
+    """
+
+    __slots__ = ("_cache_dir",)
+
+    def __init__(
+        self,
+        cache_max_size: int = 8,
+        disk_cache_dir: str | None = None,
+        cache_max_bytes: int | None = None,
+        pinned: Iterable[str] = (),
+    ) -> None:
+        """Initialize the MmapDictionaryFactory.
+
+        Args:
+            cache_max_size (int): The maximum number of dictionaries to
+                keep mapped. Defaults to `8`.
+            disk_cache_dir (str | None): Path where the compiled tables
+                should be stored in. Defaults to a Simplemma-specific
+                subdirectory of the user's cache directory.
+            cache_max_bytes (int | None), pinned (Iterable[str]): See
+                `CachingDictionaryFactory`.
+        """
+        if disk_cache_dir:
+            self._cache_dir = Path(disk_cache_dir)
+        else:
+            self._cache_dir = _user_cache_dir() / "mmap" / SIMPLEMMA_VERSION
+        super().__init__(cache_max_size, cache_max_bytes, pinned)
+
+    def _build_table(self, lang: str) -> bytes:
+        """Compile the shipped dictionary for `lang` into a table."""
+        logger.debug("Compiling mmap table. This might take a second.")
+        return build_table(_read_decompressed(lang))
+
+    def _get_dictionary_uncached(self, lang: str) -> Mapping[str, str]:
+        _check_supported(lang)
+        return _load_or_build_cache(
+            self._cache_dir / f"{lang}.smh",
+            _map_file,
+            lambda: self._build_table(lang),
+            lambda table: (table,),
+            MmapMap,
+            f"mmap table for {lang}",
+            reload=True,
+        )
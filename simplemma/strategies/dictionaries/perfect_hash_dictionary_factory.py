@@ -0,0 +1,278 @@
+"""`DictionaryFactory` backed by a minimal perfect hash over packed arenas.
+
+Sits between `DefaultDictionaryFactory` (fast, one Python object per key and
+value) and `StreamDictionaryFactory` (lean, decodes on every lookup): keys and
+values live in two flat byte arenas indexed through `array` offset tables, so
+a language costs little more than its decompressed size, while a lookup is one
+hash, one table probe and one key comparison.
+
+The hash is "hash and displace" (CHD-style): keys are grouped into buckets by
+a first hash; each bucket, largest first, gets a displacement that moves all
+its keys to free slots of the second hash family; single-key buckets take a
+free slot directly. Every one of the `n` keys gets its own slot in `0..n-1`.
+Building is pure Python and takes a few seconds on the big languages, so the result
+is cached on disk like `TrieDictionaryFactory`'s tries.
+"""
+
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from hashlib import blake2b
+from pathlib import Path
+
+from simplemma.__metadata__ import __version__ as SIMPLEMMA_VERSION
+
+from . import frontcode
+from .dictionary_factory import (
+    CachingDictionaryFactory,
+    DecodedStrMapping,
+    _check_supported,
+    _load_or_build_cache,
+    _read_decompressed,
+    _user_cache_dir,
+)
+
+
+MAGIC = b"SMPH1\x00\x00\x00"
+# magic, seed, key count, bucket count, key arena size, value arena size
+_HEADER = struct.Struct("<8sIIIII")
+# one key per bucket on average: about a third of the buckets are
+# singletons, which fill the last free slots without any search
+_KEYS_PER_BUCKET = 1
+# displacement trials per bucket before giving up on a seed
+_MAX_DISPLACEMENT = 1 << 16
+_MAX_SEEDS = 16
+
+
+def _hashes(key: bytes, seed: int) -> tuple[int, int, int]:
+    """(bucket hash, slot base, slot step) for `key`."""
+    digest = int.from_bytes(
+        blake2b(key, digest_size=12, salt=seed.to_bytes(16, "little")).digest(),
+        "little",
+    )
+    return digest & 0xFFFFFFFF, (digest >> 32) & 0xFFFFFFFF, digest >> 64
+
+
+def _place(keys: list[bytes], seed: int) -> "tuple[array[int], array[int]] | None":
+    """Displacements per bucket and the slot of every key, or None if some
+    bucket found no displacement under `seed`."""
+    count = len(keys)
+    nbuckets = max(1, count // _KEYS_PER_BUCKET)
+    buckets: list[list[int]] = [[] for _ in range(nbuckets)]
+    bases: list[int] = []
+    steps: list[int] = []
+    for index, key in enumerate(keys):
+        bucket_hash, base, step = _hashes(key, seed)
+        buckets[bucket_hash % nbuckets].append(index)
+        bases.append(base)
+        steps.append(step)
+
+    # a non-negative displacement d maps a key to (base + d * step) % count;
+    # a negative one stores a singleton's slot directly as -(slot + 1)
+    displacements = array("i", bytes(4 * nbuckets))
+    slots = array("I", bytes(4 * count))
+    taken = bytearray(count)
+    # lazy: singletons come last, once every larger bucket is placed
+    free = (slot for slot in range(count) if not taken[slot])
+    for bucket in sorted(range(nbuckets), key=lambda b: -len(buckets[b])):
+        members = buckets[bucket]
+        if not members:
+            break
+        if len(members) == 1:
+            slot = next(free)
+            displacements[bucket] = -(slot + 1)
+            slots[members[0]] = slot
+            continue
+        for displacement in range(_MAX_DISPLACEMENT):
+            candidate: list[int] = []
+            for index in members:
+                slot = (bases[index] + displacement * steps[index]) % count
+                if taken[slot] or slot in candidate:
+                    break
+                candidate.append(slot)
+            else:
+                break
+        else:
+            return None
+        displacements[bucket] = displacement
+        for index, slot in zip(members, candidate):
+            taken[slot] = 1
+            slots[index] = slot
+    return displacements, slots
+
+
+def build_perfect_hash(data: bytes) -> bytes:
+    """Compile decompressed front-coded `data` into the serialized layout:
+    header, displacements, key offsets, value offsets, key and value arenas."""
+    reverse_key, count, pos = frontcode.read_header(data)
+    keys: list[bytes] = []
+    values: list[bytes] = []
+    for _, stored_key, stored_value in frontcode.iter_records(data, pos):
+        keys.append(stored_key[::-1] if reverse_key else stored_key)
+        values.append(stored_value[::-1] if reverse_key else stored_value)
+    if len(keys) != count:
+        raise ValueError(frontcode._CORRUPT_STREAM_MSG)
+
+    for seed in range(_MAX_SEEDS):
+        placed = _place(keys, seed)
+        if placed is not None:
+            break
+    else:  # pragma: no cover - needs 16 consecutive unlucky seeds
+        raise ValueError("no perfect hash found")
+    displacements, slots = placed
+
+    by_slot = array("I", bytes(4 * count))
+    for index, slot in enumerate(slots):
+        by_slot[slot] = index
+    key_offsets = array("I", [0])
+    value_offsets = array("I", [0])
+    key_arena = bytearray()
+    value_arena = bytearray()
+    for index in by_slot:
+        key_arena += keys[index]
+        value_arena += values[index]
+        key_offsets.append(len(key_arena))
+        value_offsets.append(len(value_arena))
+
+    tables = [displacements, key_offsets, value_offsets]
+    if sys.byteorder == "big":
+        for table in tables:
+            table.byteswap()
+    header = _HEADER.pack(
+        MAGIC, seed, count, len(displacements), len(key_arena), len(value_arena)
+    )
+    return b"".join([header, *(table.tobytes() for table in tables)]) + bytes(
+        key_arena + value_arena
+    )
+
+
+class PerfectHashMap(DecodedStrMapping):
+    """Read-only str->str view over a compiled minimal perfect hash (see the
+    module docstring)."""
+
+    __slots__ = (
+        "_seed",
+        "_count",
+        "_displacements",
+        "_key_offsets",
+        "_value_offsets",
+        "_keys",
+        "_values",
+    )
+
+    def __init__(self, blob: bytes) -> None:
+        if len(blob) < _HEADER.size:
+            raise ValueError("not a perfect hash table")
+        magic, seed, count, nbuckets, keys_len, values_len = _HEADER.unpack_from(blob)
+        tables_len = 4 * (nbuckets + 2 * (count + 1))
+        if (
+            magic != MAGIC
+            or len(blob) != _HEADER.size + tables_len + keys_len + values_len
+        ):
+            raise ValueError("not a perfect hash table")
+        pos = _HEADER.size
+        tables = []
+        for typecode, length in (("i", nbuckets), ("I", count + 1), ("I", count + 1)):
+            table = array(typecode)
+            table.frombytes(blob[pos : pos + 4 * length])
+            if sys.byteorder == "big":
+                table.byteswap()
+            tables.append(table)
+            pos += 4 * length
+        self._seed: int = seed
+        self._count: int = count
+        self._displacements, self._key_offsets, self._value_offsets = tables
+        self._keys = blob[pos : pos + keys_len]
+        self._values = blob[pos + keys_len :]
+
+    def _lookup(self, key: str) -> str | None:
+        count = self._count
+        if not count:
+            return None
+        target = key.encode()
+        bucket_hash, base, step = _hashes(target, self._seed)
+        displacements = self._displacements
+        displacement = displacements[bucket_hash % len(displacements)]
+        if displacement < 0:
+            slot = -displacement - 1
+        else:
+            slot = (base + displacement * step) % count
+        key_offsets = self._key_offsets
+        if self._keys[key_offsets[slot] : key_offsets[slot + 1]] != target:
+            return None
+        value_offsets = self._value_offsets
+        return self._values[value_offsets[slot] : value_offsets[slot + 1]].decode()
+
+    def __iter__(self) -> Iterator[str]:
+        keys, key_offsets = self._keys, self._key_offsets
+        for slot in range(self._count):
+            yield keys[key_offsets[slot] : key_offsets[slot + 1]].decode()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def nbytes(self) -> int:
+        tables = (self._displacements, self._key_offsets, self._value_offsets)
+        return (
+            len(self._keys)
+            + len(self._values)
+            + sum(table.itemsize * len(table) for table in tables)
+        )
+
+
+class PerfectHashDictionaryFactory(CachingDictionaryFactory):
+    """`DictionaryFactory` backed by minimal perfect hashes over byte arenas.
+
+    Near-dict lookup speed at a fraction of `DefaultDictionaryFactory`'s
+    memory, with no extra dependency. The first use of a language builds its
+    hash (a few seconds for the largest languages), then caches it on disk.
+    """
+
+    __slots__ = ("_cache_dir", "_use_disk_cache")
+
+    def __init__(
+        self,
+        cache_max_size: int = 8,
+        use_disk_cache: bool = True,
+        disk_cache_dir: str | None = None,
+        cache_max_bytes: int | None = None,
+        pinned: Iterable[str] = (),
+    ) -> None:
+        """Initialize the PerfectHashDictionaryFactory.
+
+        Args:
+            cache_max_size (int): The maximum number dictionaries to
+                keep in memory. Defaults to `8`.
+            use_disk_cache (bool): Whether to cache the built hashes on
+                disk to speed up loading time. Defaults to `True`.
+            disk_cache_dir (str | None): Path where the built hashes
+                should be stored in. Defaults to a Simplemma-specific
+                subdirectory of the user's cache directory.
+            cache_max_bytes (int | None), pinned (Iterable[str]): See
+                `CachingDictionaryFactory`.
+        """
+        if disk_cache_dir:
+            self._cache_dir = Path(disk_cache_dir)
+        else:
+            self._cache_dir = _user_cache_dir() / "perfect_hash" / SIMPLEMMA_VERSION
+        self._use_disk_cache = use_disk_cache
+        super().__init__(cache_max_size, cache_max_bytes, pinned)
+
+    def _build_perfect_hash(self, lang: str) -> bytes:
+        """Build the serialized perfect hash for the shipped `lang`."""
+        return build_perfect_hash(_read_decompressed(lang))
+
+    def _get_dictionary_uncached(self, lang: str) -> Mapping[str, str]:
+        _check_supported(lang)
+        if not self._use_disk_cache:
+            return PerfectHashMap(self._build_perfect_hash(lang))
+
+        return _load_or_build_cache(
+            self._cache_dir / f"{lang}.mph",
+            lambda path: PerfectHashMap(path.read_bytes()),
+            lambda: self._build_perfect_hash(lang),
+            lambda blob: (blob,),
+            PerfectHashMap,
+            f"perfect hash for {lang}",
+        )
@@ -0,0 +1,102 @@
+"""`DictionaryFactory` wrapper rejecting absent keys with a per-language
+`MembershipFilter` before they reach the wrapped backend.
+
+Decomposition strategies probe many substrings and residues per token, and
+nearly all of those probes miss. On backends where a miss is expensive (a
+bisect plus a block decode for `StreamDictionaryFactory`, a trie walk for
+`TrieDictionaryFactory`), the filter answers most of them in a bit test or two.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+
+from .dictionary_factory import (
+    DecodedStrMapping,
+    DictionaryFactory,
+    _dictionary_nbytes,
+    get_many,
+)
+from .membership_filter import MembershipFilter
+
+
+class PrefilteredMap(DecodedStrMapping):
+    """Read-only view over a dictionary whose lookups check a filter first.
+
+    The filter holds folded keys, so case variants of a key pass it too and
+    are confirmed against the dictionary like any false positive.
+    """
+
+    __slots__ = ("_dictionary", "_filter")
+
+    def __init__(
+        self, dictionary: Mapping[str, str], key_filter: MembershipFilter
+    ) -> None:
+        self._dictionary = dictionary
+        self._filter = key_filter
+
+    def _lookup(self, key: str) -> str | None:
+        if key not in self._filter:
+            return None
+        return self._dictionary.get(key)
+
+    def get_many(self, keys: Iterable[str]) -> list[str | None]:
+        keys = list(keys)
+        key_filter = self._filter
+        candidates = [key for key in keys if key in key_filter]
+        found = dict(zip(candidates, get_many(self._dictionary, candidates)))
+        return [found.get(key) for key in keys]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._dictionary)
+
+    def __len__(self) -> int:
+        return len(self._dictionary)
+
+    def nbytes(self) -> int:
+        return _dictionary_nbytes(self._dictionary) + self._filter.nbytes()
+
+
+class PrefilteredDictionaryFactory(DictionaryFactory):
+    """Wraps another factory, putting a negative-lookup filter in front of
+    every dictionary it serves.
+
+    The filter of a language is built from the keys of its dictionary on
+    first use (about 1.2 bytes per key) and kept for the factory's lifetime:
+    the key set does not change when the wrapped factory evicts and reloads
+    the dictionary. Results are unchanged, only misses get cheaper.
+    """
+
+    __slots__ = ["_dictionary_factory", "_filters"]
+
+    def __init__(self, dictionary_factory: DictionaryFactory) -> None:
+        """
+        Args:
+            dictionary_factory (DictionaryFactory): The factory to wrap, best
+                one with costly misses such as `StreamDictionaryFactory`.
+        """
+        self._dictionary_factory = dictionary_factory
+        self._filters: dict[str, MembershipFilter] = {}
+
+    def get_dictionary(
+        self,
+        lang: str,
+    ) -> Mapping[str, str]:
+        """
+        Get the wrapped factory's dictionary for `lang`, behind its filter.
+
+        Args:
+            lang (str): The language code.
+
+        Returns:
+            Mapping[str, str]: The filtered dictionary view.
+
+        Raises:
+            ValueError: If the language is not supported.
+        """
+        dictionary = self._dictionary_factory.get_dictionary(lang)
+        key_filter = self._filters.get(lang)
+        if key_filter is None:
+            key_filter = self._filters[lang] = MembershipFilter.from_keys(
+                dictionary, len(dictionary), key_hash=hash
+            )
+        # a fresh view per call: holding one would pin an evicted dictionary
+        return PrefilteredMap(dictionary, key_filter)
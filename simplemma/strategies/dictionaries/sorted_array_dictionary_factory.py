@@ -0,0 +1,165 @@
+"""`DictionaryFactory` backed by sorted keys packed into one byte arena.
+
+Sits between `DefaultDictionaryFactory` (one Python object per key and value)
+and `StreamDictionaryFactory` (front-code decoding on every lookup): each
+language is decoded once into a contiguous arena of sorted keys and one of
+their values, addressed through `array` offset tables. A language costs
+little more than its decompressed size, and a lookup is a binary search over
+the arena with no decoding. Sorted order also answers prefix and range
+queries, which the hash-based backends cannot.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Mapping
+
+from . import frontcode
+from .dictionary_factory import (
+    CachingDictionaryFactory,
+    DecodedStrMapping,
+    _read_decompressed,
+)
+
+
+def build_sorted_arrays(
+    data: bytes,
+) -> "tuple[bytes, array[int], bytes, array[int]]":
+    """Decode decompressed front-coded `data` into (key arena, key offsets,
+    value arena, value offsets), keys in ascending byte order."""
+    reverse_key, count, pos = frontcode.read_header(data)
+    records = frontcode.iter_records(data, pos)
+    if reverse_key:
+        # stored order sorts the reversed keys: restore the keys, then sort
+        items: Iterable[tuple[bytes, bytes]] = sorted(
+            (stored_key[::-1], stored_value[::-1])
+            for _, stored_key, stored_value in records
+        )
+    else:
+        items = ((stored_key, stored_value) for _, stored_key, stored_value in records)
+
+    key_offsets = array("I", [0])
+    value_offsets = array("I", [0])
+    key_arena = bytearray()
+    value_arena = bytearray()
+    for key, value in items:
+        key_arena += key
+        value_arena += value
+        key_offsets.append(len(key_arena))
+        value_offsets.append(len(value_arena))
+    if len(key_offsets) - 1 != count:
+        raise ValueError(frontcode._CORRUPT_STREAM_MSG)
+    return bytes(key_arena), key_offsets, bytes(value_arena), value_offsets
+
+
+class SortedArrayMap(DecodedStrMapping):
+    """Read-only str->str view over sorted keys and their values, each packed
+    into a byte arena (see the module docstring)."""
+
+    __slots__ = ("_keys", "_key_offsets", "_values", "_value_offsets", "_count")
+
+    def __init__(
+        self,
+        keys: bytes,
+        key_offsets: "array[int]",
+        values: bytes,
+        value_offsets: "array[int]",
+    ) -> None:
+        self._keys = keys
+        self._key_offsets = key_offsets
+        self._values = values
+        self._value_offsets = value_offsets
+        self._count = len(key_offsets) - 1
+
+    def _key_at(self, index: int) -> bytes:
+        key_offsets = self._key_offsets
+        return self._keys[key_offsets[index] : key_offsets[index + 1]]
+
+    def _value_at(self, index: int) -> str:
+        value_offsets = self._value_offsets
+        return self._values[value_offsets[index] : value_offsets[index + 1]].decode()
+
+    def _prefix_range(self, prefix: bytes, lo: int, hi: int) -> tuple[int, int]:
+        """Indexes [start, end) of the keys within [lo, hi) starting with
+        `prefix`."""
+        start = bisect_left(range(self._count), prefix, lo, hi, key=self._key_at)
+        end = bisect_right(
+            range(self._count),
+            prefix,
+            start,
+            hi,
+            key=lambda index: self._key_at(index)[: len(prefix)],
+        )
+        return start, end
+
+    def _lookup(self, key: str) -> str | None:
+        target = key.encode()
+        index = bisect_left(range(self._count), target, key=self._key_at)
+        if index == self._count or self._key_at(index) != target:
+            return None
+        return self._value_at(index)
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self._key_at(index).decode()
+
+    def prefixes_of(self, text: str) -> list[str]:
+        # the keys extending text[:end] are a subrange of those extending
+        # text[:end - 1]: each search narrows the previous one
+        found = []
+        lo, hi = 0, self._count
+        for end in range(1, len(text) + 1):
+            target = text[:end].encode()
+            lo, hi = self._prefix_range(target, lo, hi)
+            if lo == hi:
+                break
+            if self._key_at(lo) == target:
+                found.append(text[:end])
+        return found
+
+    def keys_with_prefix(self, prefix: str) -> Iterator[str]:
+        """The keys starting with `prefix`, in ascending byte order."""
+        start, end = self._prefix_range(prefix.encode(), 0, self._count)
+        for index in range(start, end):
+            yield self._key_at(index).decode()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def nbytes(self) -> int:
+        tables = (self._key_offsets, self._value_offsets)
+        return (
+            len(self._keys)
+            + len(self._values)
+            + sum(table.itemsize * len(table) for table in tables)
+        )
+
+
+class SortedArrayDictionaryFactory(CachingDictionaryFactory):
+    """`DictionaryFactory` backed by sorted byte arenas searched by bisection.
+
+    Memory close to `PerfectHashDictionaryFactory`'s with no build step to
+    cache on disk: loading costs the same single decode pass as
+    `DefaultDictionaryFactory`. Lookups are O(log n), slower than a hash but
+    without `StreamDictionaryFactory`'s per-lookup decoding.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self,
+        cache_max_size: int = 8,
+        cache_max_bytes: int | None = None,
+        pinned: Iterable[str] = (),
+    ) -> None:
+        """Initialize the SortedArrayDictionaryFactory.
+
+        Args:
+            cache_max_size (int): The maximum number of dictionaries to
+                keep in memory. Defaults to `8`.
+            cache_max_bytes (int | None), pinned (Iterable[str]): See
+                `CachingDictionaryFactory`.
+        """
+        super().__init__(cache_max_size, cache_max_bytes, pinned)
+
+    def _get_dictionary_uncached(self, lang: str) -> Mapping[str, str]:
+        return SortedArrayMap(*build_sorted_arrays(_read_decompressed(lang)))
@@ -4,50 +4,266 @@ directly instead of building a full `dict[bytes, bytes]` in RAM.
 Front-coding is sequential, so random access needs restart points: one pass
 builds a sparse per-block seed index, then each lookup bisects to a block and
 decodes only its few records. Trades RAM for lookup speed; see README.
+
+The index can be persisted as a versioned sidecar (opt-in `use_disk_cache`),
+so later starts pay only the lzma decompression, not the full linear decode.
+
+A language shipped as an SMFC2 block container is served by `BlockStreamMap`
+instead: only the compressed container stays resident, and a lookup
+decompresses just the block it lands in.
 """
 
-from bisect import bisect_right
-from collections.abc import Iterator, Mapping
+import sys
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from itertools import islice
+from pathlib import Path
+from zlib import crc32
+
+from simplemma.__metadata__ import __version__ as SIMPLEMMA_VERSION
 
 from . import frontcode
 from .dictionary_factory import (
     CachingDictionaryFactory,
     DecodedStrMapping,
+    _check_supported,
+    _load_or_build_cache,
     _read_decompressed,
+    _read_shipped,
+    _ships_block_container,
+    _user_cache_dir,
 )
 
+
 _BLOCK_SIZE = 32
+# default memory cap on the decoded blocks kept per block container; plain
+# streams keep none unless asked to, their blocks being cheap to rescan
+_DECODED_BYTES = 1 << 20
+
+INDEX_MAGIC = b"SMIX1"
+
+# (first stored key per block, (offset, prev_key, prev_value) seed per block)
+_Index = tuple[list[bytes], list[tuple[int, bytes, bytes]]]
+
+
+def _build_index(data: bytes, pos: int, count: int) -> _Index:
+    """One full pass over the stream, keeping a resume seed every block."""
+    firsts: list[bytes] = []
+    blocks: list[tuple[int, bytes, bytes]] = []
+    prev_key, prev_value = b"", b""
+    index = -1
+    for index, (record_start, stored_key, stored_value) in enumerate(
+        frontcode.iter_records(data, pos)
+    ):
+        if index % _BLOCK_SIZE == 0:
+            firsts.append(stored_key)
+            blocks.append((record_start, prev_key, prev_value))
+        prev_key, prev_value = stored_key, stored_value
+    # catches a stream ending on a boundary with the wrong record count
+    if index + 1 != count:
+        raise ValueError(frontcode._CORRUPT_STREAM_MSG)
+    return firsts, blocks
+
+
+def _index_nbytes(firsts: list[bytes], blocks: list[tuple[int, bytes, bytes]]) -> int:
+    """Estimated resident size of a block index, in bytes."""
+    return (
+        sys.getsizeof(firsts)
+        + sys.getsizeof(blocks)
+        + sum(map(sys.getsizeof, firsts))
+        + sum(
+            sys.getsizeof(seed) + sys.getsizeof(seed[1]) + sys.getsizeof(seed[2])
+            for seed in blocks
+        )
+    )
+
+
+def _write_bytes_field(buf: bytearray, value: bytes) -> None:
+    frontcode._write_varint(buf, len(value))
+    buf += value
+
+
+def _read_bytes_field(blob: bytes, pos: int) -> tuple[bytes, int]:
+    length, pos = frontcode._read_varint(blob, pos)
+    end = pos + length
+    if end > len(blob):
+        raise ValueError("truncated stream index")
+    return blob[pos:end], end
+
+
+def dump_index(data: bytes, index: _Index) -> bytes:
+    """Serialize the block index of `data`, fingerprinted by the stream's
+    length and crc32 so a sidecar is never applied to another stream."""
+    firsts, blocks = index
+    buf = bytearray(INDEX_MAGIC)
+    for value in (_BLOCK_SIZE, len(data), crc32(data), len(blocks)):
+        frontcode._write_varint(buf, value)
+    for first, (offset, prev_key, prev_value) in zip(firsts, blocks):
+        frontcode._write_varint(buf, offset)
+        _write_bytes_field(buf, first)
+        _write_bytes_field(buf, prev_key)
+        _write_bytes_field(buf, prev_value)
+    return bytes(buf)
+
+
+def load_index(blob: bytes, data: bytes) -> _Index:
+    """Inverse of `dump_index`; ValueError if `blob` is corrupt, from another
+    format version or block size, or does not belong to `data`."""
+    if blob[: len(INDEX_MAGIC)] != INDEX_MAGIC:
+        raise ValueError("not a stream index")
+    try:
+        pos = len(INDEX_MAGIC)
+        header = []
+        for _ in range(4):
+            value, pos = frontcode._read_varint(blob, pos)
+            header.append(value)
+        block_size, data_len, checksum, nblocks = header
+        if block_size != _BLOCK_SIZE or data_len != len(data):
+            raise ValueError("stream index does not match the stream")
+        if checksum != crc32(data):
+            raise ValueError("stream index does not match the stream")
+
+        firsts: list[bytes] = []
+        blocks: list[tuple[int, bytes, bytes]] = []
+        for _ in range(nblocks):
+            offset, pos = frontcode._read_varint(blob, pos)
+            first, pos = _read_bytes_field(blob, pos)
+            prev_key, pos = _read_bytes_field(blob, pos)
+            prev_value, pos = _read_bytes_field(blob, pos)
+            firsts.append(first)
+            blocks.append((offset, prev_key, prev_value))
+    except IndexError:
+        # a truncated varint overruns the buffer
+        raise ValueError("truncated stream index") from None
+    if pos != len(blob):
+        raise ValueError("truncated stream index")
+    return firsts, blocks
+
+
+# (sorted stored keys, stored values, estimated size) of a decoded block
+_DecodedBlock = tuple[list[bytes], list[bytes], int]
+# block -> (sorted stored keys, stored values)
+_Decoder = Callable[[int], tuple[list[bytes], list[bytes]]]
+
+
+class _BlockCache:
+    """Decoded blocks of one map, kept in an lru bounded by their estimated
+    size in bytes; `0` keeps none."""
+
+    __slots__ = ("_blocks", "_seen", "_nbytes", "_max_bytes", "_lock")
+
+    def __init__(self, max_bytes: int) -> None:
+        self._blocks: OrderedDict[int, _DecodedBlock] = OrderedDict()
+        # blocks missed once recently, not (yet) decoded (see `get_if_hot`)
+        self._seen: OrderedDict[int, None] = OrderedDict()
+        self._nbytes = 0
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get(self, block: int, decode: _Decoder) -> _DecodedBlock:
+        """Decoded `block`, from the cache or by `decode`."""
+        if not self._max_bytes:
+            return _sized(*decode(block))
+        with self._lock:
+            decoded = self._blocks.get(block)
+            if decoded is not None:
+                self._blocks.move_to_end(block)
+                return decoded
+        return self._add(block, decode)
+
+    def get_if_hot(self, block: int, decode: _Decoder) -> _DecodedBlock | None:
+        """Like `get`, but None on a block's first recent miss: it is only
+        decoded and kept on its second one, so that one-off lookups keep the
+        caller's cheaper early-exit scan and don't flush the hot blocks."""
+        if not self._max_bytes:
+            return None
+        with self._lock:
+            decoded = self._blocks.get(block)
+            if decoded is not None:
+                self._blocks.move_to_end(block)
+                return decoded
+            if block not in self._seen:
+                self._seen[block] = None
+                while len(self._seen) > 4 * len(self._blocks) + 64:
+                    self._seen.popitem(last=False)
+                return None
+            del self._seen[block]
+        return self._add(block, decode)
+
+    def _add(self, block: int, decode: _Decoder) -> _DecodedBlock:
+        decoded = _sized(*decode(block))
+        with self._lock:
+            if block not in self._blocks:
+                self._blocks[block] = decoded
+                self._nbytes += decoded[2]
+            while self._nbytes > self._max_bytes:
+                self._nbytes -= self._blocks.popitem(last=False)[1][2]
+        return decoded
+
+    def nbytes(self) -> int:
+        """Estimated size of the cached blocks, in bytes."""
+        with self._lock:
+            return self._nbytes
+
+
+def _sized(keys: list[bytes], values: list[bytes]) -> _DecodedBlock:
+    nbytes = (
+        sys.getsizeof(keys)
+        + sys.getsizeof(values)
+        + sum(map(sys.getsizeof, keys))
+        + sum(map(sys.getsizeof, values))
+    )
+    return keys, values, nbytes
 
 
 class StreamMap(DecodedStrMapping):
     """Read-only str->str view over a front-coded stream, decoded on demand.
 
     `_firsts` holds each block's first key (for bisect); `_blocks` its
-    (offset, prev_key, prev_value) resume seed.
+    (offset, prev_key, prev_value) resume seed. Decoded blocks are kept in
+    a `_BlockCache`, so that the blocks hit again and again under realistic
+    (Zipfian) traffic are decoded once.
     """
 
-    __slots__ = ("_data", "_pos", "_rev", "_count", "_firsts", "_blocks")
+    __slots__ = ("_data", "_pos", "_rev", "_count", "_firsts", "_blocks", "_cache")
 
-    def __init__(self, lang: str) -> None:
+    def __init__(
+        self,
+        lang: str,
+        index_path: Path | None = None,
+        block_cache_bytes: int = 0,
+    ) -> None:
+        """Load the stream for `lang`; with `index_path`, reuse the block
+        index persisted there, or build and persist it if missing or stale.
+        `block_cache_bytes` caps the decoded blocks kept (0 keeps none)."""
         self._data = _read_decompressed(lang)
         self._rev, self._count, self._pos = frontcode.read_header(self._data)
 
-        firsts: list[bytes] = []
-        blocks: list[tuple[int, bytes, bytes]] = []
-        prev_key, prev_value = b"", b""
-        index = -1
-        for index, (record_start, stored_key, stored_value) in enumerate(
-            frontcode.iter_records(self._data, self._pos)
+        if index_path is None:
+            index = _build_index(self._data, self._pos, self._count)
+        else:
+            index = _load_or_build_cache(
+                index_path,
+                lambda path: load_index(path.read_bytes(), self._data),
+                lambda: _build_index(self._data, self._pos, self._count),
+                lambda index: (dump_index(self._data, index),),
+                lambda index: index,
+                f"stream index for {lang}",
+            )
+        self._firsts, self._blocks = index
+        self._cache = _BlockCache(block_cache_bytes)
+
+    def _decode_block(self, block: int) -> tuple[list[bytes], list[bytes]]:
+        keys: list[bytes] = []
+        values: list[bytes] = []
+        for _, stored_key, stored_value in islice(
+            frontcode.iter_records(self._data, *self._blocks[block]), _BLOCK_SIZE
         ):
-            if index % _BLOCK_SIZE == 0:
-                firsts.append(stored_key)
-                blocks.append((record_start, prev_key, prev_value))
-            prev_key, prev_value = stored_key, stored_value
-        # catches a stream ending on a boundary with the wrong record count
-        if index + 1 != self._count:
-            raise ValueError(frontcode._CORRUPT_STREAM_MSG)
-        self._firsts = firsts
-        self._blocks = blocks
+            keys.append(stored_key)
+            values.append(stored_value)
+        return keys, values
 
     def _lookup(self, key: str) -> str | None:
         target = key.encode()
@@ -58,6 +274,15 @@ class StreamMap(DecodedStrMapping):
         if block < 0:
             return None
 
+        decoded = self._cache.get_if_hot(block, self._decode_block)
+        if decoded is not None:
+            keys, values, _ = decoded
+            index = bisect_left(keys, target)
+            if index == len(keys) or keys[index] != target:
+                return None
+            value = values[index]
+            return (value[::-1] if self._rev else value).decode()
+
         # sorted keys bound the scan: the next block's first key exceeds target
         for _, stored_key, stored_value in frontcode.iter_records(
             self._data, *self._blocks[block]
@@ -74,14 +299,193 @@ class StreamMap(DecodedStrMapping):
             key = stored_key[::-1] if self._rev else stored_key
             yield key.decode()
 
+    def get_many(self, keys: Iterable[str]) -> list[str | None]:
+        # one merge pass of the sorted targets against the blocks they fall
+        # in: each block is decoded once, and only up to its last target
+        keys = list(keys)
+        targets: dict[str, bytes] = {}
+        for key in keys:
+            target = key.encode()
+            targets[key] = target[::-1] if self._rev else target
+        order = sorted(set(targets.values()))
+        found: dict[bytes, str] = {}
+        firsts = self._firsts
+        count, position, block = len(order), 0, 0
+        while position < count:
+            block = bisect_right(firsts, order[position], block) - 1
+            if block < 0:  # sorts before the first key
+                position += 1
+                block = 0
+                continue
+            # the next block's first key bounds this block's targets
+            limit = firsts[block + 1] if block + 1 < len(firsts) else None
+            for _, stored_key, stored_value in islice(
+                frontcode.iter_records(self._data, *self._blocks[block]), _BLOCK_SIZE
+            ):
+                while position < count and order[position] < stored_key:
+                    position += 1
+                if position == count or (
+                    limit is not None and order[position] >= limit
+                ):
+                    break
+                if order[position] == stored_key:
+                    value = stored_value[::-1] if self._rev else stored_value
+                    found[stored_key] = value.decode()
+                    position += 1
+            while position < count and (limit is None or order[position] < limit):
+                position += 1
+        return [found.get(targets[key]) for key in keys]
+
+    def prefixes_of(self, text: str) -> list[str]:
+        # group the candidate prefixes by block: each block is decoded once
+        by_block: dict[int, dict[bytes, str]] = {}
+        for end in range(1, len(text) + 1):
+            target = text[:end].encode()
+            if self._rev:
+                target = target[::-1]
+            block = bisect_right(self._firsts, target) - 1
+            if block >= 0:
+                by_block.setdefault(block, {})[target] = text[:end]
+
+        found = []
+        for block, targets in by_block.items():
+            last = max(targets)
+            for _, stored_key, _ in frontcode.iter_records(
+                self._data, *self._blocks[block]
+            ):
+                if stored_key in targets:
+                    found.append(targets[stored_key])
+                if stored_key >= last:
+                    break
+        return sorted(found, key=len)
+
     def __len__(self) -> int:
         return self._count
 
+    def nbytes(self) -> int:
+        return (
+            len(self._data)
+            + _index_nbytes(self._firsts, self._blocks)
+            + self._cache.nbytes()
+        )
+
+
+class BlockStreamMap(DecodedStrMapping):
+    """Read-only str->str view over an SMFC2 block container.
+
+    Only the compressed container and its directory stay resident; a lookup
+    bisects the directory, then decompresses and decodes that one block,
+    keeping the most recently used ones in a `_BlockCache`.
+    """
+
+    __slots__ = ("_data", "_directory", "_cache")
+
+    def __init__(self, data: bytes, block_cache_bytes: int = _DECODED_BYTES) -> None:
+        """`block_cache_bytes` caps the decoded blocks kept (0 keeps none)."""
+        self._data = data
+        self._directory = frontcode.read_block_directory(data)
+        self._cache = _BlockCache(block_cache_bytes)
+
+    def _decode_block(self, block: int) -> tuple[list[bytes], list[bytes]]:
+        keys: list[bytes] = []
+        values: list[bytes] = []
+        raw = frontcode.decompress_block(self._data, self._directory, block)
+        for _, stored_key, stored_value in frontcode.iter_records(raw, 0):
+            keys.append(stored_key)
+            values.append(stored_value)
+        if len(keys) != self._directory.counts[block]:
+            raise ValueError(frontcode._CORRUPT_STREAM_MSG)
+        return keys, values
+
+    def _lookup(self, key: str) -> str | None:
+        target = key.encode()
+        reverse_key = self._directory.reverse_key
+        if reverse_key:
+            target = target[::-1]
+
+        block = bisect_right(self._directory.firsts, target) - 1
+        if block < 0:
+            return None
+        keys, values, _ = self._cache.get(block, self._decode_block)
+        index = bisect_left(keys, target)
+        if index == len(keys) or keys[index] != target:
+            return None
+        value = values[index]
+        return (value[::-1] if reverse_key else value).decode()
+
+    def __iter__(self) -> Iterator[str]:
+        reverse_key = self._directory.reverse_key
+        for block in range(len(self._directory.spans)):
+            # straight decode: a full sweep must not flush the hot blocks
+            for stored_key in self._decode_block(block)[0]:
+                key = stored_key[::-1] if reverse_key else stored_key
+                yield key.decode()
+
+    def __len__(self) -> int:
+        return self._directory.record_count
+
+    def nbytes(self) -> int:
+        return (
+            len(self._data)
+            + sum(map(sys.getsizeof, self._directory.firsts))
+            + self._cache.nbytes()
+        )
+
 
 class StreamDictionaryFactory(CachingDictionaryFactory):
     """`DictionaryFactory` backed by direct front-coded stream reads."""
 
-    __slots__ = ()
+    __slots__ = ("_cache_dir", "_use_disk_cache", "_block_cache_bytes")
+
+    def __init__(
+        self,
+        cache_max_size: int = 8,
+        use_disk_cache: bool = False,
+        disk_cache_dir: str | None = None,
+        cache_max_bytes: int | None = None,
+        pinned: Iterable[str] = (),
+        block_cache_bytes: int | None = None,
+    ) -> None:
+        """Initialize the StreamDictionaryFactory.
+
+        Args:
+            cache_max_size (int): The maximum number of dictionaries to
+                keep in memory. Defaults to `8`.
+            use_disk_cache (bool): Whether to persist each language's block
+                index on disk, skipping the full decode pass on later starts.
+                Defaults to `False`.
+            disk_cache_dir (str | None): Path where the block indexes
+                should be stored in. Defaults to a Simplemma-specific
+                subdirectory of the user's cache directory.
+            cache_max_bytes (int | None), pinned (Iterable[str]): See
+                `CachingDictionaryFactory`.
+            block_cache_bytes (int | None): Estimated memory of the decoded
+                blocks each dictionary keeps for repeated lookups; `0`
+                decodes on every lookup. Defaults to `None`: none for plain
+                streams, 1 MiB for SMFC2 block containers, whose blocks
+                must be decompressed to be read.
+        """
+        if block_cache_bytes is not None and block_cache_bytes < 0:
+            raise ValueError("block_cache_bytes must not be negative")
+        if disk_cache_dir:
+            self._cache_dir = Path(disk_cache_dir)
+        else:
+            self._cache_dir = _user_cache_dir() / "stream_index" / SIMPLEMMA_VERSION
+        self._use_disk_cache = use_disk_cache
+        self._block_cache_bytes = block_cache_bytes
+        super().__init__(cache_max_size, cache_max_bytes, pinned)
 
     def _get_dictionary_uncached(self, lang: str) -> Mapping[str, str]:
-        return StreamMap(lang)
+        if _ships_block_container(lang):
+            # the directory is the index: nothing to persist
+            block_cache_bytes = self._block_cache_bytes
+            if block_cache_bytes is None:
+                block_cache_bytes = _DECODED_BYTES
+            return BlockStreamMap(_read_shipped(lang), block_cache_bytes)
+        if not self._use_disk_cache:
+            return StreamMap(lang, block_cache_bytes=self._block_cache_bytes or 0)
+        # validate before the code becomes part of a cache path
+        _check_supported(lang)
+        return StreamMap(
+            lang, self._cache_dir / f"{lang}.idx", self._block_cache_bytes or 0
+        )
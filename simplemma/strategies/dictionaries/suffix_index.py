@@ -0,0 +1,83 @@
+"""Reversed-key suffix index: which dictionary keys end a token, in one walk.
+
+Each language's keys are folded with `lookup_fold`, reversed and stored in a
+MARISA-trie, so the keys that are suffixes of a token are the trie prefixes
+of its reversed fold. The fold is applied character by character, so the
+fold of any tail of a token is a tail of the token's fold, and every probe
+dictionary lookups derive from a tail (case, apostrophe and hy-mark
+variants) folds to that same string: the index never misses a tail a
+lookup could resolve.
+
+Requires the optional `marisa-trie` dependency.
+"""
+
+from collections.abc import Mapping
+
+try:
+    from marisa_trie import Trie
+
+    _TRIE_DEPS_AVAILABLE = True
+except ImportError:
+    _TRIE_DEPS_AVAILABLE = False
+
+from ...utils import lookup_fold
+from .dictionary_factory import DEFAULT_DICTIONARY_FACTORY, DictionaryFactory
+
+
+def _build_suffix_trie(dictionary: Mapping[str, str]) -> "Trie":
+    return Trie(lookup_fold(key)[::-1] for key in dictionary)
+
+
+class SuffixIndex:
+    """Per-language tries of reversed, folded dictionary keys.
+
+    A language's trie is built from its dictionary on first use (a few
+    seconds and MB for the largest languages) and kept for the index's
+    lifetime.
+    """
+
+    __slots__ = ["_dictionary_factory", "_tries"]
+
+    def __init__(
+        self, dictionary_factory: DictionaryFactory = DEFAULT_DICTIONARY_FACTORY
+    ) -> None:
+        """
+        Args:
+            dictionary_factory (DictionaryFactory): The factory whose
+                dictionaries are indexed. Defaults to the shared
+                `DEFAULT_DICTIONARY_FACTORY`.
+
+        Raises:
+            ImportError: If `marisa-trie` is not installed.
+        """
+        if not _TRIE_DEPS_AVAILABLE:
+            raise ImportError("Package not installed: marisa_trie")
+        self._dictionary_factory = dictionary_factory
+        self._tries: dict[str, Trie] = {}
+
+    def suffix_lengths(self, token: str, lang: str) -> set[int]:
+        """Lengths `n` for which `token[-n:]` folds like a dictionary key.
+
+        A superset of the tails dictionary lookups resolve: confirm each
+        with a lookup, longest first for the "longest dictionary suffix".
+
+        Raises:
+            ValueError: If the language is not supported.
+        """
+        trie = self._tries.get(lang)
+        if trie is None:
+            dictionary = self._dictionary_factory.get_dictionary(lang)
+            trie = self._tries[lang] = _build_suffix_trie(dictionary)
+        matches = {len(prefix) for prefix in trie.prefixes(lookup_fold(token)[::-1])}
+        if not matches:
+            return set()
+        if token.isascii():  # folding keeps ASCII lengths
+            return {length for length in matches if length <= len(token)}
+        # folded length of each tail, since folding can drop or expand chars
+        lengths = set()
+        folded_len = 0
+        for length, char in enumerate(reversed(token), 1):
+            folded_len += len(lookup_fold(char))
+            if folded_len in matches:
+                lengths.add(length)
+        return lengths
@@ -1,10 +1,10 @@
 import logging
+import os
 from pathlib import Path
-from collections.abc import Iterator, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 
 try:
     from marisa_trie import BytesTrie, HUGE_CACHE
-    from platformdirs import user_cache_dir
 
     _TRIE_DEPS_AVAILABLE = True
 except ImportError:
@@ -15,35 +15,94 @@ except ImportError:
 
 
 from simplemma.__metadata__ import __version__ as SIMPLEMMA_VERSION
+from simplemma.strategies.dictionaries import frontcode
 from simplemma.strategies.dictionaries.dictionary_factory import (
     CachingDictionaryFactory,
     DecodedStrMapping,
     SUPPORTED_LANGUAGES,
-    _load_dictionary_from_disk,
+    _atomic_write,
+    _check_supported,
+    _load_or_build_cache,
+    _read_decompressed,
+    _user_cache_dir,
+    _worker_pool,
 )
 
 logger = logging.getLogger(__name__)
 
 
+def _build_trie_from_stream(lang: str) -> BytesTrie:
+    """Build the trie for `lang` straight from its front-coded stream.
+
+    Records are fed to `BytesTrie` as they are decoded: no intermediate
+    `dict[bytes, bytes]` or list of `str` keys is held next to the trie.
+    """
+    data = _read_decompressed(lang)
+    reverse_key, count, pos = frontcode.read_header(data)
+    decoded = 0
+
+    def items() -> Iterator[tuple[str, bytes]]:
+        nonlocal decoded
+        for _, stored_key, stored_value in frontcode.iter_records(data, pos):
+            decoded += 1
+            if reverse_key:
+                yield stored_key[::-1].decode(), stored_value[::-1]
+            else:
+                yield stored_key.decode(), stored_value
+
+    trie = BytesTrie(items(), cache_size=HUGE_CACHE)
+    if decoded != count:
+        raise ValueError(frontcode._CORRUPT_STREAM_MSG)
+    return trie
+
+
+def _save_trie(trie: BytesTrie, target: Path) -> None:
+    """Save `trie` to `target` atomically, so processes opening or mapping
+    `target` never see a partial trie."""
+    _atomic_write(target, trie.save)
+
+
+def _build_trie_file(lang: str, target: Path) -> None:
+    """Process-pool worker for `TrieDictionaryFactory.build_disk_cache`."""
+    _save_trie(_build_trie_from_stream(lang), target)
+
+
 class TrieWrapDict(DecodedStrMapping):
     """Read-only Mapping view over a BytesTrie (values decoded on access)."""
 
-    __slots__ = ("_trie",)
+    __slots__ = ("_trie", "_nbytes")
 
-    def __init__(self, trie: BytesTrie) -> None:
+    def __init__(self, trie: BytesTrie, nbytes: int | None = None) -> None:
+        """`nbytes` is the serialized size of `trie`, e.g. that of the file it
+        was loaded from; measured once here if not given."""
         self._trie = trie
+        # the serialized trie is its in-memory layout, minus the lookup cache
+        self._nbytes = len(trie.tobytes()) if nbytes is None else nbytes
 
     def _lookup(self, key: str) -> str | None:
         # str(): the untyped trie returns Any; mypy needs the concrete type.
         value = self._trie.get(key)
         return str(value[0].decode()) if value else None
 
+    def get_many(self, keys: Iterable[str]) -> list[str | None]:
+        # marisa has no batch lookup: keep the per-key loop tight
+        get = self._trie.get
+        values = [get(key) for key in keys]
+        return [str(value[0].decode()) if value else None for value in values]
+
     def __iter__(self) -> Iterator[str]:
         yield from self._trie.iterkeys()
 
+    def prefixes_of(self, text: str) -> list[str]:
+        # one walk down the trie
+        return [str(prefix) for prefix in self._trie.prefixes(text)]
+
     def __len__(self) -> int:
         return len(self._trie)
 
+    def nbytes(self) -> int:
+        return self._nbytes
+
 
 class TrieDictionaryFactory(CachingDictionaryFactory):
     """Memory optimized DictionaryFactory backed by MARISA-tries.
@@ -54,13 +113,16 @@ class TrieDictionaryFactory(CachingDictionaryFactory):
     lookup performance isn't as good as with dicts.
     """
 
-    __slots__ = ("_cache_dir", "_use_disk_cache")
+    __slots__ = ("_cache_dir", "_use_disk_cache", "_use_mmap")
 
     def __init__(
         self,
         cache_max_size: int = 8,
         use_disk_cache: bool = True,
         disk_cache_dir: str | None = None,
+        cache_max_bytes: int | None = None,
+        pinned: Iterable[str] = (),
+        use_mmap: bool = False,
     ) -> None:
         """Initialize the TrieDictionaryFactory.
 
@@ -72,6 +134,12 @@ class TrieDictionaryFactory(CachingDictionaryFactory):
             disk_cache_dir (str | None): Path where the generated
                 tries should be stored in. Defaults to a Simplemma-
                 specific subdirectory of the user's cache directory.
+            cache_max_bytes (int | None), pinned (Iterable[str]): See
+                `CachingDictionaryFactory`.
+            use_mmap (bool): Whether to memory-map the cached tries
+                instead of reading them into memory, so that processes
+                share one copy through the page cache. Requires
+                `use_disk_cache`. Defaults to `False`.
         """
 
         if not _TRIE_DEPS_AVAILABLE:
@@ -82,19 +150,33 @@ class TrieDictionaryFactory(CachingDictionaryFactory):
         if disk_cache_dir:
             self._cache_dir = Path(disk_cache_dir)
         else:
-            self._cache_dir = (
-                Path(user_cache_dir("simplemma")) / "marisa_trie" / SIMPLEMMA_VERSION
-            )
+            self._cache_dir = _user_cache_dir() / "marisa_trie" / SIMPLEMMA_VERSION
+        if use_mmap and not use_disk_cache:
+            raise ValueError("use_mmap requires use_disk_cache=True")
         self._use_disk_cache = use_disk_cache
-        super().__init__(cache_max_size)
+        self._use_mmap = use_mmap
+        super().__init__(cache_max_size, cache_max_bytes, pinned)
+
+    def _open_trie(self, path: Path) -> TrieWrapDict:
+        """Load or, with `use_mmap`, map the cached trie at `path`.
+
+        Raises:
+            ValueError: If `path` does not hold a trie.
+        """
+        try:
+            if self._use_mmap:
+                trie = BytesTrie().mmap(str(path))
+            else:
+                trie = BytesTrie().load(str(path))
+        except RuntimeError as error:
+            # marisa reports format errors as RuntimeError
+            raise ValueError(f"not a trie: {path}") from error
+        # sized from the file: measuring a mapped trie would copy it
+        return TrieWrapDict(trie, path.stat().st_size)
 
     def _build_trie(self, lang: str) -> BytesTrie:
         """Build a trie from the shipped dictionary for `lang`."""
-        raw = _load_dictionary_from_disk(lang)
-        return BytesTrie(
-            ((k.decode(), v) for k, v in raw.items()),
-            cache_size=HUGE_CACHE,
-        )
+        return _build_trie_from_stream(lang)
 
     def _write_trie_to_disk(self, lang: str, trie: BytesTrie) -> None:
         """Persist the trie to disk for later usage.
@@ -103,30 +185,65 @@ class TrieDictionaryFactory(CachingDictionaryFactory):
         loading times.
         """
         logger.debug("Caching trie on disk. This might take a second.")
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
-        target = self._cache_dir / f"{lang}.dic"
-        try:
-            trie.save(target)
-        except Exception:
-            target.unlink(missing_ok=True)
-            raise
+        _save_trie(trie, self._cache_dir / f"{lang}.dic")
+
+    def build_disk_cache(
+        self, langs: Iterable[str], processes: int | None = None
+    ) -> None:
+        """Build the on-disk tries for `langs` in parallel worker processes.
+
+        Trie construction is CPU-bound and holds the GIL, so threads would
+        not help. Languages whose trie is already cached are skipped; the
+        tries are loaded from disk on their first use.
+
+        Args:
+            langs (Iterable[str]): The language codes to build.
+            processes (int | None): Number of worker processes. Defaults
+                to one per language, capped at the number of CPUs.
+
+        Raises:
+            ValueError: If the disk cache is disabled or a language is not
+                supported.
+        """
+        if not self._use_disk_cache:
+            raise ValueError("build_disk_cache requires use_disk_cache=True")
+        missing = []
+        for lang in dict.fromkeys(langs):
+            _check_supported(lang)
+            if not (self._cache_dir / f"{lang}.dic").exists():
+                missing.append(lang)
+        if not missing:
+            return
+        if processes is None:
+            processes = min(len(missing), os.cpu_count() or 1)
+        targets = [self._cache_dir / f"{lang}.dic" for lang in missing]
+        if processes <= 1 or len(missing) == 1:
+            for lang, target in zip(missing, targets):
+                _build_trie_file(lang, target)
+            return
+        with _worker_pool(processes) as executor:
+            # list(): re-raise the first worker error here
+            list(executor.map(_build_trie_file, missing, targets))
 
     def _get_dictionary_uncached(self, lang: str) -> Mapping[str, str]:
         if lang not in SUPPORTED_LANGUAGES:
             raise ValueError(f"Unsupported language: {lang}")
 
+        if not self._use_disk_cache:
+            return TrieWrapDict(self._build_trie(lang))
+
         cache_path = self._cache_dir / f"{lang}.dic"
-        if self._use_disk_cache and cache_path.exists():
-            try:
-                return TrieWrapDict(BytesTrie().load(cache_path))
-            except Exception:
-                logger.warning("Corrupt trie cache for %s, regenerating.", lang)
-                cache_path.unlink(missing_ok=True)
-
-        trie = self._build_trie(lang)
-        if self._use_disk_cache:
-            try:
-                self._write_trie_to_disk(lang, trie)
-            except Exception:
-                logger.warning("Failed to cache trie for %s on disk.", lang)
-        return TrieWrapDict(trie)
+        return _load_or_build_cache(
+            cache_path,
+            self._open_trie,
+            lambda: self._build_trie(lang),
+            None,
+            # sized from the written file, when there is one
+            lambda trie: TrieWrapDict(
+                trie, cache_path.stat().st_size if cache_path.exists() else None
+            ),
+            f"trie for {lang}",
+            # with mmap, drop the private copy: serve the shared mapping
+            reload=self._use_mmap,
+            save=lambda trie: self._write_trie_to_disk(lang, trie),
+        )
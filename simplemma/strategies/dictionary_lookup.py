@@ -4,6 +4,7 @@ It provides lemmatization using dictionary lookup.
 """
 
 from ..utils import (
+    CANON_LANGS,
     apostrophe_variants,
     canonicalize_token,
     has_apostrophe,
@@ -12,18 +13,30 @@ from ..utils import (
 )
 from .dictionaries.dictionary_factory import (
     DEFAULT_DICTIONARY_FACTORY,
+    DecodedStrMapping,
     DictionaryFactory,
 )
+from .dictionaries.membership_filter import MembershipFilter
+from .dictionaries.suffix_index import SuffixIndex
 from .lemmatization_strategy import LemmatizationStrategy
 
 
 class DictionaryLookupStrategy(LemmatizationStrategy):
     """Dictionary Lookup Strategy"""
 
-    __slots__ = ["_dictionary_factory"]
+    __slots__ = [
+        "_dictionary_factory",
+        "_folded_filters",
+        "_suffix_index",
+        "_prefix_walk",
+    ]
 
     def __init__(
-        self, dictionary_factory: DictionaryFactory = DEFAULT_DICTIONARY_FACTORY
+        self,
+        dictionary_factory: DictionaryFactory = DEFAULT_DICTIONARY_FACTORY,
+        folded_index: bool = False,
+        suffix_index: bool = False,
+        prefix_walk: bool = False,
     ):
         """
         Initialize the Dictionary Lookup Strategy.
@@ -31,8 +44,28 @@ class DictionaryLookupStrategy(LemmatizationStrategy):
         Args:
             dictionary_factory (DictionaryFactory): The dictionary factory used to obtain language dictionaries.
                 Defaults to the shared `DEFAULT_DICTIONARY_FACTORY`.
+            folded_index (bool): Build an in-process `MembershipFilter` over
+                the keys per language on first use, so that out-of-vocabulary
+                tokens skip the case, apostrophe and hy-mark fallback probes.
+                Same results; costs about 1.2 bytes per dictionary key and
+                one pass over the keys. Defaults to `False`.
+            suffix_index (bool): Keep a `SuffixIndex` so that `suffix_lengths`
+                finds the dictionary tails of a token in one trie walk.
+                Requires `marisa-trie`. Defaults to `False`.
+            prefix_walk (bool): Let `prefix_lengths` list the dictionary
+                prefixes of a token through the backend's `prefixes_of`.
+                Pays off on backends that answer it in one walk (trie,
+                sorted array, FST, stream); with the default dict backend
+                it costs more than the lookups it saves. Defaults to `False`.
         """
         self._dictionary_factory = dictionary_factory
+        # lang -> filter; the key set of a language is fixed for a given
+        # factory, so a filter outlives reloads of an evicted dictionary.
+        self._folded_filters: dict[str, MembershipFilter] | None = (
+            {} if folded_index else None
+        )
+        self._suffix_index = SuffixIndex(dictionary_factory) if suffix_index else None
+        self._prefix_walk = prefix_walk
 
     def get_lemma(self, token: str, lang: str) -> str | None:
         """
@@ -57,6 +90,15 @@ class DictionaryLookupStrategy(LemmatizationStrategy):
         # lookup). Reverse case extends coverage; token[:1] is empty-safe.
         if (result := dictionary.get(token)) is not None:
             return result
+        # one filter check rules out the whole family of variants below
+        if self._folded_filters is not None:
+            folded_filter = self._folded_filters.get(lang)
+            if folded_filter is None:
+                folded_filter = self._folded_filters[lang] = MembershipFilter.from_keys(
+                    dictionary, len(dictionary), key_hash=hash
+                )
+            if token not in folded_filter:
+                return None
         cased = token.lower() if token[:1].isupper() else token.capitalize()
         if (result := dictionary.get(cased)) is not None:
             return result
@@ -80,6 +122,47 @@ class DictionaryLookupStrategy(LemmatizationStrategy):
                 return result
         return None
 
+    def prefix_lengths(self, token: str, lang: str) -> set[int] | None:
+        """Lengths `n` for which `get_lemma(token[:n], lang)` may succeed, from
+        two `prefixes_of` walks (the token and its reverse case) instead of one
+        lookup per prefix. A superset: confirm matches with `get_lemma`.
+
+        None when the probes of a prefix are not prefixes of the token's
+        probes (apostrophe and hy-mark variants, canonicalized languages,
+        length-changing or final-sigma case mappings), without `prefix_walk`,
+        or if the dictionary has no prefix query: then every prefix has to be
+        looked up.
+        """
+        if (
+            not self._prefix_walk
+            or lang in CANON_LANGS
+            or has_apostrophe(token)
+            or "Σ" in token
+            or (lang == "hy" and has_armenian_marks(token))
+        ):
+            return None
+        cased = token.lower() if token[:1].isupper() else token.capitalize()
+        if len(cased) != len(token):
+            return None
+        dictionary = self._dictionary_factory.get_dictionary(lang)
+        if not isinstance(dictionary, DecodedStrMapping):
+            return None
+        return {len(prefix) for prefix in dictionary.prefixes_of(token)} | {
+            len(prefix) for prefix in dictionary.prefixes_of(cased)
+        }
+
+    def suffix_lengths(self, token: str, lang: str) -> set[int] | None:
+        """Lengths `n` for which `get_lemma(token[-n:], lang)` may succeed,
+        in any casing, from one `SuffixIndex` walk. A superset: confirm
+        matches with `get_lemma`.
+
+        None without a suffix index, or for canonicalized languages (whose
+        fold is not per character): then every tail has to be looked up.
+        """
+        if self._suffix_index is None or lang in CANON_LANGS:
+            return None
+        return self._suffix_index.suffix_lengths(token, lang)
+
     def exact_lemma(self, token: str, lang: str) -> str | None:
         """Case-sensitive lookup (apostrophe variants only, no reverse-case
         fallback): a curated whole-token entry beats any heuristic decomposition."""
@@ -0,0 +1,51 @@
+"""
+This module defines the `MembershipLookupStrategy` class, which is a concrete implementation of the `LemmatizationStrategy` protocol.
+It recognizes dictionary forms through compact per-language membership filters, without any lemma data.
+"""
+
+from ..utils import canonicalize_token
+from .dictionaries.membership_filter import MembershipFilterFactory
+from .lemmatization_strategy import LemmatizationStrategy
+
+
+class MembershipLookupStrategy(LemmatizationStrategy):
+    """Membership Lookup Strategy
+
+    For language detection and `is_known(lookup_strategy=...)`, which only
+    ask whether a form belongs to a language: every language's filter can stay
+    resident at a fraction of a dictionary's memory. A known form is returned
+    as its own "lemma"; with the filters' false-positive rate, unknown forms
+    are occasionally reported known.
+    """
+
+    __slots__ = ["_filter_factory"]
+
+    def __init__(self, filter_factory: MembershipFilterFactory | None = None):
+        """
+        Initialize the Membership Lookup Strategy.
+
+        Args:
+            filter_factory (MembershipFilterFactory | None): The factory providing
+                the language filters. Defaults to a `MembershipFilterFactory()`
+                with a 1% false-positive rate.
+        """
+        self._filter_factory = (
+            MembershipFilterFactory() if filter_factory is None else filter_factory
+        )
+
+    def get_lemma(self, token: str, lang: str) -> str | None:
+        """
+        Get the token back if it is a dictionary form of the language.
+
+        Covers the case, apostrophe and hy-mark variants `DictionaryLookupStrategy`
+        tries, in one filter check.
+
+        Args:
+            token (str): The input token.
+            lang (str): The language code for the token's language.
+
+        Returns:
+            str | None: The token if (probably) known, `None` if certainly not.
+        """
+        canonical = canonicalize_token(token, lang)
+        return token if canonical in self._filter_factory.get_filter(lang) else None
@@ -8,6 +8,7 @@ Contains utility functions for language processing.
 - [strip_diacritics][simplemma.utils.strip_diacritics]: Removes combining diacritics from a token.
 - [canonicalize_token][simplemma.utils.canonicalize_token]: Per-language dictionary-matching canonicalization (grc grave->acute, he/ar vocalization-stripping).
 - `CANON_LANGS`: Languages canonicalize_token folds (public membership view of _CANON_TABLES).
+- [lookup_fold][simplemma.utils.lookup_fold]: Folds a token and all its dictionary-lookup variants to one string.
 """
 
 import unicodedata
@@ -80,6 +81,23 @@ def strip_armenian_marks(text: str) -> str:
     return text.translate(_ARMENIAN_MARKS_TABLE)
 
 
+# Lookup fold: one string shared by every form DictionaryLookupStrategy
+# probes for a token (reverse case, apostrophe glyphs, hy marks), so a single
+# check on it can rule the whole family out. casefold() is invariant under
+# str.lower()/capitalize() for every code point except dotless i
+# ("ı".capitalize() == "I"), mapped to "i" first.
+_LOOKUP_FOLD_TABLE = str.maketrans(
+    {**{glyph: _STRAIGHT_APOSTROPHE for glyph in _FOLDED_APOSTROPHES}, "ı": "i"}
+    | dict.fromkeys(_ARMENIAN_MARKS)
+)
+
+
+def lookup_fold(text: str) -> str:
+    """Case-, apostrophe- and hy-mark-insensitive form of `text`: equal for a
+    token and all the variants dictionary lookups try for it."""
+    return text.translate(_LOOKUP_FOLD_TABLE).casefold()
+
+
 # Per-language dictionary-matching canonicalization, applied to BOTH
 # dictionary keys (dictionary_builder, at build time) and lookup tokens
 # (DictionaryLookupStrategy, at runtime) -- the single hook that keeps the two
@@ -1,10 +1,15 @@
 """Shared test scaffolding (pytest auto-discovers this)."""
 
-from collections.abc import Iterable, Mapping
+import lzma
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
 from typing import Any
 
+import pytest
+
 from simplemma import BaseTokenSampler
-from simplemma.strategies import DictionaryFactory
+from simplemma.strategies import DefaultDictionaryFactory, DictionaryFactory
+from simplemma.strategies.dictionaries import frontcode
 
 
 class FixedMapping(DictionaryFactory):
@@ -19,6 +24,21 @@ class FixedMapping(DictionaryFactory):
         return self._mapping
 
 
+@pytest.fixture(scope="session")
+def reference_dictionary() -> Callable[[str], dict[str, str]]:
+    """The default backend's dictionary of a language as a plain dict, which
+    the other backends are checked against; decoded once per session."""
+    return lru_cache(maxsize=None)(
+        lambda lang: dict(DefaultDictionaryFactory().get_dictionary(lang))
+    )
+
+
+def decoded_stream(mapping: dict[bytes, bytes], reverse: bool = False) -> bytes:
+    """`mapping` as the decompressed front-coded stream the backends build
+    from, with reversed keys if `reverse` (as shipped for suffixing languages)."""
+    return lzma.decompress(frontcode.encode(mapping, reverse))
+
+
 def conllu(sentences: Iterable[Iterable[tuple[Any, ...]]]) -> str:
     """Minimal CoNLL-U text from sentences of (id, form, lemma[, upos]) rows; upos defaults to 'X'."""
     blocks = []
@@ -0,0 +1,99 @@
+"""Checks shared by every dictionary backend, against the default one. The
+per-backend modules test their formats on small synthetic mappings, in both
+key directions."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from simplemma.strategies import (
+    DictionaryFactory,
+    EditScriptDictionaryFactory,
+    FstDictionaryFactory,
+    MmapDictionaryFactory,
+    NativeStrDictionaryFactory,
+    PerfectHashDictionaryFactory,
+    PrefilteredDictionaryFactory,
+    SortedArrayDictionaryFactory,
+    StreamDictionaryFactory,
+    TrieDictionaryFactory,
+)
+from simplemma.strategies.dictionaries.dictionary_factory import DecodedStrMapping
+from simplemma.strategies.dictionaries.trie_dictionary_factory import (
+    _TRIE_DEPS_AVAILABLE,
+)
+
+# backend name -> factory keeping its disk cache, if any, in the given dir
+BACKENDS: dict[str, Callable[[Path], DictionaryFactory]] = {
+    "stream": lambda cache_dir: StreamDictionaryFactory(),
+    "mmap": lambda cache_dir: MmapDictionaryFactory(disk_cache_dir=str(cache_dir)),
+    "perfect_hash": lambda cache_dir: PerfectHashDictionaryFactory(
+        disk_cache_dir=str(cache_dir)
+    ),
+    "sorted_array": lambda cache_dir: SortedArrayDictionaryFactory(),
+    "fst": lambda cache_dir: FstDictionaryFactory(disk_cache_dir=str(cache_dir)),
+    "edit_script": lambda cache_dir: EditScriptDictionaryFactory(),
+    "native_str": lambda cache_dir: NativeStrDictionaryFactory(),
+    "prefiltered": lambda cache_dir: PrefilteredDictionaryFactory(
+        StreamDictionaryFactory()
+    ),
+    "trie": lambda cache_dir: TrieDictionaryFactory(disk_cache_dir=str(cache_dir)),
+}
+
+backends = pytest.mark.parametrize(
+    "backend",
+    [
+        pytest.param(
+            name,
+            marks=pytest.mark.skipif(
+                name == "trie" and not _TRIE_DEPS_AVAILABLE,
+                reason="requires marisa-trie",
+            ),
+        )
+        for name in BACKENDS
+    ],
+)
+
+
+@backends
+def test_exceptions(backend: str, tmp_path: Path) -> None:
+    dictionaries = BACKENDS[backend](tmp_path)
+    for lang in ("abc", "../en"):
+        with pytest.raises(ValueError, match="Unsupported language"):
+            dictionaries.get_dictionary(lang)
+    assert sorted(tmp_path.iterdir()) == []
+
+
+@backends
+def test_parity_with_default(
+    backend: str,
+    tmp_path: Path,
+    reference_dictionary: Callable[[str], dict[str, str]],
+) -> None:
+    reference = reference_dictionary("en")
+    mapping = BACKENDS[backend](tmp_path).get_dictionary("en")
+    assert isinstance(mapping, DecodedStrMapping)
+
+    assert len(mapping) == len(reference)
+    assert set(mapping) == reference.keys()
+    keys = list(reference)[::50]
+    for key in keys:
+        assert mapping[key] == reference[key]
+    assert mapping.get("zzzzzqqqqqxxxxx") is None
+    assert mapping.get("zzzzzqqqqqxxxxx", "fallback") == "fallback"
+    with pytest.raises(KeyError):
+        mapping["zzzzzqqqqqxxxxx"]
+
+    # batch and prefix queries agree with per-key lookups
+    texts = [*keys[::10], *(key + "ninginezo" for key in keys[::10]), "", "zzzzq"]
+    for text in texts:
+        expected = [
+            text[:end] for end in range(1, len(text) + 1) if text[:end] in reference
+        ]
+        assert mapping.prefixes_of(text) == expected
+    assert mapping.get_many(texts) == [reference.get(text) for text in texts]
+    assert mapping.get_many(iter(texts[::-1])) == [
+        reference.get(text) for text in texts[::-1]
+    ]
+    assert mapping.get_many([]) == []
@@ -1,10 +1,20 @@
 import lzma
+import marshal
+import threading
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
-from simplemma.strategies import DefaultDictionaryFactory
-from simplemma.strategies.dictionaries import frontcode
+from simplemma.strategies import DefaultDictionaryFactory, get_many
+from simplemma.strategies.dictionaries import dictionary_factory, frontcode
 from simplemma.strategies.dictionaries.dictionary_factory import (
+    CachingDictionaryFactory,
     MappingStrToByteString,
 )
 
@@ -52,3 +62,350 @@ def test_dictionary_cache() -> None:
     assert dictionaries._get_dictionary.cache_info().hits == (iterations - 1) * 2
     # the cached wrapper itself is reused, not just the underlying dict
     assert dictionaries.get_dictionary("en") is dictionaries.get_dictionary("en")
+
+
+def test_preload_warms_the_cache() -> None:
+    dictionaries = DefaultDictionaryFactory()
+    dictionaries.preload(["en", "de", "en", "fr"], workers=3)
+    info = dictionaries._get_dictionary.cache_info()
+    # duplicates are only built once
+    assert info.misses == 3 and info.currsize == 3
+    dictionaries.get_dictionary("de")
+    assert dictionaries._get_dictionary.cache_info().misses == 3
+
+
+def test_preload_sequential_and_errors() -> None:
+    dictionaries = DefaultDictionaryFactory()
+    dictionaries.preload(["en"], workers=1)
+    assert dictionaries._get_dictionary.cache_info().currsize == 1
+    with pytest.raises(ValueError, match="Unsupported language"):
+        dictionaries.preload(["de", "abc", "fr"], workers=2)
+    # the valid languages are still loaded
+    assert dictionaries._get_dictionary.cache_info().currsize == 3
+
+
+def test_preload_in_background() -> None:
+    dictionaries = DefaultDictionaryFactory()
+    future = dictionaries.preload_in_background(["en", "de"])
+    assert future.result(timeout=60) is None
+    assert dictionaries._get_dictionary.cache_info().currsize == 2
+
+    future = dictionaries.preload_in_background(["abc"])
+    with pytest.raises(ValueError, match="Unsupported language"):
+        future.result(timeout=60)
+
+
+def test_preload_from_environment(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    dictionaries = DefaultDictionaryFactory()
+    monkeypatch.setenv("SIMPLEMMA_PRELOAD", " en, abc,,de ")
+    with patch.object(
+        DefaultDictionaryFactory,
+        "preload_in_background",
+        wraps=dictionaries.preload_in_background,
+    ) as preload_mock:
+        dictionary_factory._preload_from_environment(dictionaries)
+    preload_mock.assert_called_once_with(["en", "de"])
+    assert "abc" in caplog.text
+
+    monkeypatch.delenv("SIMPLEMMA_PRELOAD")
+    with patch.object(DefaultDictionaryFactory, "preload_in_background") as mock:
+        dictionary_factory._preload_from_environment(dictionaries)
+    mock.assert_not_called()
+
+
+class _SizedMap(MappingStrToByteString):
+    def __init__(self, nbytes: int) -> None:
+        super().__init__({b"form": b"lemma"}, nbytes)
+
+
+class _FakeFactory(CachingDictionaryFactory):
+    """Languages with fixed sizes and load costs, on a fake clock."""
+
+    SIZES = {"big": 600, "cheap": 300, "costly": 300, "tiny": 100}
+    COSTS = {"big": 1.0, "cheap": 0.1, "costly": 5.0, "tiny": 0.1}
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.clock = 0.0
+        self.loads: list[str] = []
+
+    def _get_dictionary_uncached(self, lang: str) -> Mapping[str, str]:
+        self.loads.append(lang)
+        self.clock += self.COSTS[lang]
+        return _SizedMap(self.SIZES[lang])
+
+
+@pytest.fixture
+def fake_factory(monkeypatch: pytest.MonkeyPatch) -> Callable[..., _FakeFactory]:
+    def make(**kwargs: Any) -> _FakeFactory:
+        factory = _FakeFactory(**kwargs)
+        monkeypatch.setattr(dictionary_factory, "perf_counter", lambda: factory.clock)
+        return factory
+
+    return make
+
+
+def test_byte_budget_evicts_cheapest_per_byte(
+    fake_factory: Callable[..., _FakeFactory],
+) -> None:
+    factory = fake_factory(cache_max_bytes=700)
+    factory.get_dictionary("costly")
+    factory.get_dictionary("cheap")
+    # 300 + 300 + 100 fits the budget
+    factory.get_dictionary("tiny")
+    assert factory._get_dictionary.cache_info().currsize == 3
+    # over budget: "cheap" has the lowest reload cost per byte
+    factory.get_dictionary("big")
+    factory.get_dictionary("costly")
+    assert factory.loads == ["costly", "cheap", "tiny", "big"]
+    factory.get_dictionary("cheap")
+    assert factory.loads[-1] == "cheap"
+
+
+def test_byte_budget_favours_frequent_languages(
+    fake_factory: Callable[..., _FakeFactory],
+) -> None:
+    factory = fake_factory(cache_max_bytes=700)
+    for _ in range(10):
+        factory.get_dictionary("cheap")
+    factory.get_dictionary("costly")
+    factory.get_dictionary("tiny")
+    factory.get_dictionary("big")
+    # "cheap" is used 10x: "costly" goes now, whatever its size
+    factory.get_dictionary("cheap")
+    assert factory.loads == ["cheap", "costly", "tiny", "big"]
+    info = factory._get_dictionary.cache_info()
+    assert (info.hits, info.misses, info.maxsize) == (10, 4, 700)
+
+
+def test_pinned_languages_are_never_evicted(
+    fake_factory: Callable[..., _FakeFactory],
+) -> None:
+    factory = fake_factory(cache_max_bytes=500, pinned=["cheap"])
+    factory.get_dictionary("cheap")
+    factory.get_dictionary("big")
+    factory.get_dictionary("costly")
+    factory.get_dictionary("cheap")
+    assert factory.loads.count("cheap") == 1
+    factory._get_dictionary.cache_clear()
+    assert factory._get_dictionary.cache_info() == (0, 0, 500, 0)
+
+
+def test_byte_budget_arguments() -> None:
+    with pytest.raises(ValueError, match="require cache_max_bytes"):
+        DefaultDictionaryFactory(pinned=["en"])
+    with pytest.raises(ValueError, match="negative"):
+        DefaultDictionaryFactory(cache_max_bytes=-1)
+    dictionaries = DefaultDictionaryFactory(cache_max_bytes=10**9, pinned=["en"])
+    assert dictionaries.get_dictionary("en")["balconies"] == "balcony"
+    assert dictionaries.get_dictionary("en") is dictionaries.get_dictionary("en")
+
+
+def test_nbytes_counts_shared_values_once() -> None:
+    lemma = b"lemma"
+    shared = MappingStrToByteString({b"a": lemma, b"b": lemma})
+    distinct = MappingStrToByteString({b"a": lemma, b"b": bytes(bytearray(lemma))})
+    assert 0 < shared.nbytes() < distinct.nbytes()
+
+
+def test_nbytes_is_measured_at_build() -> None:
+    data = lzma.decompress(frontcode.encode({b"dogs": b"dog", b"doggy": b"dog"}))
+    dictionary, nbytes = frontcode.decode_stream_sized(data)
+    assert nbytes == MappingStrToByteString(dictionary).nbytes()
+
+    with patch.object(frontcode, "decode_stream_sized", return_value=({}, 12345)):
+        mapping = DefaultDictionaryFactory(use_disk_cache=False).get_dictionary("en")
+    assert mapping.nbytes() == 12345  # type: ignore[attr-defined]
+
+
+def test_stats_are_opt_in() -> None:
+    dictionaries = DefaultDictionaryFactory()
+    dictionaries.get_dictionary("en").get("balconies")
+    assert dictionaries.stats() == {}
+    assert isinstance(dictionaries.get_dictionary("en"), MappingStrToByteString)
+
+
+def test_stats_count_loads_lookups_and_lru_evictions() -> None:
+    dictionaries = DefaultDictionaryFactory(cache_max_size=1)
+    dictionaries.enable_stats()
+    english = dictionaries.get_dictionary("en")
+    assert english.get("balconies") == "balcony"
+    assert english.get("zzzzzqqqqqxxxxx") is None
+    assert "balconies" in english
+    assert dictionaries.get_dictionary("en") is english
+    dictionaries.get_dictionary("de")
+    dictionaries.get_dictionary("en")
+
+    stats = dictionaries.stats()
+    assert (stats["en"].loads, stats["en"].evictions) == (2, 1)
+    assert (stats["en"].hits, stats["en"].misses) == (2, 1)
+    assert stats["en"].load_seconds > 0 and stats["en"].nbytes > 0
+    assert (stats["de"].loads, stats["de"].evictions, stats["de"].nbytes) == (1, 1, 0)
+    # snapshots are copies
+    stats["en"].hits = 100
+    assert dictionaries.stats()["en"].hits == 2
+
+
+def test_stats_count_get_many() -> None:
+    dictionaries = DefaultDictionaryFactory()
+    dictionaries.enable_stats()
+    english = dictionaries.get_dictionary("en")
+    keys = ["balconies", "zzzzzqqqqqxxxxx", "balconies"]
+    assert get_many(english, keys) == ["balcony", None, "balcony"]
+    stats = dictionaries.stats()
+    assert (stats["en"].hits, stats["en"].misses) == (2, 1)
+
+
+def test_get_many_falls_back_to_get() -> None:
+    plain = {"dogs": "dog"}
+    assert get_many(plain, iter(["dogs", "cats", ""])) == ["dog", None, None]
+    assert get_many(plain, []) == []
+
+
+def test_stats_report_budget_evictions(
+    fake_factory: Callable[..., _FakeFactory],
+) -> None:
+    factory = fake_factory(cache_max_bytes=700)
+    factory.enable_stats()
+    for lang in ("costly", "cheap", "tiny", "big"):
+        factory.get_dictionary(lang)
+    stats = factory.stats()
+    assert {lang: entry.evictions for lang, entry in stats.items()} == {
+        "costly": 0,
+        "cheap": 1,
+        "tiny": 1,
+        "big": 1,
+    }
+    assert stats["costly"].nbytes == 300
+    assert stats["costly"].load_seconds == 5.0
+    # evicted on arrival: not resident
+    assert stats["big"].nbytes == 0
+
+
+class _SlowFactory(CachingDictionaryFactory):
+    def __init__(self, fail: bool = False, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.builds = 0
+        self.fail = fail
+
+    def _get_dictionary_uncached(self, lang: str) -> Mapping[str, str]:
+        self.builds += 1
+        time.sleep(0.2)
+        if self.fail:
+            raise ValueError(f"Unsupported language: {lang}")
+        return MappingStrToByteString({b"form": b"lemma"})
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"cache_max_bytes": 10**6}])
+def test_concurrent_misses_build_once(kwargs: dict[str, Any]) -> None:
+    factory = _SlowFactory(**kwargs)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(factory.get_dictionary, ["de"] * 8))
+    assert factory.builds == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.parametrize("budget", [False, True])
+def test_miss_before_the_cache_stores_reuses_the_build(budget: bool) -> None:
+    factory = _SlowFactory()
+    load = factory._load_dictionary
+    built = threading.Event()
+    stored = threading.Event()
+
+    def load_then_stall(lang: str) -> Mapping[str, str]:
+        dictionary = load(lang)
+        if threading.current_thread().name == "builder":
+            # the build is done, the cache has not stored it yet
+            built.set()
+            stored.wait(5)
+        return dictionary
+
+    factory._get_dictionary = (
+        dictionary_factory._BudgetCache(load_then_stall, 10**6, frozenset())
+        if budget
+        else lru_cache(maxsize=8)(load_then_stall)
+    )
+    builder = threading.Thread(
+        target=factory.get_dictionary, args=("de",), name="builder"
+    )
+    builder.start()
+    assert built.wait(5)
+    late = factory.get_dictionary("de")
+    stored.set()
+    builder.join()
+    assert factory.builds == 1
+    assert late is factory.get_dictionary("de")
+    assert factory._loading == {}
+
+
+def test_concurrent_misses_share_the_error() -> None:
+    factory = _SlowFactory(fail=True)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(factory.get_dictionary, "de") for _ in range(4)]
+    for future in futures:
+        with pytest.raises(ValueError, match="Unsupported language"):
+            future.result()
+    assert factory.builds == 1
+    # failures are not cached: the next call builds again
+    with pytest.raises(ValueError):
+        factory.get_dictionary("de")
+    assert factory.builds == 2
+
+
+def test_decoded_disk_cache(tmp_path: Path) -> None:
+    DefaultDictionaryFactory(use_disk_cache=True, disk_cache_dir=str(tmp_path))
+    assert sorted(tmp_path.iterdir()) == []
+    reference = DefaultDictionaryFactory(
+        use_disk_cache=True, disk_cache_dir=str(tmp_path)
+    ).get_dictionary("en")
+    (cache_file,) = tmp_path.iterdir()
+    assert cache_file.name.startswith("en.")
+
+    dictionaries = DefaultDictionaryFactory(
+        use_disk_cache=True, disk_cache_dir=str(tmp_path)
+    )
+    with patch.object(
+        DefaultDictionaryFactory,
+        "_build_dictionary",
+        wraps=dictionaries._build_dictionary,
+    ) as build_mock:
+        cached = dictionaries.get_dictionary("en")
+    build_mock.assert_not_called()
+    assert dict(cached) == dict(reference)
+    # the size measured at build is cached along with the dictionary
+    assert cached.nbytes() == reference.nbytes()  # type: ignore[attr-defined]
+
+    with pytest.raises(ValueError, match="Unsupported language"):
+        dictionaries.get_dictionary("../en")
+
+
+def test_corrupted_decoded_disk_cache_is_regenerated(tmp_path: Path) -> None:
+    DefaultDictionaryFactory(
+        use_disk_cache=True, disk_cache_dir=str(tmp_path)
+    ).get_dictionary("en")
+    (cache_file,) = tmp_path.iterdir()
+    blob = cache_file.read_bytes()
+    for corrupt in (b"junk", blob[:-100], blob[:5] + marshal.dumps([1, 2])):
+        cache_file.write_bytes(corrupt)
+        dictionaries = DefaultDictionaryFactory(
+            use_disk_cache=True, disk_cache_dir=str(tmp_path)
+        )
+        with patch.object(
+            DefaultDictionaryFactory,
+            "_build_dictionary",
+            wraps=dictionaries._build_dictionary,
+        ) as build_mock:
+            assert dictionaries.get_dictionary("en")["balconies"] == "balcony"
+        build_mock.assert_called_once_with("en")
+        assert cache_file.read_bytes() == blob
+
+
+def test_decoded_disk_cache_unwritable(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    dictionaries = DefaultDictionaryFactory(
+        use_disk_cache=True, disk_cache_dir=str(blocker / "sub")
+    )
+    assert dictionaries.get_dictionary("en")["balconies"] == "balcony"
@@ -0,0 +1,63 @@
+import pytest
+
+from simplemma.strategies import (
+    DefaultDictionaryFactory,
+    EditScriptDictionaryFactory,
+)
+from simplemma.strategies.dictionaries import dictionary_factory
+from simplemma.strategies.dictionaries.edit_script_dictionary_factory import (
+    EditScriptMap,
+)
+from tests.conftest import decoded_stream
+
+
+def _map_from(mapping: dict[bytes, bytes], reverse: bool = False) -> EditScriptMap:
+    return EditScriptMap(decoded_stream(mapping, reverse))
+
+
+def test_smaller_than_the_default_dict() -> None:
+    mapping = EditScriptDictionaryFactory().get_dictionary("en")
+    default = DefaultDictionaryFactory().get_dictionary("en")
+    assert (
+        mapping.nbytes()  # type: ignore[attr-defined]
+        < dictionary_factory._dictionary_nbytes(default) / 2
+    )
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 3, 100])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_synthetic_maps(count: int, reverse: bool) -> None:
+    reference = {
+        f"word{i:06d}".encode(): f"lemma{i % 7}".encode() for i in range(count)
+    }
+    table = _map_from(reference, reverse)
+
+    assert len(table) == count
+    assert set(table) == {key.decode() for key in reference}
+    for key, value in reference.items():
+        assert table.get(key.decode()) == value.decode()
+    assert table.get("word000000extra") is None
+    assert table.get("") is None
+
+
+def test_scripts_are_shared() -> None:
+    reference = {
+        b"houses": b"house",
+        b"mice": b"mouse",
+        b"dogs": b"dog",
+        "héros".encode(): "héro".encode(),
+        b"was": b"be",
+    }
+    table = _map_from(reference)
+    for key, value in reference.items():
+        assert table.get(key.decode()) == value.decode()
+    # "drop 1" serves the three plurals in -s
+    assert len(table._scripts) == 3
+    assert table._script_ids.typecode == "H"
+    assert table.prefixes_of("dogsled") == ["dogs"]
+
+
+def test_truncated_stream() -> None:
+    data = decoded_stream({b"dog": b"dog", b"dogs": b"dog"})
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        EditScriptMap(data[:-5])
@@ -58,6 +58,15 @@ def test_roundtrip_trim_zero_self_identity() -> None:
     assert frontcode.decode(frontcode.encode(mapping)) == mapping
 
 
+@pytest.mark.parametrize("reverse", [False, True])
+def test_decode_interns_equal_values(reverse: bool) -> None:
+    """Equal lemmas share one object, adjacent in the stream or not."""
+    mapping = {b"goes": b"go", b"gone": b"go", b"gz": b"x", b"wenta": b"go"}
+    decoded = frontcode.decode(frontcode.encode(mapping, reverse_key=reverse))
+    assert decoded == mapping
+    assert len({id(value) for value in decoded.values()}) == 2
+
+
 def test_is_frontcoded_rejects_other_data() -> None:
     assert frontcode.is_frontcoded(b"not a front-coded stream") is False
 
@@ -98,3 +107,59 @@ def test_decode_stream_rejects_boundary_truncated_records() -> None:
     starts = [start for start, _, _ in frontcode.iter_records(raw, pos)]
     with pytest.raises(ValueError, match="truncated or corrupt"):
         frontcode.decode_stream(raw[: starts[-1]])
+
+
+_BLOCK_MAPPING = {f"word{i:04d}".encode(): f"lemma{i:04d}".encode() for i in range(50)}
+
+
+@pytest.mark.parametrize("codec", ["lzma", "zlib"])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("block_records", [1, 7, 50, 1024])
+def test_block_container_roundtrip(
+    codec: str, reverse: bool, block_records: int
+) -> None:
+    blob = frontcode.encode_blocks(_BLOCK_MAPPING, reverse, codec, block_records)
+    assert frontcode.is_block_container(blob)
+    assert not frontcode.is_frontcoded(blob)
+    assert frontcode.decode(blob) == _BLOCK_MAPPING
+
+    directory = frontcode.read_block_directory(blob)
+    assert directory.reverse_key is reverse
+    assert directory.record_count == 50
+    assert len(directory.spans) == -(-50 // block_records)
+    assert directory.firsts == sorted(directory.firsts)
+
+
+def test_block_container_empty() -> None:
+    blob = frontcode.encode_blocks({})
+    assert frontcode.decode(blob) == {}
+    assert frontcode.read_block_directory(blob).spans == []
+
+
+def test_block_container_splices_into_plain_stream() -> None:
+    """Every block restarts from an empty seed, so the spliced blocks are a
+    valid SMFC1 stream (parallel decompression gives the same bytes)."""
+    blob = frontcode.encode_blocks(_BLOCK_MAPPING, block_records=8)
+    stream = frontcode.container_to_stream(blob)
+    assert frontcode.decode_stream(stream) == _BLOCK_MAPPING
+    assert frontcode.container_to_stream(blob, workers=4) == stream
+
+
+def test_block_container_rejects_bad_arguments() -> None:
+    with pytest.raises(ValueError, match="Unknown block codec"):
+        frontcode.encode_blocks(_BLOCK_MAPPING, codec="bz2")
+    with pytest.raises(ValueError, match="block_records"):
+        frontcode.encode_blocks(_BLOCK_MAPPING, block_records=0)
+
+
+def test_block_container_rejects_corruption() -> None:
+    blob = frontcode.encode_blocks(_BLOCK_MAPPING, codec="zlib", block_records=8)
+    with pytest.raises(ValueError, match="block container"):
+        frontcode.read_block_directory(lzma.compress(b"SMFC2"))
+    for corrupt in (blob[:-1], blob + b"\x00", blob[:12]):
+        with pytest.raises(ValueError, match="truncated or corrupt"):
+            frontcode.decode(corrupt)
+    # flip a byte inside the last compressed block
+    damaged = blob[:-3] + bytes([blob[-3] ^ 0xFF]) + blob[-2:]
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        frontcode.decode(damaged)
@@ -0,0 +1,95 @@
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from simplemma.strategies import FstDictionaryFactory
+from simplemma.strategies.dictionaries import dictionary_factory
+from simplemma.strategies.dictionaries.fst_dictionary_factory import (
+    FstMap,
+    build_fst,
+)
+from tests.conftest import decoded_stream
+
+
+def _fst_from(mapping: dict[bytes, bytes], reverse: bool = False) -> FstMap:
+    return FstMap(build_fst(decoded_stream(mapping, reverse)))
+
+
+def test_disk_cache_is_reused(
+    tmp_path: Path, reference_dictionary: Callable[[str], dict[str, str]]
+) -> None:
+    mapping = FstDictionaryFactory(disk_cache_dir=str(tmp_path)).get_dictionary("en")
+    assert sorted(tmp_path.iterdir()) == [tmp_path / "en.fst"]
+    # shares endings: smaller than the decompressed front-coded stream
+    stream = dictionary_factory._read_decompressed("en")
+    assert mapping.nbytes() < len(stream)  # type: ignore[attr-defined]
+
+    dictionaries = FstDictionaryFactory(disk_cache_dir=str(tmp_path))
+    with patch.object(
+        FstDictionaryFactory, "_build_fst", wraps=dictionaries._build_fst
+    ) as build_mock:
+        assert dict(dictionaries.get_dictionary("en")) == reference_dictionary("en")
+    build_mock.assert_not_called()
+
+
+def test_corrupted_disk_cache_is_regenerated(
+    tmp_path: Path, reference_dictionary: Callable[[str], dict[str, str]]
+) -> None:
+    (tmp_path / "ms.fst").write_bytes(b"corrupted transducer")
+    dictionaries = FstDictionaryFactory(disk_cache_dir=str(tmp_path))
+    with patch.object(
+        FstDictionaryFactory, "_build_fst", wraps=dictionaries._build_fst
+    ) as build_mock:
+        dictionaries.get_dictionary("ms")
+    build_mock.assert_called_once_with("ms")
+    assert len(FstMap((tmp_path / "ms.fst").read_bytes())) == len(
+        reference_dictionary("ms")
+    )
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 3, 100, 5000])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_synthetic_transducers(count: int, reverse: bool) -> None:
+    reference = {
+        f"word{i:06d}".encode(): f"lemma{i % 7}".encode() for i in range(count)
+    }
+    fst = _fst_from(reference, reverse)
+
+    assert len(fst) == count
+    assert list(fst) == sorted(key.decode() for key in reference)
+    for key, value in reference.items():
+        assert fst.get(key.decode()) == value.decode()
+    assert fst.get("word000000extra") is None
+    assert fst.get("word") is None
+    assert fst.get("") is None
+
+
+def test_shared_endings_and_edits() -> None:
+    reference = {
+        "laufen".encode(): b"laufen",
+        "läufst".encode(): "laufen".encode(),
+        "kaufen".encode(): b"kaufen",
+        b"kaufst": b"kaufen",
+        b"kauf": b"kaufen",
+        b"sein": b"sein",
+        b"bin": b"sein",
+        b"b": b"b",
+    }
+    fst = _fst_from(reference)
+    for key, value in reference.items():
+        assert fst.get(key.decode()) == value.decode()
+    assert fst.get("kau") is None
+    assert fst.get("kaufe") is None
+    assert fst.prefixes_of("kaufenden") == ["kauf", "kaufen"]
+    assert fst.prefixes_of("binär") == ["b", "bin"]
+    assert fst.prefixes_of("läufst") == ["läufst"]
+    assert fst.prefixes_of("") == []
+
+
+def test_rejects_foreign_and_truncated_blobs() -> None:
+    blob = build_fst(decoded_stream({b"dog": b"dog"}))
+    for buf in (b"", b"not a dictionary transducer", blob[:-1], blob + b"\x00"):
+        with pytest.raises(ValueError, match="not a dictionary transducer"):
+            FstMap(buf)
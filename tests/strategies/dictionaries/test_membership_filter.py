@@ -0,0 +1,104 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from simplemma.strategies import DefaultDictionaryFactory
+from simplemma.strategies.dictionaries import MembershipFilter, MembershipFilterFactory
+from simplemma.strategies.dictionaries import membership_filter
+from simplemma.strategies.dictionaries.membership_filter import build_membership_filter
+
+
+def test_exceptions(tmp_path: Path) -> None:
+    filters = MembershipFilterFactory(disk_cache_dir=str(tmp_path))
+    with pytest.raises(ValueError, match="Unsupported language"):
+        filters.get_filter("abc")
+    with pytest.raises(ValueError, match="Unsupported language"):
+        filters.get_filter("../en")
+    assert sorted(tmp_path.iterdir()) == []
+    for rate in (0, 1, -0.5):
+        with pytest.raises(ValueError, match="false_positive_rate"):
+            MembershipFilterFactory(false_positive_rate=rate)
+        with pytest.raises(ValueError, match="false_positive_rate"):
+            MembershipFilter.from_keys([], 0, rate)
+
+
+@pytest.mark.parametrize("lang", ["en", "sw"])
+def test_no_false_negatives(lang: str) -> None:
+    """sw is reverse-coded; the filter holds un-reversed keys."""
+    membership = build_membership_filter(lang)
+    keys = list(DefaultDictionaryFactory().get_dictionary(lang))
+    assert all(key in membership for key in keys)
+    # folded: case and apostrophe variants are members too
+    assert all(key.upper() in membership for key in keys[::50])
+    assert 1.1 * len(keys) < membership.nbytes() < 1.3 * len(keys)
+
+
+@pytest.mark.parametrize("rate", [0.2, 0.01])
+def test_false_positive_rate(rate: float) -> None:
+    keys = [f"word{i:06d}" for i in range(20000)]
+    membership = MembershipFilter.from_keys(keys, len(keys), rate)
+    assert all(key in membership for key in keys)
+    probes = [f"other{i:06d}" for i in range(20000)]
+    assert sum(probe in membership for probe in probes) < 1.5 * rate * len(probes)
+    assert None not in membership
+
+
+def test_in_process_filter() -> None:
+    keys = [f"Wort{i}'s" for i in range(1000)]
+    membership = MembershipFilter.from_keys(keys, len(keys), key_hash=hash)
+    assert all(key in membership for key in keys)
+    assert all(f"wort{i}’S" in membership for i in range(1000))
+    assert sum(f"wort{i}'s" in membership for i in range(1000, 11000)) < 150
+    with pytest.raises(ValueError, match="serialized"):
+        membership.to_bytes()
+
+
+def test_disk_cache_is_reused(tmp_path: Path) -> None:
+    MembershipFilterFactory(disk_cache_dir=str(tmp_path)).get_filter("en")
+    assert sorted(tmp_path.iterdir()) == [tmp_path / "en.0.01.smbf"]
+
+    with patch.object(
+        membership_filter,
+        "build_membership_filter",
+        wraps=build_membership_filter,
+    ) as build_mock:
+        filters = MembershipFilterFactory(disk_cache_dir=str(tmp_path))
+        assert "balconies" in filters.get_filter("en")
+        assert filters.get_filter("en") is filters.get_filter("en")
+    build_mock.assert_not_called()
+    assert filters.nbytes() == filters.get_filter("en").nbytes()
+
+    MembershipFilterFactory(0.1, disk_cache_dir=str(tmp_path)).get_filter("en")
+    assert (tmp_path / "en.0.1.smbf").exists()
+
+
+def test_disk_cache_can_be_disabled(tmp_path: Path) -> None:
+    filters = MembershipFilterFactory(
+        use_disk_cache=False, disk_cache_dir=str(tmp_path)
+    )
+    assert "balconies" in filters.get_filter("en")
+    assert sorted(tmp_path.iterdir()) == []
+
+
+def test_corrupted_disk_cache_is_regenerated(tmp_path: Path) -> None:
+    (tmp_path / "en.0.01.smbf").write_bytes(b"corrupted filter")
+    filters = MembershipFilterFactory(disk_cache_dir=str(tmp_path))
+    assert "balconies" in filters.get_filter("en")
+    reloaded = MembershipFilter.from_bytes((tmp_path / "en.0.01.smbf").read_bytes())
+    assert "dogs" in reloaded
+
+
+def test_unwritable_cache_dir(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    filters = MembershipFilterFactory(disk_cache_dir=str(blocker / "sub"))
+    assert "balconies" in filters.get_filter("en")
+
+
+def test_rejects_foreign_and_truncated_blobs() -> None:
+    blob = MembershipFilter.from_keys(["dog"], 1).to_bytes()
+    assert "dog" in MembershipFilter.from_bytes(blob)
+    for buf in (b"", b"not a membership filter", blob[:-1], blob + b"\x00"):
+        with pytest.raises(ValueError, match="not a membership filter"):
+            MembershipFilter.from_bytes(buf)
@@ -0,0 +1,86 @@
+from functools import lru_cache
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from simplemma.strategies.dictionaries import (
+    DefaultDictionaryFactory,
+    MembershipIndex,
+    load_membership_index,
+)
+from simplemma.strategies.dictionaries import membership_index
+from simplemma.strategies.dictionaries.membership_index import build_membership_index
+
+_index = lru_cache(maxsize=None)(
+    lambda: MembershipIndex(build_membership_index(["en", "sw", "de"]))
+)
+
+
+def test_exceptions(tmp_path: Path) -> None:
+    for langs in ([], ["en", "abc"], ["../en"]):
+        with pytest.raises(ValueError):
+            load_membership_index(langs, disk_cache_dir=str(tmp_path))
+    assert sorted(tmp_path.iterdir()) == []
+    with pytest.raises(ValueError, match="not in membership index"):
+        _index().bit("fr")
+
+
+def test_masks_match_dictionaries() -> None:
+    """sw is reverse-coded; the index stores un-reversed keys."""
+    index = _index()
+    assert index.langs == ("de", "en", "sw")
+    dictionaries = DefaultDictionaryFactory()
+    keys: set[str] = set()
+    for lang in index.langs:
+        dictionary = dictionaries.get_dictionary(lang)
+        keys.update(dictionary)
+        for key in list(dictionary)[::50]:
+            assert index.mask(key) & index.bit(lang)
+    assert len(index) == len(keys)
+
+    assert index.mask("Haus") == index.bit("de")
+    assert index.mask("balconies") == index.bit("en")
+    assert index.mask("zzzzzqqqqqxxxxx") == 0
+    assert index.mask("") == 0
+
+
+def test_disk_cache_is_reused(tmp_path: Path) -> None:
+    load_membership_index(["en", "de", "en"], disk_cache_dir=str(tmp_path))
+    assert sorted(tmp_path.iterdir()) == [tmp_path / "de-en.smi"]
+
+    with patch.object(
+        membership_index, "_build_chunks", wraps=membership_index._build_chunks
+    ) as build_mock:
+        index = load_membership_index(["de", "en"], disk_cache_dir=str(tmp_path))
+    build_mock.assert_not_called()
+    assert index.mask("Haus") == index.bit("de")
+
+
+def test_disk_cache_can_be_disabled(tmp_path: Path) -> None:
+    index = load_membership_index(
+        ["en"], disk_cache_dir=str(tmp_path), use_disk_cache=False
+    )
+    assert index.mask("balconies") == index.bit("en")
+    assert sorted(tmp_path.iterdir()) == []
+
+
+def test_corrupted_disk_cache_is_regenerated(tmp_path: Path) -> None:
+    (tmp_path / "en.smi").write_bytes(b"corrupted index")
+    index = load_membership_index(["en"], disk_cache_dir=str(tmp_path))
+    assert index.mask("balconies") == index.bit("en")
+    assert MembershipIndex((tmp_path / "en.smi").read_bytes()).mask("dogs") == 1
+
+
+def test_unwritable_cache_dir(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    index = load_membership_index(["en"], disk_cache_dir=str(blocker / "sub"))
+    assert index.mask("balconies") == index.bit("en")
+
+
+def test_rejects_foreign_and_truncated_blobs() -> None:
+    blob = build_membership_index(["en"])
+    for buf in (b"", b"not a membership index", blob[:-1], blob + b"\x00"):
+        with pytest.raises(ValueError, match="not a membership index"):
+            MembershipIndex(buf)
@@ -0,0 +1,84 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from simplemma.strategies import MmapDictionaryFactory
+from simplemma.strategies.dictionaries import dictionary_factory, frontcode
+from simplemma.strategies.dictionaries.mmap_dictionary_factory import (
+    MmapMap,
+    build_table,
+)
+from tests.conftest import decoded_stream
+
+
+def test_disk_cache_is_reused(tmp_path: Path) -> None:
+    MmapDictionaryFactory(disk_cache_dir=str(tmp_path)).get_dictionary("en")
+    assert sorted(tmp_path.iterdir()) == [tmp_path / "en.smh"]
+
+    dictionaries = MmapDictionaryFactory(disk_cache_dir=str(tmp_path))
+    with patch.object(
+        MmapDictionaryFactory, "_build_table", wraps=dictionaries._build_table
+    ) as build_mock:
+        assert dictionaries.get_dictionary("en").get("balconies") == "balcony"
+    build_mock.assert_not_called()
+
+
+def test_corrupted_disk_cache_is_regenerated(tmp_path: Path) -> None:
+    (tmp_path / "en.smh").write_bytes(b"corrupted table")
+    dictionaries = MmapDictionaryFactory(disk_cache_dir=str(tmp_path))
+    with patch.object(
+        MmapDictionaryFactory, "_build_table", wraps=dictionaries._build_table
+    ) as build_mock:
+        assert dictionaries.get_dictionary("en").get("balconies") == "balcony"
+    build_mock.assert_called_once_with("en")
+    assert sorted(tmp_path.iterdir()) == [tmp_path / "en.smh"]
+
+
+def test_unwritable_cache_dir_serves_from_memory(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    # a cache dir nested under a regular file can never be created
+    dictionaries = MmapDictionaryFactory(disk_cache_dir=str(blocker / "sub"))
+    assert dictionaries.get_dictionary("en").get("balconies") == "balcony"
+
+
+def test_dictionary_cache(tmp_path: Path) -> None:
+    dictionaries = MmapDictionaryFactory(disk_cache_dir=str(tmp_path))
+    for _ in range(3):
+        dictionaries.get_dictionary("en")
+    assert dictionaries._get_dictionary.cache_info().misses == 1
+    assert dictionaries.get_dictionary("en") is dictionaries.get_dictionary("en")
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 100])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_synthetic_tables(count: int, reverse: bool) -> None:
+    reference = {
+        f"word{i:06d}".encode(): f"lemma{i:06d}".encode() for i in range(count)
+    }
+    table = MmapMap(build_table(decoded_stream(reference, reverse)))
+
+    assert len(table) == count
+    assert set(table) == {key.decode() for key in reference}
+    for key, value in reference.items():
+        assert table.get(key.decode()) == value.decode()
+    assert table.get("word000000extra") is None
+
+
+def test_rejects_foreign_and_truncated_buffers() -> None:
+    table = build_table(decoded_stream({b"dog": b"dog"}))
+    for buf in (b"", b"not a table at all", table[:-1], table + b"\x00"):
+        with pytest.raises(ValueError, match="not an mmap dictionary table"):
+            MmapMap(buf)
+
+
+def test_rejects_oversized_entries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "tst.plzma").write_bytes(frontcode.encode({b"a" * 70000: b"a"}))
+    monkeypatch.setattr(dictionary_factory, "DATA_FOLDER", tmp_path)
+    monkeypatch.setattr(dictionary_factory, "SUPPORTED_LANGUAGES", frozenset({"tst"}))
+    dictionaries = MmapDictionaryFactory(disk_cache_dir=str(tmp_path / "cache"))
+    with pytest.raises(ValueError, match="too long"):
+        dictionaries.get_dictionary("tst")
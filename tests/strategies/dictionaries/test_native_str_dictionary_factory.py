@@ -0,0 +1,49 @@
+import pytest
+
+from simplemma.strategies.dictionaries import dictionary_factory
+from simplemma.strategies.dictionaries.native_str_dictionary_factory import (
+    _load_native,
+)
+from tests.conftest import decoded_stream
+
+
+@pytest.mark.parametrize("count", [0, 1, 100])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_synthetic_dicts(count: int, reverse: bool) -> None:
+    reference = {
+        f"word{i:06d}".encode(): f"lemma{i % 7}".encode() for i in range(count)
+    }
+    mapping = _load_native(decoded_stream(reference, reverse))
+    assert dict(mapping) == {
+        key.decode(): value.decode() for key, value in reference.items()
+    }
+    assert mapping.get("word000000extra") is None
+
+
+def test_lemmas_are_shared() -> None:
+    data = decoded_stream({b"dogs": b"dog", b"doggy": b"dog", b"cats": b"cat"})
+    mapping = _load_native(data)
+    assert mapping == {"dogs": "dog", "doggy": "dog", "cats": "cat"}
+    assert mapping["dogs"] is mapping["doggy"]
+
+
+def test_decoded_str_mapping_extras() -> None:
+    mapping = _load_native(decoded_stream({b"a": b"a", b"abc": b"a", b"b": b"b"}))
+    assert isinstance(mapping, dictionary_factory.DecodedStrMapping)
+    assert mapping.prefixes_of("abcd") == ["a", "abc"]
+    assert dictionary_factory._dictionary_nbytes(mapping) == mapping.nbytes()
+    assert mapping.nbytes() > 0
+
+
+def test_mutation_is_rejected() -> None:
+    mapping = _load_native(decoded_stream({b"dogs": b"dog"}))
+    with pytest.raises(TypeError):
+        mapping["dogs"] = "cat"  # type: ignore[index]
+    assert not hasattr(mapping, "clear")
+    assert mapping["dogs"] == "dog"
+
+
+def test_truncated_stream() -> None:
+    data = decoded_stream({b"dog": b"dog", b"dogs": b"dog"})
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        _load_native(data[:-5])
@@ -0,0 +1,76 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from simplemma.strategies import PerfectHashDictionaryFactory
+from simplemma.strategies.dictionaries.perfect_hash_dictionary_factory import (
+    PerfectHashMap,
+    build_perfect_hash,
+)
+from tests.conftest import decoded_stream
+
+
+def test_disk_cache_is_reused(tmp_path: Path) -> None:
+    PerfectHashDictionaryFactory(disk_cache_dir=str(tmp_path)).get_dictionary("en")
+    assert sorted(tmp_path.iterdir()) == [tmp_path / "en.mph"]
+
+    dictionaries = PerfectHashDictionaryFactory(disk_cache_dir=str(tmp_path))
+    with patch.object(
+        PerfectHashDictionaryFactory,
+        "_build_perfect_hash",
+        wraps=dictionaries._build_perfect_hash,
+    ) as build_mock:
+        assert dictionaries.get_dictionary("en").get("balconies") == "balcony"
+    build_mock.assert_not_called()
+
+
+def test_disk_cache_can_be_disabled(tmp_path: Path) -> None:
+    dictionaries = PerfectHashDictionaryFactory(
+        use_disk_cache=False, disk_cache_dir=str(tmp_path)
+    )
+    assert dictionaries.get_dictionary("en").get("balconies") == "balcony"
+    assert sorted(tmp_path.iterdir()) == []
+
+
+def test_corrupted_disk_cache_is_regenerated(tmp_path: Path) -> None:
+    (tmp_path / "en.mph").write_bytes(b"corrupted hash")
+    dictionaries = PerfectHashDictionaryFactory(disk_cache_dir=str(tmp_path))
+    with patch.object(
+        PerfectHashDictionaryFactory,
+        "_build_perfect_hash",
+        wraps=dictionaries._build_perfect_hash,
+    ) as build_mock:
+        assert dictionaries.get_dictionary("en").get("balconies") == "balcony"
+    build_mock.assert_called_once_with("en")
+    assert PerfectHashMap((tmp_path / "en.mph").read_bytes()).get("dogs") == "dog"
+
+
+def test_unwritable_cache_dir(tmp_path: Path) -> None:
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    dictionaries = PerfectHashDictionaryFactory(disk_cache_dir=str(blocker / "sub"))
+    assert dictionaries.get_dictionary("en").get("balconies") == "balcony"
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 3, 100, 5000])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_synthetic_hashes(count: int, reverse: bool) -> None:
+    reference = {
+        f"word{i:06d}".encode(): f"lemma{i:06d}".encode() for i in range(count)
+    }
+    table = PerfectHashMap(build_perfect_hash(decoded_stream(reference, reverse)))
+
+    assert len(table) == count
+    assert set(table) == {key.decode() for key in reference}
+    for key, value in reference.items():
+        assert table.get(key.decode()) == value.decode()
+    assert table.get("word000000extra") is None
+    assert table.get("") is None
+
+
+def test_rejects_foreign_and_truncated_blobs() -> None:
+    blob = build_perfect_hash(decoded_stream({b"dog": b"dog"}))
+    for buf in (b"", b"not a perfect hash table", blob[:-1], blob + b"\x00"):
+        with pytest.raises(ValueError, match="not a perfect hash table"):
+            PerfectHashMap(buf)
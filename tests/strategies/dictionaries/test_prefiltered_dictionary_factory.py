@@ -0,0 +1,52 @@
+import pytest
+
+from simplemma.strategies import (
+    DefaultStrategy,
+    PrefilteredDictionaryFactory,
+    StreamDictionaryFactory,
+)
+from simplemma.strategies.dictionaries.prefiltered_dictionary_factory import (
+    PrefilteredMap,
+)
+from tests.conftest import FixedMapping
+
+
+def test_misses_skip_the_wrapped_dictionary() -> None:
+    probed: list[str] = []
+
+    class _Probed(dict[str, str]):
+        def get(self, key, default=None):
+            probed.append(key)
+            return super().get(key, default)
+
+    dictionaries = PrefilteredDictionaryFactory(FixedMapping(_Probed(dog="dog")))
+    dictionary = dictionaries.get_dictionary("en")
+    assert isinstance(dictionary, PrefilteredMap)
+    assert dictionary.get("dog") == "dog"
+    assert dictionary["dog"] == "dog"
+    assert "dog" in dictionary
+    assert sum(dictionary.get(f"cat{i}") is None for i in range(100)) == 100
+    with pytest.raises(KeyError):
+        dictionary["cat"]
+    assert len(probed) < 10
+    assert list(dictionary) == ["dog"] and len(dictionary) == 1
+    assert dictionary.nbytes() > 64
+
+
+def test_parity_with_wrapped_factory() -> None:
+    stream = StreamDictionaryFactory()
+    dictionaries = PrefilteredDictionaryFactory(stream)
+    with pytest.raises(ValueError, match="Unsupported language"):
+        dictionaries.get_dictionary("abc")
+
+    # the filter outlives the wrapped factory's eviction of the dictionary
+    key_filter = dictionaries.get_dictionary("en")._filter  # type: ignore[attr-defined]
+    stream._get_dictionary.cache_clear()
+    assert dictionaries.get_dictionary("en")._filter is key_filter  # type: ignore[attr-defined]
+
+    plain, filtered = (
+        DefaultStrategy(dictionary_factory=factory)
+        for factory in (stream, dictionaries)
+    )
+    for token in ("balconies", "Balconies", "unbelievably", "doglike", "zzzzq"):
+        assert filtered.get_lemma(token, "en") == plain.get_lemma(token, "en")
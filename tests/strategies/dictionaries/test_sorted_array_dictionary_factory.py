@@ -0,0 +1,66 @@
+from collections.abc import Callable
+
+import pytest
+
+from simplemma.strategies import SortedArrayDictionaryFactory
+from simplemma.strategies.dictionaries.sorted_array_dictionary_factory import (
+    SortedArrayMap,
+    build_sorted_arrays,
+)
+from tests.conftest import decoded_stream
+
+
+def _map_from(mapping: dict[bytes, bytes], reverse: bool = False) -> SortedArrayMap:
+    return SortedArrayMap(*build_sorted_arrays(decoded_stream(mapping, reverse)))
+
+
+@pytest.mark.parametrize("count", [0, 1, 2, 3, 100])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_synthetic_arrays(count: int, reverse: bool) -> None:
+    reference = {
+        f"word{i:06d}".encode(): f"lemma{i:06d}".encode() for i in range(count)
+    }
+    table = _map_from(reference, reverse)
+
+    assert len(table) == count
+    assert list(table) == sorted(key.decode() for key in reference)
+    for key, value in reference.items():
+        assert table.get(key.decode()) == value.decode()
+    assert table.get("word000000extra") is None
+    assert table.get("") is None
+    assert table.get("a") is None
+    assert table.get("zzz") is None
+
+
+def test_keys_with_prefix() -> None:
+    table = _map_from(
+        {b"ab": b"a", b"abc": b"a", b"abd": b"a", b"b": b"b", "é".encode(): b"e"}
+    )
+    assert list(table.keys_with_prefix("ab")) == ["ab", "abc", "abd"]
+    assert list(table.keys_with_prefix("abc")) == ["abc"]
+    assert list(table.keys_with_prefix("ac")) == []
+    assert list(table.keys_with_prefix("é")) == ["é"]
+    assert len(list(table.keys_with_prefix(""))) == 5
+
+
+def test_prefixes_of() -> None:
+    table = _map_from({b"a": b"a", b"abc": b"a", b"abcde": b"a", b"b": b"b"})
+    assert table.prefixes_of("abcdef") == ["a", "abc", "abcde"]
+    assert table.prefixes_of("abd") == ["a"]
+    assert table.prefixes_of("c") == []
+    assert table.prefixes_of("") == []
+
+
+def test_truncated_stream() -> None:
+    data = decoded_stream({b"dog": b"dog", b"dogs": b"dog"})
+    with pytest.raises(ValueError, match="truncated or corrupt"):
+        build_sorted_arrays(data[:-5])
+
+
+def test_nbytes_is_near_the_arena_size(
+    reference_dictionary: Callable[[str], dict[str, str]],
+) -> None:
+    mapping = SortedArrayDictionaryFactory().get_dictionary("en")
+    reference = reference_dictionary("en")
+    arenas = sum(len(key.encode()) + len(reference[key].encode()) for key in reference)
+    assert arenas < mapping.nbytes() < arenas + 9 * (len(reference) + 1)  # type: ignore[attr-defined]
@@ -1,12 +1,18 @@
 import lzma
 from functools import lru_cache
+from unittest.mock import patch
 
 import pytest
 
 from simplemma.strategies import DefaultDictionaryFactory, StreamDictionaryFactory
-from simplemma.strategies.dictionaries import dictionary_factory, frontcode
+from simplemma.strategies.dictionaries import (
+    dictionary_factory,
+    frontcode,
+    stream_dictionary_factory,
+)
 from simplemma.strategies.dictionaries.stream_dictionary_factory import (
     _BLOCK_SIZE,
+    BlockStreamMap,
     StreamMap,
 )
 
@@ -132,6 +138,28 @@ def test_synthetic_block_boundaries(
     assert stream.get("zzzzzz") is None
     assert stream.get("word000000extra") is None
 
+    misses = ["", "aaaaaa", "zzzzzz", "word000000extra", "word"]
+    batch = [*decoded][::-1] + misses + [*decoded][:3]
+    assert stream.get_many(batch) == [decoded.get(key) for key in batch]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_prefixes_of(reverse: bool, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reverse-coded, the prefixes of a word sort apart, in other blocks."""
+    reference = {f"z{i:06d}".encode(): b"filler" for i in range(2 * _BLOCK_SIZE)} | {
+        b"a": b"a",
+        b"ab": b"a",
+        b"abc": b"a",
+        b"abd": b"a",
+    }
+    stream = _streammap_from_bytes(
+        frontcode.encode(reference, reverse), tmp_path, monkeypatch
+    )
+    assert stream.prefixes_of("abcd") == ["a", "ab", "abc"]
+    assert stream.prefixes_of("abd") == ["a", "ab", "abd"]
+    assert stream.prefixes_of("b") == []
+    assert stream.prefixes_of("") == []
+
 
 def test_truncated_stream_raises(tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
     reference = {
@@ -166,3 +194,153 @@ def test_synthetic_literal_value(tmp_path, monkeypatch: pytest.MonkeyPatch) -> N
     assert len(stream) == 1
     assert list(stream) == [key]
     assert stream.get(key) == "lemma"
+
+
+def test_disk_cached_index_is_reused(tmp_path) -> None:
+    cache_dir = tmp_path / "cache"
+    first = StreamDictionaryFactory(use_disk_cache=True, disk_cache_dir=str(cache_dir))
+    assert first.get_dictionary("en").get("balconies") == "balcony"
+    assert sorted(cache_dir.iterdir()) == [cache_dir / "en.idx"]
+
+    second = StreamDictionaryFactory(use_disk_cache=True, disk_cache_dir=str(cache_dir))
+    with patch.object(
+        stream_dictionary_factory,
+        "_build_index",
+        wraps=stream_dictionary_factory._build_index,
+    ) as build_mock:
+        dictionary = second.get_dictionary("en")
+    build_mock.assert_not_called()
+    reference = _reference("en")
+    for key in list(reference)[::100]:
+        assert dictionary.get(key) == reference[key]
+
+
+def test_disk_cache_disabled_by_default(tmp_path) -> None:
+    StreamDictionaryFactory(disk_cache_dir=str(tmp_path)).get_dictionary("en")
+    assert sorted(tmp_path.iterdir()) == []
+
+
+def test_disk_cache_rejects_bad_language_codes(tmp_path) -> None:
+    dictionaries = StreamDictionaryFactory(
+        use_disk_cache=True, disk_cache_dir=str(tmp_path)
+    )
+    with pytest.raises(ValueError, match="Unsupported language"):
+        dictionaries.get_dictionary("../en")
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda blob: b"garbage",
+        lambda blob: blob[:-1],
+        lambda blob: blob + b"\x00",
+        lambda blob: blob.replace(b"SMIX1", b"SMIX9", 1),
+    ],
+)
+def test_corrupt_index_is_regenerated(corrupt, tmp_path) -> None:
+    path = tmp_path / "en.idx"
+    StreamMap("en", path)
+    path.write_bytes(corrupt(path.read_bytes()))
+
+    stream = StreamMap("en", path)
+    assert stream.get("balconies") == "balcony"
+    data = dictionary_factory._read_decompressed("en")
+    # regenerated in place, valid again
+    assert stream_dictionary_factory.load_index(path.read_bytes(), data)
+
+
+def test_index_rejects_other_stream() -> None:
+    data = dictionary_factory._read_decompressed("en")
+    _, count, pos = frontcode.read_header(data)
+    blob = stream_dictionary_factory.dump_index(
+        data, stream_dictionary_factory._build_index(data, pos, count)
+    )
+    assert stream_dictionary_factory.load_index(blob, data)[0]
+    with pytest.raises(ValueError, match="does not match"):
+        stream_dictionary_factory.load_index(
+            blob, data[:-1] + bytes([~data[-1] & 0xFF])
+        )
+
+
+@pytest.mark.parametrize("codec", ["lzma", "zlib"])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_block_container_is_served_per_block(
+    codec: str, reverse: bool, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reference = {f"word{i:06d}".encode(): f"lemma{i:06d}".encode() for i in range(100)}
+    (tmp_path / "tst.plzma").write_bytes(
+        frontcode.encode_blocks(reference, reverse, codec, block_records=16)
+    )
+    monkeypatch.setattr(dictionary_factory, "DATA_FOLDER", tmp_path)
+    monkeypatch.setattr(dictionary_factory, "SUPPORTED_LANGUAGES", frozenset({"tst"}))
+
+    stream = StreamDictionaryFactory().get_dictionary("tst")
+    assert isinstance(stream, BlockStreamMap)
+    decoded = {k.decode(): v.decode() for k, v in reference.items()}
+    assert len(stream) == 100
+    assert set(stream) == set(decoded)
+    for key, value in decoded.items():
+        assert stream.get(key) == value
+    for absent in ("aaaaaa", "zzzzzz", "word000000extra"):
+        assert stream.get(absent) is None
+    # the other readers splice the blocks back into a plain stream
+    assert dict(DefaultDictionaryFactory().get_dictionary("tst")) == decoded
+    assert dict(StreamMap("tst")) == decoded
+    # the block budget set on the factory applies to containers too
+    assert stream._cache._max_bytes > 0
+    unbudgeted = StreamDictionaryFactory(block_cache_bytes=0).get_dictionary("tst")
+    assert unbudgeted.get("word000042") == "lemma000042"
+    assert not unbudgeted._cache._blocks  # type: ignore[attr-defined]
+
+
+def test_block_stream_map_bounds_decoded_blocks() -> None:
+    reference = {f"w{i:04d}".encode(): b"x" for i in range(64)}
+    stream = BlockStreamMap(frontcode.encode_blocks(reference, block_records=4))
+    assert stream.get("w0000") == "x"
+    stream._cache._max_bytes = 3 * stream._cache._blocks[0][2]
+    for key in reference:
+        assert stream.get(key.decode()) == "x"
+    assert len(stream._cache._blocks) == 3
+    list(stream)  # a full sweep bypasses the decoded-block cache
+    assert list(stream._cache._blocks) == [13, 14, 15]
+    assert stream._cache.nbytes() == 3 * stream._cache._blocks[13][2]
+
+    stream = BlockStreamMap(frontcode.encode_blocks(reference, block_records=4), 0)
+    assert stream.get("w0000") == "x"
+    assert not stream._cache._blocks
+
+
+def test_stream_map_caches_hot_blocks_within_budget(
+    tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reference = {f"w{i:04d}".encode(): f"l{i % 5}".encode() for i in range(640)}
+    stream = _streammap_from_bytes(frontcode.encode(reference), tmp_path, monkeypatch)
+    stream._cache._max_bytes = 1 << 20
+    assert stream.get("w0000") == "l0"
+    assert not stream._cache._blocks  # a single miss keeps the plain scan
+    assert stream.get("w0001") == "l1"
+    assert list(stream._cache._blocks) == [0]
+
+    stream._cache._max_bytes = 3 * stream._cache._blocks[0][2]
+    for _ in range(2):
+        for key, value in reference.items():
+            assert stream.get(key.decode()) == value.decode()
+    assert len(stream._cache._blocks) == 3
+    assert stream._cache.nbytes() <= stream._cache._max_bytes
+    assert stream.nbytes() >= len(stream._data) + stream._cache.nbytes()
+    for absent in ("w0000x", "w9999", "a"):
+        assert stream.get(absent) is None
+
+
+def test_stream_map_block_cache_is_opt_in() -> None:
+    reference = _reference("en")
+    keys = [key for key in list(reference)[::100] for _ in range(2)]
+    for block_cache_bytes in (None, 0, 1 << 20):
+        dictionaries = StreamDictionaryFactory(block_cache_bytes=block_cache_bytes)
+        stream = dictionaries.get_dictionary("en")
+        for key in keys:
+            assert stream.get(key) == reference[key]
+        cached = stream._cache._blocks  # type: ignore[attr-defined]
+        assert bool(cached) == bool(block_cache_bytes)
+    with pytest.raises(ValueError, match="block_cache_bytes"):
+        StreamDictionaryFactory(block_cache_bytes=-1)
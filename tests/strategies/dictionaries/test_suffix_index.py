@@ -0,0 +1,71 @@
+import pytest
+
+try:
+    import marisa_trie  # noqa: F401
+
+    HAS_MARISA = True
+except ImportError:
+    HAS_MARISA = False
+
+from simplemma.strategies import (
+    AffixDecompositionStrategy,
+    DefaultStrategy,
+    DictionaryLookupStrategy,
+)
+from simplemma.strategies.dictionaries.suffix_index import SuffixIndex
+from tests.conftest import FixedMapping
+
+if not HAS_MARISA:
+    pytest.skip("skipping marisa-trie tests", allow_module_level=True)
+
+
+def test_import_error_without_deps(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        "simplemma.strategies.dictionaries.suffix_index._TRIE_DEPS_AVAILABLE",
+        False,
+    )
+    with pytest.raises(ImportError, match="marisa_trie"):
+        SuffixIndex()
+    with pytest.raises(ImportError, match="marisa_trie"):
+        DefaultStrategy(suffix_index=True)
+
+
+def test_suffix_lengths() -> None:
+    mapping = {"Talo": "talo", "lo": "lo", "Straße": "Straße", "l'eau": "eau"}
+    index = SuffixIndex(FixedMapping(mapping))
+    assert index.suffix_lengths("kesätalo", "fi") == {2, 4}
+    assert index.suffix_lengths("KESÄTALO", "fi") == {2, 4}
+    assert index.suffix_lengths("zzz", "fi") == set()
+    # folding changes lengths: ß -> ss, and apostrophe glyphs fold together
+    assert index.suffix_lengths("Hauptstraße", "de") == {6}
+    assert index.suffix_lengths("HAUPTSTRASSE", "de") == {7}
+    assert index.suffix_lengths("dʼl’eau", "fr") == {5}
+
+
+def test_canonicalized_languages_are_not_indexed() -> None:
+    lookup = DictionaryLookupStrategy(suffix_index=True)
+    assert lookup.suffix_lengths("λόγος", "grc") is None
+    assert DictionaryLookupStrategy().suffix_lengths("talossa", "fi") is None
+
+
+@pytest.mark.parametrize("lang", ["fi", "hu", "el", "hy", "de"])
+def test_suffix_decomposition_parity(lang: str) -> None:
+    """Restricting the tails to the index walk changes no result."""
+    plain = AffixDecompositionStrategy(False, DictionaryLookupStrategy())
+    indexed = AffixDecompositionStrategy(
+        False, DictionaryLookupStrategy(suffix_index=True)
+    )
+    keys = [
+        key
+        for key in DictionaryLookupStrategy()._dictionary_factory.get_dictionary(lang)
+        if len(key) > 5
+    ][::3000]
+    for first, second in zip(keys, reversed(keys)):
+        for token in (
+            "qz" + first + second,
+            first.upper() + "ΣΣ" + second,
+            "Iı’" + first + "՞" + second.capitalize(),
+        ):
+            assert indexed._suffix_decomposition(
+                token, lang, 4
+            ) == plain._suffix_decomposition(token, lang, 4)
@@ -12,6 +12,11 @@ try:
 except ImportError:
     HAS_MARISA = False
 
+from simplemma.strategies.dictionaries import (
+    dictionary_factory,
+    frontcode,
+    trie_dictionary_factory,
+)
 from simplemma.strategies.dictionaries.trie_dictionary_factory import TrieWrapDict
 from simplemma.strategies import TrieDictionaryFactory
 
@@ -257,6 +262,88 @@ def test_disk_cache_creates_nested_dir() -> None:
         assert (nested / "en.dic").exists()
 
 
+@pytest.mark.parametrize("reverse", [False, True])
+def test_streamed_trie_matches_the_stream(
+    reverse: bool, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Reverse-coded streams have their keys and values un-reversed."""
+    reference = {f"word{i:04d}".encode(): f"lemma{i % 7}".encode() for i in range(100)}
+    (tmp_path / "tst.plzma").write_bytes(frontcode.encode(reference, reverse))
+    monkeypatch.setattr(dictionary_factory, "DATA_FOLDER", tmp_path)
+    monkeypatch.setattr(dictionary_factory, "SUPPORTED_LANGUAGES", frozenset({"tst"}))
+    dictionary = TrieWrapDict(trie_dictionary_factory._build_trie_from_stream("tst"))
+    assert dict(dictionary) == {
+        key.decode(): value.decode() for key, value in reference.items()
+    }
+
+
+def test_build_disk_cache(tmp_path: Path) -> None:
+    dictionaries = TrieDictionaryFactory(disk_cache_dir=str(tmp_path))
+    dictionaries.build_disk_cache(["en", "fr", "en"], processes=2)
+    assert sorted(tmp_path.iterdir()) == [tmp_path / "en.dic", tmp_path / "fr.dic"]
+
+    with patch.object(
+        TrieDictionaryFactory, "_build_trie", wraps=dictionaries._build_trie
+    ) as create_trie_mock:
+        assert dictionaries.get_dictionary("fr").get("chevaux") == "cheval"
+        # cached languages are skipped, sequential path for a single one
+        dictionaries.build_disk_cache(["en", "fr", "de"], processes=2)
+    create_trie_mock.assert_not_called()
+    assert (tmp_path / "de.dic").exists()
+
+
+def test_build_disk_cache_errors(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="use_disk_cache"):
+        TrieDictionaryFactory(use_disk_cache=False).build_disk_cache(["en"])
+    dictionaries = TrieDictionaryFactory(disk_cache_dir=str(tmp_path))
+    with pytest.raises(ValueError, match="Unsupported language"):
+        dictionaries.build_disk_cache(["en", "../en"])
+    assert sorted(tmp_path.iterdir()) == []
+
+
+def test_mmap_disk_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    with pytest.raises(ValueError, match="use_disk_cache"):
+        TrieDictionaryFactory(use_disk_cache=False, use_mmap=True)
+
+    mapped = []
+    serialized = []
+
+    class SpyTrie(BytesTrie):  # type: ignore[misc]
+        def mmap(self, path: str) -> BytesTrie:
+            mapped.append(path)
+            return super().mmap(path)
+
+        def tobytes(self) -> bytes:
+            serialized.append(self)
+            return bytes(super().tobytes())
+
+    monkeypatch.setattr(trie_dictionary_factory, "BytesTrie", SpyTrie)
+    dictionaries = TrieDictionaryFactory(disk_cache_dir=str(tmp_path), use_mmap=True)
+    # first use: built, written, then served from the mapping
+    assert dictionaries.get_dictionary("en").get("balconies") == "balcony"
+    assert mapped == [str(tmp_path / "en.dic")]
+    dictionaries._get_dictionary.cache_clear()
+    assert dictionaries.get_dictionary("en").get("balconies") == "balcony"
+    assert len(mapped) == 2
+    assert sorted(tmp_path.iterdir()) == [tmp_path / "en.dic"]
+    # sized from the file, without copying the mapping onto the heap
+    dictionary = dictionaries.get_dictionary("en")
+    assert dictionary.nbytes() == (tmp_path / "en.dic").stat().st_size  # type: ignore[attr-defined]
+    assert serialized == []
+    loaded = BytesTrie().load(str(tmp_path / "en.dic"))
+    assert TrieWrapDict(loaded).nbytes() == dictionary.nbytes()  # type: ignore[attr-defined]
+
+
+def test_mmap_corrupted_disk_cache(tmp_path: Path) -> None:
+    (tmp_path / "en.dic").write_bytes(b"corrupted trie dictionary")
+    dictionaries = TrieDictionaryFactory(disk_cache_dir=str(tmp_path), use_mmap=True)
+    with patch.object(
+        TrieDictionaryFactory, "_build_trie", wraps=dictionaries._build_trie
+    ) as create_trie_mock:
+        assert dictionaries.get_dictionary("en").get("balconies") == "balcony"
+    create_trie_mock.assert_called_once_with("en")
+
+
 def test_dictionary_working_as_a_dict() -> None:
     dictionaries = TrieDictionaryFactory(use_disk_cache=False)
     dictionary = dictionaries.get_dictionary("en")
@@ -8,6 +8,8 @@ from simplemma.strategies import (
     DictionaryLookupStrategy,
     GreedyDictionaryLookupStrategy,
     HyphenRemovalStrategy,
+    MembershipFilterFactory,
+    MembershipLookupStrategy,
     MorphemeDecompositionStrategy,
     PrefixDecompositionStrategy,
 )
@@ -428,3 +430,111 @@ def test_dictionary_lookup_apostrophe_variant_recased() -> None:
     mapping = {"L'eau": "eau"}  # straight apostrophe, capitalized
     lookup = DictionaryLookupStrategy(dictionary_factory=FixedMapping(mapping))
     assert lookup.get_lemma("l’eau", "xx") == "eau"  # curly, lowercase
+
+
+@pytest.mark.parametrize(
+    "lang,tokens",
+    [
+        ("en", ["Ignorant", "IGNORANT", "dog’s", "Isn’t", "zzqx’s", "zzqx"]),
+        ("fr", ["L’Homme", "aujourdʼhui", "Aujourd'hui", "qu’il", "l’zzqx"]),
+        ("tr", ["Iğdır", "ıspanak", "Istanbul'da", "zzqx'ın"]),
+        ("hy", ["Մի՞թե", "ինչո՞ւ", "Զզք՞"]),
+    ],
+)
+def test_dictionary_lookup_folded_index(lang: str, tokens: list[str]) -> None:
+    """The folded index only skips probes that would miss: same results."""
+    plain = DictionaryLookupStrategy()
+    indexed = DictionaryLookupStrategy(folded_index=True)
+    for token in tokens:
+        assert indexed.get_lemma(token, lang) == plain.get_lemma(token, lang)
+
+    mapping = {"L'eau": "eau"}
+    indexed = DictionaryLookupStrategy(FixedMapping(mapping), folded_index=True)
+    assert indexed.get_lemma("l’eau", "xx") == "eau"
+    assert indexed.get_lemma("l’air", "xx") is None
+    assert DefaultStrategy(folded_index=True).get_lemma("L’Homme", "fr") == (
+        DefaultStrategy().get_lemma("L’Homme", "fr")
+    )
+
+
+def test_dictionary_lookup_folded_index_skips_case_variants() -> None:
+    probed: list[str] = []
+
+    class _Probed(dict[str, str]):
+        def get(self, key, default=None):
+            probed.append(key)
+            return super().get(key, default)
+
+    indexed = DictionaryLookupStrategy(
+        FixedMapping(_Probed(dog="dog")), folded_index=True
+    )
+    assert indexed.get_lemma("Dog", "xx") == "dog"
+    probed.clear()
+    misses = [f"Cat{i}" for i in range(100)]
+    assert all(indexed.get_lemma(token, "xx") is None for token in misses)
+    # the typed form only, bar filter false positives
+    assert len(probed) < 110
+
+
+def test_membership_lookup() -> None:
+    strategy = MembershipLookupStrategy(MembershipFilterFactory(use_disk_cache=False))
+    # known forms come back unchanged, variants included
+    assert strategy.get_lemma("balconies", "en") == "balconies"
+    assert strategy.get_lemma("Balconies", "en") == "Balconies"
+    assert strategy.get_lemma("виб’єш", "uk") == "виб’єш"
+    assert strategy.get_lemma("δὲ", "grc") == "δὲ"  # canonicalized
+    assert strategy.get_lemma("zzzzzqqqqqxxxxx", "en") is None
+    lookup = DictionaryLookupStrategy()
+    for token in ("Haus", "Häuser", "l’Homme", "aujourdʼhui", "ﬁn"):
+        if lookup.get_lemma(token, "fr") is not None:
+            assert strategy.get_lemma(token, "fr") == token
+
+
+def test_prefix_lengths() -> None:
+    lookup = DictionaryLookupStrategy(FixedMapping({"talo": "talo"}), prefix_walk=True)
+    # plain mappings have no prefix query: every prefix must be probed
+    assert lookup.prefix_lengths("talossani", "fi") is None
+    # opt-in: the default path probes every prefix as before
+    assert DictionaryLookupStrategy().prefix_lengths("talossanikin", "fi") is None
+
+    lookup = DictionaryLookupStrategy(prefix_walk=True)
+    lengths = lookup.prefix_lengths("talossanikin", "fi")
+    assert lengths is not None
+    assert {4, 7} <= lengths  # talo, talossa
+    for length in range(1, len("talossanikin") + 1):
+        if lookup.get_lemma("talossanikin"[:length], "fi") is not None:
+            assert length in lengths
+    # reverse case: "Talo..." probes "talo"
+    assert 4 in (lookup.prefix_lengths("Talossanikin", "fi") or set())
+    # variants that are not prefixes of the token's variants
+    assert lookup.prefix_lengths("ΟΔΟΣΣ", "el") is None  # final sigma
+    assert lookup.prefix_lengths("İstanbul", "tr") is None  # İ lowers to 2 chars
+    assert lookup.prefix_lengths("talo’ssa", "fi") is None
+    assert lookup.prefix_lengths("δὲ", "grc") is None
+
+
+@pytest.mark.parametrize("lang", ["fi", "hu", "tr", "el", "ru"])
+def test_affix_decomposition_prefix_walk_parity(lang: str) -> None:
+    """Restricting the prefixes to the dictionary's walk changes no result."""
+
+    class _NoPrefixes(DictionaryLookupStrategy):
+        def prefix_lengths(self, token: str, lang: str) -> set[int] | None:
+            return None
+
+    walked = AffixDecompositionStrategy(
+        False, DictionaryLookupStrategy(prefix_walk=True)
+    )
+    probed = AffixDecompositionStrategy(False, _NoPrefixes())
+    keys = [
+        key
+        for key in DictionaryLookupStrategy()._dictionary_factory.get_dictionary(lang)
+        if len(key) > 5
+    ][::2000]
+    for key in keys:
+        for token in (
+            key + "ssa",
+            key.upper() + "LLA",
+            "qz" + key + key,
+            key.capitalize() + "nak",
+        ):
+            assert walked.get_lemma(token, lang) == probed.get_lemma(token, lang)
@@ -0,0 +1,66 @@
+import logging
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from simplemma import cache
+from simplemma.strategies import StreamDictionaryFactory, TrieDictionaryFactory
+from simplemma.strategies.dictionaries.dictionary_factory import _worker_pool
+
+
+@pytest.mark.parametrize(
+    "factory, files",
+    [
+        ("decoded", {"en", "fr"}),
+        ("mmap", {"en.smh", "fr.smh"}),
+        ("stream-index", {"en.idx", "fr.idx"}),
+    ],
+)
+def test_warm(factory: str, files: set[str], tmp_path: Path) -> None:
+    cache.main(
+        ["warm", "--factory", factory, "--langs", "en", "fr", "en"]
+        + ["--processes", "2", "--cache-dir", str(tmp_path)]
+    )
+    # the decoded cache names carry the interpreter tag
+    assert {path.name.split(".cpython")[0] for path in tmp_path.iterdir()} == files
+
+
+def test_warmed_cache_is_used(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    with caplog.at_level(logging.INFO):
+        cache.warm("stream-index", ["en"], cache_dir=str(tmp_path))
+    assert "stream-index cache ready for en" in caplog.text
+    before = (tmp_path / "en.idx").stat().st_mtime_ns
+    # idempotent: a second run validates the file instead of rewriting it
+    cache.warm("stream-index", ["en"], cache_dir=str(tmp_path))
+    assert (tmp_path / "en.idx").stat().st_mtime_ns == before
+    mapping = StreamDictionaryFactory(
+        use_disk_cache=True, disk_cache_dir=str(tmp_path)
+    ).get_dictionary("en")
+    assert mapping.get("balconies") == "balcony"
+
+
+def test_warm_errors(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(ValueError, match="Unknown dictionary factory"):
+        cache.warm("pickle", ["en"])
+    with pytest.raises(SystemExit):
+        cache.main(["warm", "--factory", "trie", "--langs", "en", "../en"])
+    assert "Unsupported language: ../en" in capsys.readouterr().err
+    with pytest.raises(SystemExit):
+        cache.main(["warm", "--factory", "pickle"])
+    assert sorted(tmp_path.iterdir()) == []
+
+
+def test_warm_trie_uses_the_trie_builder(tmp_path: Path) -> None:
+    pytest.importorskip("marisa_trie")
+    with patch.object(TrieDictionaryFactory, "build_disk_cache") as build_mock:
+        cache.warm("trie", ["en", "fr", "en"], processes=2, cache_dir=str(tmp_path))
+    build_mock.assert_called_once_with(["en", "fr"], 2)
+
+
+def test_workers_skip_preload(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("SIMPLEMMA_PRELOAD", "en")
+    with _worker_pool(1) as executor:
+        assert executor.submit(os.getenv, "SIMPLEMMA_PRELOAD").result() is None
+    assert os.environ["SIMPLEMMA_PRELOAD"] == "en"
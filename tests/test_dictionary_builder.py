@@ -7,7 +7,7 @@ from simplemma import Lemmatizer
 from simplemma.strategies import DefaultStrategy, DictionaryFactory
 from simplemma.strategies.dictionaries import dictionary_factory, frontcode
 from simplemma.strategies.dictionaries.dictionary_factory import MappingStrToByteString
-from training import dictionary_builder
+from training import dictionary_builder, verify_idempotence
 
 TEST_DIR = Path(__file__).parent
 
@@ -71,6 +71,32 @@ def test_logic(tmp_path, monkeypatch) -> None:
     dictionary_builder._build_dictionary("zz", listpath, in_place=True)
     assert (tmp_path / "zz.plzma").exists()
 
+    # SMFC2 block container: same content, random access per block
+    blocks_outputfile = tmp_path / "zz-blocks.smfc"
+    dictionary_builder._build_dictionary(
+        "zz", listpath, str(blocks_outputfile), block_codec="zlib"
+    )
+    blob = blocks_outputfile.read_bytes()
+    assert frontcode.is_block_container(blob)
+    assert frontcode.decode(blob) == roundtripped
+
+
+def test_block_container_install(tmp_path, monkeypatch) -> None:
+    """Containers ship as .smfc, replacing the .plzma stream, and both formats
+    pass the idempotence lint."""
+    _make_shipped(tmp_path, monkeypatch, "Hund\tHunde\nKatze\tKatzen\n")
+    expected = dict(dictionary_factory._load_dictionary_from_disk("zz"))
+    assert verify_idempotence.drifted_languages(["zz"]) == []
+
+    dictionary_builder._build_dictionary("zz", in_place=True, block_codec="lzma")
+    assert sorted(path.name for path in tmp_path.glob("zz.*")) == ["zz.smfc", "zz.txt"]
+    assert dictionary_factory._ships_block_container("zz")
+    assert dictionary_factory._load_dictionary_from_disk("zz") == expected
+    assert verify_idempotence.drifted_languages(["zz"]) == []
+
+    dictionary_builder._build_dictionary("zz", in_place=True)
+    assert sorted(path.name for path in tmp_path.glob("zz.*")) == ["zz.plzma", "zz.txt"]
+
 
 def test_read_dict_filtering(tmp_path) -> None:
     """Valid pair + identity, punctuation drop (either field), length-difference
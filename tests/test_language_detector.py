@@ -1,9 +1,16 @@
 """Tests for Simplemma's language detection utilities."""
 
+from functools import lru_cache
+
 import pytest
 
 from simplemma import LanguageDetector, in_target_language, langdetect
-from simplemma.strategies import DefaultStrategy
+from simplemma.strategies import (
+    DefaultStrategy,
+    MembershipFilterFactory,
+    MembershipLookupStrategy,
+)
+from simplemma.strategies.dictionaries import load_membership_index
 from simplemma.utils import normalize_token
 
 from .conftest import CustomTokenSampler
@@ -68,6 +75,51 @@ def test_target_agrees_with_each_language() -> None:
         )
 
 
+_membership_index = lru_cache(maxsize=None)(
+    lambda: load_membership_index((*_LANGS, "grc"), use_disk_cache=False)
+)
+
+
+def test_membership_index_detection() -> None:
+    index = _membership_index()
+    detector = LanguageDetector(lang=_LANGS, membership_index=index)
+    assert detector.proportion_in_each_language("") == {"unk": 1}
+    assert detector.proportion_in_target_languages("") == 0
+    # dictionary forms and their reverse case count, like the lookups do
+    assert LanguageDetector(
+        lang=_LANGS, token_sampler=CustomTokenSampler(0), membership_index=index
+    ).proportion_in_each_language("Häuser Dogs balconies zzzzzq") == {
+        "de": 0.25,
+        "en": 0.5,
+        "cs": 0.0,
+        "sk": 0.0,
+        "unk": 0.25,
+    }
+    assert detector.proportion_in_target_languages("the quick zzzzzq") == 2 / 3
+    for text in _TEXTS:
+        each = detector.proportion_in_each_language(text)
+        assert detector.proportion_in_target_languages(text) == pytest.approx(
+            1 - each["unk"]
+        )
+    assert detector.main_language(_TEXTS[0]) == "en"
+    assert detector.main_language(_TEXTS[1]) == "de"
+
+    # grc keys are stored canonicalized (acute accents): grave forms still count
+    grc = LanguageDetector("grc", CustomTokenSampler(0), membership_index=index)
+    assert grc.proportion_in_target_languages("καὶ θεὸς") == 1.0
+
+    with pytest.raises(ValueError, match="not in membership index"):
+        LanguageDetector(lang=("en", "fr"), membership_index=index)
+
+
+def test_membership_filter_detection() -> None:
+    strategy = MembershipLookupStrategy(MembershipFilterFactory(use_disk_cache=False))
+    detector = LanguageDetector(lang=("de", "en"), lemmatization_strategy=strategy)
+    assert detector.main_language("Dieser Satz ist auf Deutsch.") == "de"
+    assert detector.main_language(_TEXTS[0]) == "en"
+    assert detector.proportion_in_each_language(" aa ") == {"unk": 1}
+
+
 def test_proportion_in_each_language() -> None:
     # sanity checks
     assert LanguageDetector(
@@ -10,6 +10,8 @@ from simplemma.strategies import (
     DefaultStrategy,
     DictionaryFactory,
     LemmatizationStrategy,
+    MembershipFilterFactory,
+    MembershipLookupStrategy,
     RaiseErrorFallbackStrategy,
 )
 
@@ -333,6 +335,15 @@ def test_is_known() -> None:
     assert is_known("espejos", lang=("de", "es"))
 
 
+def test_is_known_with_membership_filters() -> None:
+    strategy = MembershipLookupStrategy(MembershipFilterFactory(use_disk_cache=False))
+    for token, lang in (("FanCY", "en"), ("Fancy-String", "en"), ("espejos", "es")):
+        assert is_known(token, lang, lookup_strategy=strategy) == is_known(token, lang)
+    assert is_known("espejos", ("de", "es"), lookup_strategy=strategy)
+    with pytest.raises(ValueError, match="low_memory"):
+        is_known("dog", "en", low_memory=True, lookup_strategy=strategy)
+
+
 # (lang, greedy, text, expected lemmas) -- full-text lemmatization through
 # the tokenizer + pipeline; API parity (get_lemmas_in_text / lemma_iterator /
 # text_lemmatizer) is covered once in test_text_api_parity, not per case.
@@ -10,6 +10,7 @@ from simplemma.utils import (
     canonicalize_token,
     has_apostrophe,
     levenshtein_dist,
+    lookup_fold,
     normalize_apostrophes,
     normalize_token,
     strip_diacritics,
@@ -76,6 +77,17 @@ def test_apostrophe_helpers() -> None:
     assert apostrophe_variants("l’a") == ("l’a", "l'a", "lʼa")  # typed form first
 
 
+@pytest.mark.parametrize(
+    "token", ["L’Homme", "ıspanak", "İstanbul", "Մի՞թե", "STRAẞE", "ǅemal"]
+)
+def test_lookup_fold_covers_probe_variants(token: str) -> None:
+    """Every form DictionaryLookupStrategy probes folds like the token."""
+    folded = lookup_fold(token)
+    for variant in (*apostrophe_variants(token), token.replace("՞", "")):
+        for cased in (variant, variant.lower(), variant.capitalize()):
+            assert lookup_fold(cased) == folded
+
+
 def test_validate_lang_input() -> None:
     assert validate_lang_input("en") == ("en",)
     assert validate_lang_input(("de", "en")) == ("de", "en")
@@ -848,7 +848,12 @@ def _build_dictionary(
     listpath: str | None = None,
     filepath: str | None = None,
     in_place: bool = False,
+    block_codec: str | None = None,
 ) -> None:
+    """Compose and write `langcode`'s dictionary: an lzma-compressed SMFC1
+    stream (`.plzma`) by default, or with `block_codec` ("lzma"/"zlib") an
+    SMFC2 block container (`.smfc`: random access per block, at a larger file
+    size)."""
     mydict = _compose_dictionary(langcode, listpath)
     if filepath is None:
         # in_place overwrites the shipped data the runtime loads (read at call
@@ -858,12 +863,23 @@ def _build_dictionary(
         else:
             directory = Path(__file__).parent / "output"
             directory.mkdir(parents=True, exist_ok=True)
-        filepath = str(directory / f"{langcode}.plzma")
+        suffix, stale_suffix = (
+            (dictionary_factory.STREAM_SUFFIX, dictionary_factory.CONTAINER_SUFFIX)
+            if block_codec is None
+            else (dictionary_factory.CONTAINER_SUFFIX, dictionary_factory.STREAM_SUFFIX)
+        )
+        filepath = str(directory / f"{langcode}{suffix}")
+        # the loader prefers a container: never leave both formats side by side
+        (directory / f"{langcode}{stale_suffix}").unlink(missing_ok=True)
     _report_tokenizer_reachability(mydict, langcode)
     # str->bytes only at the edge: frontcode is the runtime (bytes) boundary.
     encoded = {k.encode(): v.encode() for k, v in mydict.items()}
     reverse_key = langcode in FRONTCODE_REVERSE_KEY_LANGS
-    Path(filepath).write_bytes(frontcode.encode(encoded, reverse_key=reverse_key))
+    if block_codec is None:
+        blob = frontcode.encode(encoded, reverse_key=reverse_key)
+    else:
+        blob = frontcode.encode_blocks(encoded, reverse_key, block_codec)
+    Path(filepath).write_bytes(blob)
     LOGGER.debug("%s %s", langcode, len(mydict))
 
 
@@ -876,8 +892,16 @@ if __name__ == "__main__":
         "overwriting shipped dictionaries. Without this flag, output goes "
         "to training/output/ instead.",
     )
+    parser.add_argument(
+        "--block-codec",
+        choices=("lzma", "zlib"),
+        help="Write SMFC2 block containers compressed per block with this "
+        "codec instead of whole-file lzma SMFC1 streams.",
+    )
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO)
     for listcode in sorted(SUPPORTED_LANGUAGES):
-        _build_dictionary(listcode, in_place=args.in_place)
+        _build_dictionary(
+            listcode, in_place=args.in_place, block_codec=args.block_codec
+        )
@@ -1,6 +1,8 @@
 """Byte-idempotence lint: every shipped dictionary must recompose
 byte-identically from its own data (`_compose_dictionary` over the installed
-plzma, re-encoded). Zero drift is the invariant since the 2026-08 consistency
+dictionary, re-encoded). SMFC2 block containers are compared as the SMFC1
+stream they splice back into (`container_to_stream`), independently of their
+block codec. Zero drift is the invariant since the 2026-08 consistency
 pass; ANY difference means a pipeline change silently rewrites shipped data
 and must be diagnosed, gated and reshipped deliberately.
 
@@ -10,8 +12,8 @@ Exits 1 listing the drifted languages (full run ~15 min).
 
 import argparse
 import logging
+import lzma
 import sys
-from pathlib import Path
 
 from simplemma.strategies.dictionaries import dictionary_factory, frontcode
 from training.dictionary_builder import (
@@ -23,7 +25,7 @@ log = logging.getLogger(__name__)
 
 
 def drifted_languages(langs: list[str]) -> list[str]:
-    """Languages whose recompose is not byte-identical to the shipped plzma."""
+    """Languages whose recompose is not byte-identical to the shipped data."""
     drifted = []
     for lang in langs:
         mydict = _compose_dictionary(lang)
@@ -31,7 +33,10 @@ def drifted_languages(langs: list[str]) -> list[str]:
         recomposed = frontcode.encode(
             encoded, reverse_key=lang in FRONTCODE_REVERSE_KEY_LANGS
         )
-        shipped = (Path(dictionary_factory.DATA_FOLDER) / f"{lang}.plzma").read_bytes()
+        shipped = dictionary_factory._read_shipped(lang)
+        if frontcode.is_block_container(shipped):
+            shipped = frontcode.container_to_stream(shipped)
+            recomposed = lzma.decompress(recomposed)
         status = "ok" if recomposed == shipped else "DRIFT"
         log.info("%s: %s (%d entries)", lang, status, len(mydict))
         if recomposed != shipped: